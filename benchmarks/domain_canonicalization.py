@@ -0,0 +1,74 @@
+"""
+Measures the per call cost of tools.subdomains with the implementation that checked every suffix with tld.is_tld and
+with the DomainCanonicalizer, for the email domains of a synthetic set of profiles where most domains repeat, as they
+do when the conflicts of the authors of many papers are computed.
+
+Usage:
+
+    python benchmarks/domain_canonicalization.py --domains 200000
+"""
+import argparse
+import random
+import time
+
+import tld
+
+from openreview import tools
+
+
+def legacy_subdomains(domain):
+    duplicate_domains = tools.load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    valid_domains = set()
+    for d in domains:
+        if not tld.is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+    return sorted(valid_domains)
+
+
+def build_domains(count):
+    random.seed(count)
+    aliases = list(tools.load_duplicate_domains().keys())
+    institutions = ['cs.university{}.edu'.format(i) for i in range(2000)] + ['lab{}.institute{}.ac.uk'.format(i % 7, i) for i in range(1000)]
+    common = ['gmail.com', 'qq.com', 'outlook.com', 'hotmail.com', '163.com']
+    domains = []
+    for _ in range(count):
+        pool = random.choice([aliases, institutions, common])
+        domains.append(random.choice(pool))
+    return domains
+
+
+def measure(name, function, domains):
+    start = time.perf_counter()
+    for domain in domains:
+        function(domain)
+    elapsed = time.perf_counter() - start
+    print('{:<40} {:>8.2f} s {:>10.2f} us/call'.format(name, elapsed, elapsed / len(domains) * 1e6))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--domains', type=int, default=200000)
+    args = parser.parse_args()
+
+    domains = build_domains(args.domains)
+    print('{} domains, {} distinct'.format(len(domains), len(set(domains))))
+
+    legacy = measure('tld.is_tld per suffix', legacy_subdomains, domains)
+    canonicalizer = tools.DomainCanonicalizer()
+    cold = measure('DomainCanonicalizer, first pass', canonicalizer.subdomains, domains)
+    warm = measure('DomainCanonicalizer, memoized', canonicalizer.subdomains, domains)
+    start = time.perf_counter()
+    canonicalizer.canonical_subdomains(domains)
+    batch = time.perf_counter() - start
+    print('{:<40} {:>8.2f} s {:>10.2f} us/call'.format('canonical_subdomains, batch', batch, batch / len(domains) * 1e6))
+    print('speedup: {:.1f}x first pass, {:.1f}x memoized'.format(legacy / cold, legacy / warm))
+
+    for domain in set(domains):
+        assert list(canonicalizer.subdomains(domain)) == legacy_subdomains(domain), domain
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures the time and memory needed to turn an API response with 1M edges into Python objects.
+
+Compares the standard library json module with the fast backend used by the clients (orjson or ujson when installed),
+Edge objects with __slots__ against the same objects with a __dict__, raw dicts and an EdgeFrame.
+
+Usage:
+
+    python benchmarks/edge_deserialization.py --edges 1000000 [--memory]
+
+With --memory the peak memory of each step is measured with tracemalloc, which makes every step several times slower.
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from openreview import tools
+from openreview.api import Edge, EdgeFrame
+
+
+class DictEdge(object):
+    """
+    Edge with the attribute dict layout used before Edge defined __slots__
+    """
+    def __init__(self, **kwargs):
+        for attr in Edge.__slots__:
+            setattr(self, attr, kwargs.get(attr))
+
+
+def dict_edge_from_json(e):
+    return DictEdge(**{ attr: e.get(attr) for attr in Edge.__slots__ })
+
+
+def build_response(count):
+    random.seed(count)
+    papers = ['paper{}'.format(i) for i in range(max(1, count // 200))]
+    reviewers = ['~Reviewer_{}1'.format(i) for i in range(max(1, count // 100))]
+    edges = [{
+        'id': '{:016x}'.format(i),
+        'invitation': 'ICML.cc/2025/Conference/Reviewers/-/Affinity_Score',
+        'domain': 'ICML.cc/2025/Conference',
+        'head': random.choice(papers),
+        'tail': random.choice(reviewers),
+        'weight': random.random(),
+        'readers': ['ICML.cc/2025/Conference', 'ICML.cc/2025/Conference/Area_Chairs'],
+        'writers': ['ICML.cc/2025/Conference'],
+        'signatures': ['ICML.cc/2025/Conference'],
+        'nonreaders': [],
+        'cdate': 1700000000000,
+        'tcdate': 1700000000000,
+        'tmdate': 1700000000000
+    } for i in range(count)]
+    return json.dumps({ 'edges': edges }).encode('utf-8')
+
+
+def measure(name, function, memory=False):
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print('{:<40} {:>8.2f} s {:>10.1f} MB peak'.format(name, seconds, peak / 2**20))
+    else:
+        print('{:<40} {:>8.2f} s'.format(name, seconds))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--edges', type=int, default=1000000)
+    parser.add_argument('--memory', action='store_true')
+    args = parser.parse_args()
+
+    body = build_response(args.edges)
+    print('{} edges, {:.1f} MB response, fast json backend: {}'.format(args.edges, len(body) / 2**20, tools.json_loads.__module__))
+
+    measure('decode with json', lambda: json.loads(body), args.memory)
+    decoded = measure('decode with fast backend', lambda: tools.json_loads(body), args.memory)['edges']
+
+    measure('Edge objects with __dict__', lambda: [dict_edge_from_json(e) for e in decoded], args.memory)
+    measure('Edge objects with __slots__', lambda: [Edge.from_json(e) for e in decoded], args.memory)
+    measure('EdgeFrame from raw dicts', lambda: EdgeFrame.from_edges(decoded), args.memory)
+    del decoded
+
+    measure('total: json + Edge with __dict__', lambda: len([dict_edge_from_json(e) for e in json.loads(body)['edges']]), args.memory)
+    measure('total: fast backend + slotted Edge', lambda: len([Edge.from_json(e) for e in tools.json_loads(body)['edges']]), args.memory)
+    measure('total: fast backend + raw dicts', lambda: len(tools.json_loads(body)['edges']), args.memory)
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
 from .openreview import *
 from . import tools
+from . import conflicts
+from . import profile_store
+from . import expertise
 from .conference import *
 from .agora import *
 from .venue_request import *
@@ -1,8 +1,10 @@
 from .client import OpenReviewClient
+from .async_client import AsyncOpenReviewClient
 from .client import Edit
 from .client import Note
 from .client import Invitation
 from .client import Edge
 from .client import Group
 from .client import Tag
+from .edge_frame import EdgeFrame
 from .iThenticate_client import iThenticateClient
@@ -0,0 +1,986 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+import asyncio
+import json
+import os
+import re
+import sys
+import jwt
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .. import tools
+from ..openreview import Profile
+from ..openreview import OpenReviewException
+from .client import Edge, Group, Invitation, Note, Tag, string_types
+
+
+class AsyncOpenReviewClient(object):
+    """
+    asyncio version of :class:`~openreview.api.OpenReviewClient`. All the requests are sent through a single pooled
+    HTTP session, so one process can keep hundreds of requests in flight without spawning a thread for each of them.
+
+    The client must be closed when it is not needed anymore, the easiest way is to use it as an async context manager:
+
+    >>> async with openreview.api.AsyncOpenReviewClient(baseurl='https://api2.openreview.net', username=username, password=password) as client:
+    ...     notes = await asyncio.gather(*[client.get_note(id) for id in note_ids])
+
+    Requires the `aiohttp` package, it can be installed with `pip install openreview-py[async]`.
+
+    :param baseurl: URL to the host, example: https://api2.openreview.net. If none is provided, it defaults to the environment variable `OPENREVIEW_BASEURL`
+    :type baseurl: str, optional
+    :param username: OpenReview username. If none is provided, it defaults to the environment variable `OPENREVIEW_USERNAME`
+    :type username: str, optional
+    :param password: OpenReview password. If none is provided, it defaults to the environment variable `OPENREVIEW_PASSWORD`
+    :type password: str, optional
+    :param token: Session token. This token can be provided instead of the username and password if the user had already logged in
+    :type token: str, optional
+    :param tokenExpiresIn: Time in seconds before the token expires. If none is set the value will be set automatically to one hour. The max value that it can be set to is 1 week.
+    :type tokenExpiresIn: number, optional
+    :param max_connections: Maximum number of connections kept open by the connection pool, requests above this number wait for a free connection
+    :type max_connections: int, optional
+    """
+    retry_total = 3
+    retry_backoff_factor = 1
+    retry_backoff_max = 120
+    retry_status_forcelist = [ 500, 502, 503, 504 ]
+    retry_allowed_methods = [ 'HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE' ]
+
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, max_connections=100):
+        if aiohttp is None:
+            raise OpenReviewException('AsyncOpenReviewClient requires the aiohttp package, install it with: pip install openreview-py[async]')
+
+        self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3001')
+        if 'https://api.openreview.net' in self.baseurl or 'https://devapi.openreview.net' in self.baseurl:
+            correct_baseurl = self.baseurl.replace('api', 'api2')
+            raise OpenReviewException(f'Please use "{correct_baseurl}" as the baseurl for the OpenReview API or use the old client openreview.Client')
+        self.groups_url = self.baseurl + '/groups'
+        self.login_url = self.baseurl + '/login'
+        self.invitations_url = self.baseurl + '/invitations'
+        self.notes_url = self.baseurl + '/notes'
+        self.tags_url = self.baseurl + '/tags'
+        self.bulk_tags_url = self.baseurl + '/tags/bulk'
+        self.edges_url = self.baseurl + '/edges'
+        self.bulk_edges_url = self.baseurl + '/edges/bulk'
+        self.edges_count_url = self.baseurl + '/edges/count'
+        self.profiles_url = self.baseurl + '/profiles'
+        self.profiles_search_url = self.baseurl + '/profiles/search'
+        self.messages_url = self.baseurl + '/messages'
+        self.process_logs_url = self.baseurl + '/logs/process'
+        self.note_edits_url = self.baseurl + '/notes/edits'
+        self.invitation_edits_url = self.baseurl + '/invitations/edits'
+        self.group_edits_url = self.baseurl + '/groups/edits'
+        self.groups_members_cache_url = self.baseurl + '/groups/members/cache'
+        self.user_agent = 'OpenReviewPy/v' + str(sys.version_info[0])
+
+        self.limit = 1000
+        self.max_connections = max_connections
+        self.token = token.replace('Bearer ', '') if token else None
+        self.profile = None
+        self.user = None
+        self.headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'application/json'
+        }
+        self.session = None
+
+        self.__credentials = None
+        self.__login_lock = None
+
+        if self.token:
+            self.headers['Authorization'] = 'Bearer ' + self.token
+            self.user = jwt.decode(self.token, options={"verify_signature": False})
+        else:
+            if not username:
+                username = os.environ.get('OPENREVIEW_USERNAME')
+
+            if not password:
+                password = os.environ.get('OPENREVIEW_PASSWORD')
+
+            if username or password:
+                ## Logging in requires a request, it is done before the first request is sent
+                self.__credentials = { 'id': username, 'password': password, 'expiresIn': tokenExpiresIn }
+
+    async def __aenter__(self):
+        await self.__ensure_login()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the connection pool used by the client
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    ## PRIVATE FUNCTIONS
+
+    def __get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_connections))
+        return self.session
+
+    async def __ensure_login(self):
+        if not self.__credentials:
+            return
+        if self.__login_lock is None:
+            self.__login_lock = asyncio.Lock()
+        async with self.__login_lock:
+            if self.__credentials:
+                credentials = self.__credentials
+                self.__credentials = None
+                await self.login_user(credentials['id'], credentials['password'], expiresIn=credentials['expiresIn'])
+
+    def __handle_token(self, response):
+        self.token = str(response['token'])
+        self.profile = Profile( id = response['user']['profile']['id'] )
+        self.headers['Authorization'] ='Bearer ' + self.token
+        self.user = jwt.decode(self.token, options={"verify_signature": False})
+        return response
+
+    def __format_query(self, params):
+        query = []
+        for key, value in tools.format_params(params).items():
+            if value is None:
+                continue
+            if isinstance(value, list):
+                query.extend([(key, str(v)) for v in value])
+            else:
+                query.append((key, str(value)))
+        return query
+
+    def __get_backoff_time(self, consecutive_errors):
+        ## Same backoff as urllib3 Retry, used by LogRetry in OpenReviewClient
+        if consecutive_errors <= 1:
+            return 0
+        return min(self.retry_backoff_max, self.retry_backoff_factor * (2 ** (consecutive_errors - 1)))
+
+    def __get_retry_after(self, headers):
+        retry_after = headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            return None
+
+    async def __request(self, method, url, params=None, json_body=None, login=True):
+        if login:
+            await self.__ensure_login()
+
+        session = self.__get_session()
+        consecutive_errors = 0
+
+        while True:
+            error = None
+            try:
+                async with session.request(method, url, params=self.__format_query(params or {}), json=json_body, headers=self.headers) as response:
+                    data = await response.read()
+                    status = response.status
+                    reason = response.reason
+                    content_type = response.headers.get('Content-Type', '')
+                    retry_after = self.__get_retry_after(response.headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+
+            if error is not None:
+                ## a request that is not idempotent is only retried when it could not connect, since it may have been processed otherwise
+                retryable = method in self.retry_allowed_methods or isinstance(error, aiohttp.ClientConnectorError)
+                if not retryable or consecutive_errors >= self.retry_total:
+                    raise error
+                consecutive_errors += 1
+                print(f"Retrying request: {method} {url}, response: no response, error: {error!r}")
+                await asyncio.sleep(self.__get_backoff_time(consecutive_errors))
+                continue
+
+            if status in self.retry_status_forcelist and method in self.retry_allowed_methods and consecutive_errors < self.retry_total:
+                consecutive_errors += 1
+                response_string = json.loads(data.decode('utf-8')) if 'application/json' in content_type else (data or reason)
+                print(f"Retrying request: {method} {url}, response: {response_string}, error: None")
+                await asyncio.sleep(retry_after if retry_after is not None else self.__get_backoff_time(consecutive_errors))
+                continue
+
+            if status >= 400:
+                if 'application/json' in content_type:
+                    error = json.loads(data.decode('utf-8'))
+                elif data:
+                    error = {
+                        'name': 'Error',
+                        'message': data.decode('utf-8', errors='replace')
+                    }
+                else:
+                    error = {
+                        'name': 'Error',
+                        'message': reason
+                    }
+                raise OpenReviewException(error)
+
+            return json.loads(data) if data else {}
+
+    ## PUBLIC FUNCTIONS
+    async def login_user(self, username=None, password=None, expiresIn=None):
+        """
+        Logs in a registered user
+
+        :param username: OpenReview username
+        :type username: str, optional
+        :param password: OpenReview password
+        :type password: str, optional
+
+        :return: Dictionary containing user information and the authentication token
+        :rtype: dict
+        """
+        user = { 'id': username, 'password': password, 'expiresIn': expiresIn }
+        json_response = await self.__request('POST', self.login_url, json_body=user, login=False)
+        self.__handle_token(json_response)
+        return json_response
+
+    async def impersonate(self, group_id):
+        json_response = await self.__request('POST', self.baseurl + '/impersonate', json_body={ 'groupId': group_id })
+        self.__handle_token(json_response)
+        return json_response
+
+    async def get_group(self, id, details=None):
+        """
+        Get a single Group by id if available
+
+        :param id: id of the group
+        :type id: str
+
+        :return: Dictionary with the group information
+        :rtype: Group
+        """
+        response = await self.__request('GET', self.groups_url, params={ 'id': id, 'details': details })
+        group = Group.from_json(response['groups'][0])
+
+        if group.anonids:
+            anon_prefix = (group.id[:-1] if group.id.endswith('s') else group.id) + '_'
+            members_by_anonid = { g.id:g.members[0] for g in await self.get_groups(prefix=anon_prefix) if g.members }
+            members = []
+            anon_members = []
+            for member in group.members:
+                if member in members_by_anonid:
+                    anon_members.append(member)
+                    members.append(members_by_anonid[member])
+                else:
+                    members.append(member)
+            group.anon_members = anon_members
+            group.members = members
+        return group
+
+    async def get_invitation(self, id):
+        """
+        Get a single invitation by id if available
+
+        :param id: id of the invitation
+        :type id: str
+
+        :return: Invitation matching the passed id
+        :rtype: Invitation
+        """
+        response = await self.__request('GET', self.invitations_url, params={ 'id': id })
+        return Invitation.from_json(response['invitations'][0])
+
+    async def get_note(self, id, details=None):
+        """
+        Get a single Note by id if available
+
+        :param id: id of the note
+        :type id: str
+
+        :return: Note matching the passed id
+        :rtype: Note
+        """
+        response = await self.__request('GET', self.notes_url, params={ 'id': id, 'details': details })
+        return Note.from_json(response['notes'][0])
+
+    async def get_tag(self, id):
+        """
+        Get a single Tag by id if available
+
+        :param id: id of the Tag
+        :type id: str
+
+        :return: Tag with the Tag information
+        :rtype: Tag
+        """
+        response = await self.__request('GET', self.tags_url, params={ 'id': id })
+        return Tag.from_json(response['tags'][0])
+
+    async def get_edge(self, id, trash=False):
+        """
+        Get a single Edge by id if available
+
+        :param id: id of the Edge
+        :type id: str
+
+        return: Edge object with its information
+        :rtype: Edge
+        """
+        response = await self.__request('GET', self.edges_url, params={ 'id': id, 'trash': trash == True })
+        edges = response['edges']
+        if edges:
+            return Edge.from_json(edges[0])
+        else:
+            raise OpenReviewException('Edge not found')
+
+    async def get_profile(self, email_or_id = None):
+        """
+        Get a single Profile by id, if available
+
+        :param email_or_id: e-mail or id of the profile
+        :type email_or_id: str, optional
+
+        :return: Profile object with its information
+        :rtype: Profile
+        """
+        params = {}
+        if email_or_id:
+            tildematch = re.compile('~.+')
+            if tildematch.match(email_or_id):
+                att = 'id'
+            else:
+                att = 'email'
+            params[att] = email_or_id
+        response = await self.__request('GET', self.profiles_url, params=params)
+        profiles = response['profiles']
+        if profiles:
+            return Profile.from_json(profiles[0])
+        else:
+            raise OpenReviewException(['Profile Not Found'])
+
+    async def search_profiles(self, confirmedEmails = None, emails = None, ids = None, term = None):
+        """
+        Gets a list of profiles using either their ids or corresponding emails
+
+        :param confirmedEmails: List of confirmed emails registered in OpenReview
+        :type confirmedEmails: list, optional
+        :param emails: List of emails registered in OpenReview
+        :type emails: list, optional
+        :param ids: List of OpenReview username ids
+        :type ids: list, optional
+        :param term: Substring in the username or e-mail to be searched
+        :type term: str, optional
+
+        :return: List of profiles, if emails is present then a dictionary of { emails: profiles } is returned. If confirmedEmails is present then a dictionary of { confirmedEmails: profile } is returned
+        :rtype: list[Profile]
+        """
+        batch_size = 1000
+
+        async def search(key, values):
+            responses = await asyncio.gather(*[self.__request('POST', self.profiles_search_url, json_body={ key: values[i:i+batch_size] }) for i in range(0, len(values), batch_size)])
+            return [p for response in responses for p in response['profiles']]
+
+        if term:
+            response = await self.__request('GET', self.profiles_search_url, params={ 'term': term })
+            return [Profile.from_json(p) for p in response['profiles']]
+
+        if emails:
+            profiles_by_email = {}
+            for p in await search('emails', emails):
+                profiles_by_email.setdefault(p['email'], []).append(Profile.from_json(p))
+            return profiles_by_email
+
+        if confirmedEmails:
+            profiles_by_email = {}
+            for p in await search('confirmedEmails', confirmedEmails):
+                profile_confirmed_emails = p.get('confirmedEmails', p['content'].get('emailsConfirmed', []))
+                for email in profile_confirmed_emails:
+                    profiles_by_email[email] = Profile.from_json(p)
+            return profiles_by_email
+
+        if ids:
+            return [Profile.from_json(p) for p in await search('ids', ids)]
+
+        return []
+
+    async def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=None):
+        """
+        Gets list of Group objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_groups`
+
+        :return: List of Groups
+        :rtype: list[Group]
+        """
+        params = {
+            'id': id,
+            'prefix': prefix,
+            'member': member,
+            'members': members,
+            'signatory': signatory,
+            'sort': sort,
+            'web': web,
+            'limit': limit,
+            'offset': offset,
+            'after': after,
+            'stream': stream,
+            'count': with_count
+        }
+
+        response = await self.__request('GET', self.groups_url, params=params)
+        groups = [Group.from_json(g) for g in response['groups']]
+
+        if with_count and offset is None:
+            return groups, response['count']
+
+        return groups
+
+    async def get_all_groups(self, id=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None):
+        """
+        Gets list of Group objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_all_groups`
+
+        :return: List of Groups
+        :rtype: list[Group]
+        """
+        params = {
+            'id': id,
+            'parent': parent,
+            'prefix': prefix,
+            'member': member,
+            'members': members,
+            'domain': domain,
+            'signatory': signatory,
+            'web': web,
+            'sort': sort,
+            'stream': True
+        }
+        response = await self.__request('GET', self.groups_url, params=params)
+        return [Group.from_json(g) for g in response['groups']]
+
+    async def get_invitations(self, id = None, ids = None, invitee = None, replytoNote = None, replyForum = None, signature = None, note = None, prefix = None, tags = None, limit = None, offset = None, after = None, minduedate = None, duedate = None, pastdue = None, replyto = None, details = None, expired = None, sort = None, type = None, with_count=None, invitation = None, trash = None):
+        """
+        Gets list of Invitation objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_invitations`
+
+        :return: List of Invitations
+        :rtype: list[Invitation]
+        """
+        params = {
+            'id': id,
+            'ids': ids,
+            'invitee': invitee,
+            'replytoNote': replytoNote,
+            'replyForum': replyForum,
+            'signature': signature,
+            'note': note,
+            'prefix': prefix,
+            'tags': tags,
+            'minduedate': minduedate,
+            'replyto': replyto,
+            'duedate': duedate,
+            'pastdue': pastdue,
+            'details': details,
+            'limit': limit,
+            'offset': offset,
+            'after': after,
+            'sort': sort,
+            'expired': expired,
+            'type': type,
+            'invitation': invitation,
+            'count': with_count,
+            'trash': trash
+        }
+
+        response = await self.__request('GET', self.invitations_url, params=params)
+        invitations = [Invitation.from_json(i) for i in response['invitations']]
+
+        if with_count and offset is None:
+            return invitations, response['count']
+
+        return invitations
+
+    async def get_all_invitations(self, **params):
+        """
+        Gets all the Invitation objects based on the filters provided, ignoring the API limit. Accepts the same parameters as :meth:`get_invitations`
+
+        :return: List of Invitations
+        :rtype: list[Invitation]
+        """
+        return await self.__get_all(self.get_invitations, **params)
+
+    async def get_notes(self, id = None, paperhash = None, forum = None, invitation = None, parent_invitations = None, replyto = None, tauthor = None, signature = None, transitive_members = None, signatures = None, writer = None, trash = None, number = None, content = None, limit = None, offset = None, after = None, mintcdate = None, domain = None, details = None, sort = None, with_count=None, stream=None):
+        """
+        Gets list of Note objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_notes`
+
+        :return: List of Notes
+        :rtype: list[Note]
+        """
+        params = {
+            'id': id,
+            'paperhash': paperhash,
+            'forum': forum,
+            'invitation': invitation,
+            'parentInvitations': parent_invitations,
+            'replyto': replyto,
+            'tauthor': tauthor,
+            'signature': signature,
+            'transitiveMembers': transitive_members,
+            'signatures': signatures,
+            'writer': writer,
+            'trash': True if trash == True else None,
+            'number': number,
+            'limit': limit,
+            'offset': offset,
+            'mintcdate': mintcdate,
+            'domain': domain,
+            'details': details,
+            'after': after,
+            'sort': sort,
+            'count': with_count,
+            'stream': stream
+        }
+        if content is not None:
+            for k in content:
+                params['content.' + k] = content[k]
+
+        response = await self.__request('GET', self.notes_url, params=params)
+        notes = [Note.from_json(n) for n in response['notes']]
+
+        if with_count and offset is None:
+            return notes, response['count']
+
+        return notes
+
+    async def get_all_notes(self, **params):
+        """
+        Gets all the Note objects based on the filters provided, ignoring the API limit. Accepts the same parameters as :meth:`get_notes`
+
+        :return: List of Notes
+        :rtype: list[Note]
+        """
+        return await self.__get_all(self.get_notes, **params)
+
+    async def __get_all(self, get_function, **params):
+        ## Same pagination as tools.prefetch_iterget: sort by id and ask for the next batch after the last id, or page
+        ## by offset when the caller sorts by something else
+        paginate_by_offset = params.get('sort') not in [None, 'id', 'id:asc']
+        if paginate_by_offset:
+            if params.get('after'):
+                raise OpenReviewException(f"after can not be used with sort '{params['sort']}', only with the id order")
+        else:
+            params['sort'] = params.get('sort') or 'id'
+        params['limit'] = params.get('limit') or self.limit
+        params.pop('with_count', None)
+        docs = []
+        batch = await get_function(**params)
+        while batch:
+            docs.extend(batch)
+            if len(batch) < params['limit']:
+                break
+            if paginate_by_offset:
+                params['offset'] = (params.get('offset') or 0) + len(batch)
+            else:
+                params['after'] = batch[-1].id
+            batch = await get_function(**params)
+        return docs
+
+    async def get_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None, mintmdate=None, stream=None):
+        """
+        Gets a list of Tag objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_tags`
+
+        :return: List of tags
+        :rtype: list[Tag]
+        """
+        params = {
+            'id': id,
+            'forum': forum,
+            'profile': profile,
+            'invitation': invitation,
+            'parentInvitations': parent_invitations,
+            'signature': signature,
+            'tag': tag,
+            'limit': limit,
+            'offset': offset,
+            'mintmdate': mintmdate,
+            'count': with_count,
+            'stream': stream
+        }
+
+        response = await self.__request('GET', self.tags_url, params=params)
+        tags = [Tag.from_json(t) for t in response['tags']]
+
+        if with_count and offset is None:
+            return tags, response['count']
+
+        return tags
+
+    async def get_all_tags(self, **params):
+        """
+        Gets all the Tag objects based on the filters provided, ignoring the API limit. Accepts the same parameters as :meth:`get_tags`, `limit` is the maximum number of tags returned
+
+        :return: List of tags
+        :rtype: list[Tag]
+        """
+        return await self.__get_all_by_offset(self.get_tags, **params)
+
+    async def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None):
+        """
+        Returns a list of Edge objects based on the filters provided. See :meth:`openreview.api.OpenReviewClient.get_edges`
+
+        :return: List of edges
+        :rtype: list[Edge]
+        """
+        params = {
+            'id': id,
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label,
+            'limit': limit,
+            'offset': offset,
+            'trash': trash,
+            'count': with_count
+        }
+
+        response = await self.__request('GET', self.edges_url, params=params)
+        edges = [Edge.from_json(e) for e in response['edges']]
+
+        if with_count and offset is None:
+            return edges, response['count']
+
+        return edges
+
+    async def get_all_edges(self, **params):
+        """
+        Returns all the Edge objects based on the filters provided, ignoring the API limit. Accepts the same parameters as :meth:`get_edges`, `limit` is the maximum number of edges returned
+
+        :return: List of edges
+        :rtype: list[Edge]
+        """
+        return await self.__get_all_by_offset(self.get_edges, **params)
+
+    async def __get_all_by_offset(self, get_function, **params):
+        ## Same pagination as tools.concurrent_get: get the count first and then request all the pages at the same time
+        params.pop('with_count', None)
+        limit = params.pop('limit', None)
+        offset = params.pop('offset', None) or 0
+        _, count = await get_function(limit=1, with_count=True, **params)
+        end = count if limit is None else min(offset + limit, count)
+        batches = await asyncio.gather(*[get_function(limit=min(self.limit, end - o), offset=o, **params) for o in range(offset, end, self.limit)])
+        return [doc for batch in batches for doc in batch]
+
+    async def get_edges_count(self, id = None, invitation = None, head = None, tail = None, label = None):
+        """
+        Returns the number of edges that match the filters provided
+
+        :return: Number of edges
+        :rtype: int
+        """
+        params = {
+            'id': id,
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label
+        }
+        response = await self.__request('GET', self.edges_count_url, params=params)
+        return response['count']
+
+    async def get_grouped_edges(self, invitation=None, head=None, tail=None, label=None, groupby='head', select=None, limit=None, offset=None, trash=None):
+        """
+        Returns a list of JSON objects where each one represents a group of edges. See :meth:`openreview.api.OpenReviewClient.get_grouped_edges`
+        """
+        params = {
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label,
+            'groupBy': groupby,
+            'select': select,
+            'limit': limit,
+            'offset': offset,
+            'trash': trash
+        }
+        response = await self.__request('GET', self.edges_url, params=params)
+        return response['groupedEdges']
+
+    async def get_process_logs(self, id = None, invitation = None, status = None, min_sdate = None):
+        """
+        **Only for Super User**. Retrieves the logs of the process function executed by an Invitation
+
+        :return: Logs of the process
+        :rtype: dict
+        """
+        response = await self.__request('GET', self.process_logs_url, params={ 'id': id, 'invitation': invitation, 'status': status, 'minsdate': min_sdate })
+        return response['logs']
+
+    async def __await_process(self, edit_id):
+
+        process_logs = await self.get_process_logs(id=edit_id)
+        if not process_logs:
+            return ## no process function found
+
+        for i in range(100):
+
+            if process_logs[0]['status'] == 'ok':
+                return
+            elif process_logs[0]['status'] == 'error':
+                raise OpenReviewException(process_logs[0].get('log', 'No log available'))
+
+            await asyncio.sleep(0.5)
+            process_logs = await self.get_process_logs(id=edit_id)
+
+        raise OpenReviewException("Process timed out")
+
+    async def flush_members_cache(self, group_id=None):
+        """
+        Flushes the members cache for a group
+
+        :param group_id: id of the group to flush the cache for
+        :type group_id: str, optional
+
+        :return: Dictionary containing the status of the request
+        :rtype: dict
+        """
+        if not group_id:
+            return
+        if '/' in group_id:
+            group_id = group_id.replace('/', '%2F')
+
+        return await self.__request('DELETE', self.groups_members_cache_url + '/' + group_id)
+
+    async def post_note_edit(self, invitation, signatures, note=None, readers=None, writers=None, nonreaders=None, content=None, await_process=False):
+        """
+        Posts a note edit. See :meth:`openreview.api.OpenReviewClient.post_note_edit`
+        """
+        edit_json = {
+            'invitation': invitation,
+            'note': note.to_json() if note else {}
+        }
+
+        if signatures is not None:
+            edit_json['signatures'] = signatures
+
+        if readers is not None:
+            edit_json['readers'] = readers
+
+        if writers is not None:
+            edit_json['writers'] = writers
+
+        if nonreaders is not None:
+            edit_json['nonreaders'] = nonreaders
+
+        if content is not None:
+            edit_json['content'] = content
+
+        posted_edit = await self.__request('POST', self.note_edits_url, json_body=edit_json)
+
+        if await_process:
+            await self.__await_process(posted_edit['id'])
+
+        return posted_edit
+
+    async def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None, await_process=False):
+        """
+        Posts an invitation edit. See :meth:`openreview.api.OpenReviewClient.post_invitation_edit`
+        """
+        edit_json = {}
+
+        if invitations is not None:
+            edit_json['invitations'] = invitations
+
+        if readers is not None:
+            edit_json['readers'] = readers
+
+        if writers is not None:
+            edit_json['writers'] = writers
+
+        if signatures is not None:
+            edit_json['signatures'] = signatures
+
+        if content is not None:
+            edit_json['content'] = content
+
+        if replacement is not None:
+            edit_json['replacement'] = replacement
+
+        if invitation is not None:
+            edit_json['invitation'] = invitation.to_json()
+
+        if domain is not None:
+            edit_json['domain'] = domain
+
+        posted_edit = await self.__request('POST', self.invitation_edits_url, json_body=edit_json)
+
+        if await_process:
+            await self.__await_process(posted_edit['id'])
+
+        return posted_edit
+
+    async def post_group_edit(self, invitation, signatures=None, group=None, readers=None, writers=None, content=None, replacement=None, await_process=False, flush_members_cache=True):
+        """
+        Posts a group edit. See :meth:`openreview.api.OpenReviewClient.post_group_edit`
+        """
+        edit_json = {
+            'invitation': invitation
+        }
+
+        if group is not None:
+            edit_json['group'] = group.to_json()
+
+        if signatures is not None:
+            edit_json['signatures'] = signatures
+
+        if readers is not None:
+            edit_json['readers'] = readers
+
+        if writers is not None:
+            edit_json['writers'] = writers
+
+        if content is not None:
+            edit_json['content'] = content
+
+        if replacement is not None:
+            edit_json['replacement'] = replacement
+
+        posted_edit = await self.__request('POST', self.group_edits_url, json_body=edit_json)
+
+        members = posted_edit.get('group', {}).get('members')
+        if flush_members_cache and posted_edit['domain'] in posted_edit['signatures']:
+            members_to_flush = []
+            if isinstance(members, dict):
+                if 'add' in members:
+                    members_to_flush = members['add']
+                elif 'remove' in members:
+                    members_to_flush = members['remove']
+            if isinstance(members, list):
+                members_to_flush = members
+            await asyncio.gather(*[self.flush_members_cache(member) for member in members_to_flush])
+
+        if await_process:
+            await self.__await_process(posted_edit['id'])
+
+        return posted_edit
+
+    async def post_edit(self, edit):
+        """
+        Posts an edit, the endpoint is selected based on the entity that the edit contains
+        """
+        edit_json = edit.to_json()
+
+        if 'note' in edit_json:
+            return await self.__request('POST', self.note_edits_url, json_body=edit_json)
+        elif 'group' in edit_json:
+            return await self.__request('POST', self.group_edits_url, json_body=edit_json)
+        elif 'invitation' in edit_json:
+            return await self.__request('POST', self.invitation_edits_url, json_body=edit_json)
+
+    async def post_tag(self, tag):
+        """
+        Posts the tag.
+
+        :param tag: Tag to be posted
+        :type tag: Tag
+
+        :return Tag: The posted Tag
+        """
+        return Tag.from_json(await self.__request('POST', self.tags_url, json_body=tag.to_json()))
+
+    async def post_tags(self, tags):
+        '''
+        Posts the list of Tags. Returns a list Tag objects updated with their ids.
+        '''
+        received_json_array = await self.__request('POST', self.bulk_tags_url, json_body=[tag.to_json() for tag in tags])
+        return [Tag.from_json(tag) for tag in received_json_array]
+
+    async def post_edge(self, edge):
+        """
+        Posts the edge. Upon success, returns the posted Edge object.
+        """
+        return Edge.from_json(await self.__request('POST', self.edges_url, json_body=edge.to_json()))
+
+    async def post_edges(self, edges):
+        '''
+        Posts the list of Edges. Returns a list Edge objects updated with their ids.
+        '''
+        received_json_array = await self.__request('POST', self.bulk_edges_url, json_body=[edge.to_json() for edge in edges])
+        return [Edge.from_json(edge) for edge in received_json_array]
+
+    async def delete_edges(self, invitation, id=None, label=None, head=None, tail=None, wait_to_finish=False, soft_delete=False):
+        """
+        Deletes edges by a combination of invitation id and one or more of the optional filters. See :meth:`openreview.api.OpenReviewClient.delete_edges`
+
+        :return: a {status = 'ok'} in case of a successful deletion and an OpenReview exception otherwise
+        :rtype: dict
+        """
+        delete_query = {'invitation': invitation}
+        if label:
+            delete_query['label'] = label
+        if head:
+            delete_query['head'] = head
+        if tail:
+            delete_query['tail'] = tail
+        if id:
+            delete_query['id'] = id
+
+        delete_query['waitToFinish'] = wait_to_finish
+        delete_query['softDelete'] = soft_delete
+
+        return await self.__request('DELETE', self.edges_url, json_body=delete_query)
+
+    async def add_members_to_group(self, group, members):
+        """
+        Adds members to a group
+
+        :param group: Group (or Group's id) to which the members will be added
+        :type group: Group or str
+        :param members: Members that will be added to the group. Members should be in a string, unicode or a list format
+        :type members: str, list, unicode
+
+        :return: Group with the members added
+        :rtype: Group
+        """
+        member_type = type(members)
+        if member_type in string_types:
+            members = [members]
+        elif member_type != list:
+            raise OpenReviewException("add_members_to_group()- members '"+str(members)+"' ("+str(member_type)+") must be a str, unicode or list, but got " + repr(member_type) + " instead")
+
+        group = await self.get_group(group) if type(group) in string_types else group
+        await self.post_group_edit(invitation = f'{group.domain}/-/Edit',
+            signatures = group.signatures,
+            group = Group(
+                id = group.id,
+                members = {
+                    'add': list(set(members))
+                }
+            ),
+            readers=group.signatures,
+            writers=group.signatures
+        )
+        return await self.get_group(group.id)
+
+    async def remove_members_from_group(self, group, members):
+        """
+        Removes members from a group
+
+        :param group: Group (or Group's id) from which the members will be removed
+        :type group: Group or str
+        :param members: Members that will be removed. Members should be in a string, unicode or a list format
+        :type members: str, list, unicode
+
+        :return: Group without the members that were removed
+        :type: Group
+        """
+        if type(members) in string_types:
+            members = [members]
+
+        group = await self.get_group(group if type(group) in string_types else group.id)
+        members_to_remove = group.transform_to_anon_ids(list(set(members)))
+
+        await self.post_group_edit(invitation = f'{group.domain}/-/Edit',
+            signatures = group.signatures,
+            group = Group(
+                id = group.id,
+                members = {
+                    'remove': members_to_remove
+                }
+            ),
+            readers=group.signatures,
+            writers=group.signatures
+        )
+        return await self.get_group(group.id)
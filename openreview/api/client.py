@@ -8,6 +8,7 @@ else:
     string_types = [str]
 
 from .. import tools
+from ..metrics import RequestMetrics
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
@@ -17,14 +18,35 @@ import re
 import time
 import jwt
 import json
+import copy
+import threading
+from collections import OrderedDict
 from ..openreview import Profile
 from ..openreview import OpenReviewException
 from .. import tools
 
 class LogRetry(Retry):
      
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)   
+    def __init__(self, *args, metrics=None, limiter=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics
+        self.limiter = limiter
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.metrics = self.metrics
+        retry.limiter = self.limiter
+        return retry
+
+    def sleep(self, response=None):
+        if self.limiter is None:
+            return super().sleep(response)
+        ## the request holds a slot of the limiter while it is sent, do not keep it while waiting to retry
+        self.limiter.release()
+        try:
+            super().sleep(response)
+        finally:
+            self.limiter.acquire()
 
     def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
         # Log retry information before calling the parent class method
@@ -37,10 +59,180 @@ class LogRetry(Retry):
             else:
                 response_string = response.reason
         print(f"Retrying request: {method} {url}, response: {response_string}, error: {error}")
+        if self.limiter is not None:
+            self.limiter.observe_retry(response)
+        if self.metrics is not None:
+            self.metrics.record_retry(RequestMetrics.endpoint(method, url))
 
         # Call the parent class method to perform the actual retry increment
         return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
-    
+
+
+class EntityCache(object):
+    """
+    Thread safe LRU cache with time to live used by :meth:`OpenReviewClient.enable_cache`. Entries are keyed by a tuple
+    whose second element is the id of the cached entity, e.g. ('group', 'Venue/Reviewers', None).
+
+    The cache stores and returns copies of the entities so the callers can modify the returned objects.
+
+    :param ttl: Time in seconds that an entry is considered fresh
+    :type ttl: int, optional
+    :param max_size: Maximum number of entries, the least recently used entries are evicted first
+    :type max_size: int, optional
+    :param revalidate: If True, expired entries are kept so they can be reused when the tmdate of the entity did not change
+    :type revalidate: bool, optional
+    """
+    def __init__(self, ttl=300, max_size=1000, revalidate=False):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.revalidate = revalidate
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        """
+        Returns a tuple (entity, expired). The entity is None when the key is not cached.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            entity, expires_at = entry
+            expired = time.monotonic() >= expires_at
+            if expired and not self.revalidate:
+                del self.__entries[key]
+                self.misses += 1
+                return None, False
+            self.__entries.move_to_end(key)
+            if expired:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return copy.deepcopy(entity), expired
+
+    def set(self, key, entity):
+        with self.__lock:
+            self.__entries[key] = (copy.deepcopy(entity), time.monotonic() + self.ttl)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, id):
+        """
+        Removes all the entries of the entity with the given id
+        """
+        if id:
+            self.invalidate_where(lambda key, entity: key[1] == id)
+
+    def invalidate_where(self, predicate):
+        with self.__lock:
+            for key in [key for key, (entity, expires_at) in self.__entries.items() if predicate(key, entity)]:
+                del self.__entries[key]
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+class SingleFlightSession(requests.Session):
+    """
+    Session that collapses identical GET requests that are in flight at the same time into one network call. The first
+    thread performs the request and the threads that ask for the same url, params and headers while it is running wait
+    for it and get a copy of its response, with their own status, headers and content.
+
+    Any other request method increases a write generation when it starts and when it ends, and a GET only joins a call
+    that started in the current generation, so a thread never gets a response that was requested before its own write finished.
+
+    OpenReviewClient uses this session with the coalescing disabled, set `client.session.enabled = True` to enable it.
+
+    :param enabled: Whether identical GET requests are collapsed
+    :type enabled: bool, optional
+    """
+    def __init__(self, enabled=True):
+        super().__init__()
+        self.enabled = enabled
+        self.coalesced = 0
+        self.__generation = 0
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, SingleFlightSession.__freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(SingleFlightSession.__freeze(v) for v in value)
+        return value
+
+    @staticmethod
+    def __copy_response(response):
+        copied = requests.Response()
+        copied.status_code = response.status_code
+        copied.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        copied._content = response.content
+        copied._content_consumed = True
+        copied.url = response.url
+        copied.encoding = response.encoding
+        copied.reason = response.reason
+        copied.elapsed = response.elapsed
+        copied.request = response.request
+        copied.history = list(response.history)
+        copied.cookies = requests.cookies.cookiejar_from_dict(response.cookies.get_dict())
+        if 'json' in vars(response):
+            copied.json = lambda **json_kwargs: tools.json_loads(copied.content)
+        return copied
+
+    def request(self, method, url, **kwargs):
+        if method.upper() != 'GET':
+            with self.__lock:
+                self.__generation += 1
+            try:
+                return super().request(method, url, **kwargs)
+            finally:
+                with self.__lock:
+                    self.__generation += 1
+
+        if not self.enabled or kwargs.get('stream'):
+            return super().request(method, url, **kwargs)
+
+        key = (url, self.__freeze(kwargs.get('params')), self.__freeze(kwargs.get('headers')))
+        with self.__lock:
+            flight = self.__in_flight.get(key)
+            if flight is not None and flight['generation'] == self.__generation:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = { 'generation': self.__generation, 'done': threading.Event(), 'response': None, 'error': None }
+                self.__in_flight[key] = flight
+                leader = True
+
+        if not leader:
+            flight['done'].wait()
+            if flight['error'] is not None:
+                raise flight['error']
+            return self.__copy_response(flight['response'])
+
+        try:
+            response = super().request(method, url, **kwargs)
+            ## read the body before sharing the response so the waiters do not consume it concurrently
+            response.content
+            flight['response'] = response
+            return response
+        except Exception as e:
+            flight['error'] = e
+            raise
+        finally:
+            with self.__lock:
+                if self.__in_flight.get(key) is flight:
+                    del self.__in_flight[key]
+            flight['done'].set()
+
 
 class OpenReviewClient(object):
     """
@@ -54,8 +246,10 @@ class OpenReviewClient(object):
     :type token: str, optional
     :param expiresIn: Time in seconds before the token expires. If none is set the value will be set automatically to one hour. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param concurrency_limiter: Limiter of the HTTP requests sent at the same time by this client, the same limiter can be passed to several clients. If none is provided, the requests are not limited
+    :type concurrency_limiter: tools.AdaptiveConcurrencyLimiter, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, concurrency_limiter=None):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3001')
         if 'https://api.openreview.net' in self.baseurl or 'https://devapi.openreview.net' in self.baseurl:
             correct_baseurl = self.baseurl.replace('api', 'api2')
@@ -101,6 +295,7 @@ class OpenReviewClient(object):
         self.user_agent = 'OpenReviewPy/v' + str(sys.version_info[0])
 
         self.limit = 1000
+        self.cache = None
         self.token = token.replace('Bearer ', '') if token else None
         self.profile = None
         self.headers = {
@@ -108,11 +303,19 @@ class OpenReviewClient(object):
             'Accept': 'application/json'
         }
 
-        retry_strategy = LogRetry(total=3, backoff_factor=1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True)
-        self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.metrics = RequestMetrics()
+        retry_strategy = LogRetry(total=3, backoff_factor=1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True, metrics=self.metrics, limiter=concurrency_limiter)
+        self.session = SingleFlightSession(enabled=False)
+        self.concurrency_limiter = concurrency_limiter
+        if concurrency_limiter is None:
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+        else:
+            adapter = tools.LimitedHTTPAdapter(concurrency_limiter, max_retries=retry_strategy)
+            self.session.hooks['response'].append(concurrency_limiter.observe_response)
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
+        self.session.hooks['response'].append(tools.use_fast_json)
+        self.session.hooks['response'].append(self.metrics.observe_response)
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
@@ -180,7 +383,79 @@ class OpenReviewClient(object):
 
         raise OpenReviewException("Process timed out")    
 
+    def __get_cached(self, key, load):
+        if self.cache is None:
+            return load(None)
+
+        entity, expired = self.cache.get(key)
+        if entity is not None and not expired:
+            return entity
+
+        loaded = load(entity)
+        self.cache.set(key, loaded)
+        return loaded
+
+    def __invalidate_cache(self, kind, id):
+        if self.cache is None or not id:
+            return
+
+        def should_invalidate(key, entity):
+            if key[0] != kind:
+                return False
+            if key[1] == id:
+                return True
+            ## Groups with anonids resolve their members using the anonymous groups
+            if kind == 'group' and entity.anonids:
+                anon_prefix = (entity.id[:-1] if entity.id.endswith('s') else entity.id) + '_'
+                return id.startswith(anon_prefix)
+            return False
+
+        self.cache.invalidate_where(should_invalidate)
+
+    def __invalidate_edit(self, posted_edit, entity_json=None):
+        for kind in ['note', 'group', 'invitation']:
+            for edit in [posted_edit, entity_json or {}]:
+                ## the invitation of a note or group edit is the id of the invitation used to post the edit
+                entity = edit.get(kind)
+                if not isinstance(entity, dict):
+                    continue
+                self.__invalidate_cache(kind, entity.get('id'))
+                if kind == 'note':
+                    self.__invalidate_cache(kind, entity.get('forum'))
+
     ## PUBLIC FUNCTIONS
+    def enable_cache(self, ttl=300, max_size=1000, revalidate=False):
+        """
+        Enables a client side cache for :meth:`get_group`, :meth:`get_invitation` and :meth:`get_note`. Repeated reads
+        of the same entity return a cached copy without requesting it again. The cached entities are invalidated when
+        this client posts an edit or deletes the entity, edits done by other clients or by process functions are only
+        seen after the entry expires.
+
+        :param ttl: Time in seconds that a cached entity is returned without requesting it again
+        :type ttl: int, optional
+        :param max_size: Maximum number of cached entities, the least recently used entities are evicted first
+        :type max_size: int, optional
+        :param revalidate: If True, expired entities are requested again and the cached copy is reused when its tmdate did not change, this avoids rebuilding the entity, e.g. resolving the anonymous members of a group
+        :type revalidate: bool, optional
+
+        :return: The cache used by the client
+        :rtype: EntityCache
+
+        Example:
+
+        >>> client.enable_cache(ttl=600)
+        >>> group = client.get_group('ICML.cc/2025/Conference') # requested to the API
+        >>> group = client.get_group('ICML.cc/2025/Conference') # returned from the cache
+        """
+        self.cache = EntityCache(ttl=ttl, max_size=max_size, revalidate=revalidate)
+        return self.cache
+
+    def disable_cache(self):
+        """
+        Disables and clears the client side cache enabled by :meth:`enable_cache`
+        """
+        self.cache = None
+
     def impersonate(self, group_id):
         response = self.session.post(self.baseurl + '/impersonate', json={ 'groupId': group_id }, headers=self.headers)
         response = self.__handle_response(response)
@@ -363,9 +638,14 @@ class OpenReviewClient(object):
 
         >>> group = client.get_group('your-email@domain.com')
         """
+        return self.__get_cached(('group', id, details), lambda cached: self.__get_group(id, details, cached))
+
+    def __get_group(self, id, details=None, cached=None):
         response = self.session.get(self.groups_url, params = {'id':id, 'details': details}, headers = self.headers)
         response = self.__handle_response(response)
         g = response.json()['groups'][0]
+        if cached is not None and cached.tmdate == g.get('tmdate'):
+            return cached
         group = Group.from_json(g)
 
         if group.anonids:
@@ -393,9 +673,14 @@ class OpenReviewClient(object):
         :return: Invitation matching the passed id
         :rtype: Invitation
         """
+        return self.__get_cached(('invitation', id, None), lambda cached: self.__get_invitation(id, cached))
+
+    def __get_invitation(self, id, cached=None):
         response = self.session.get(self.invitations_url, params = {'id': id}, headers = self.headers)
         response = self.__handle_response(response)
         i = response.json()['invitations'][0]
+        if cached is not None and cached.tmdate == i.get('tmdate'):
+            return cached
         return Invitation.from_json(i)
 
     def get_note(self, id, details=None):
@@ -408,9 +693,15 @@ class OpenReviewClient(object):
         :return: Note matching the passed id
         :rtype: Note
         """
+        return self.__get_cached(('note', id, details), lambda cached: self.__get_note(id, details, cached))
+
+    def __get_note(self, id, details=None, cached=None):
         response = self.session.get(self.notes_url, params = {'id':id, 'details': details}, headers = self.headers)
         response = self.__handle_response(response)
         n = response.json()['notes'][0]
+        ## details may change without changing the note
+        if cached is not None and details is None and cached.tmdate == n.get('tmdate'):
+            return cached
         return Note.from_json(n)
 
     def get_tag(self, id):
@@ -859,7 +1150,7 @@ class OpenReviewClient(object):
         return response.json()
 
 
-    def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=None):
+    def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=None, raw=False):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -879,6 +1170,8 @@ class OpenReviewClient(object):
         :type limit: int, optional
         :param offset: Indicates the position to start retrieving Groups. For example, if there are 10 Groups and you want to obtain the last 3, then the offset would need to be 7.
         :type offset: int, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Group objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of Groups
         :rtype: list[Group]
@@ -911,14 +1204,15 @@ class OpenReviewClient(object):
 
         response = self.session.get(self.groups_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
-        groups = [Group.from_json(g) for g in response.json()['groups']]
+        response_json = response.json()
+        groups = response_json['groups'] if raw else [Group.from_json(g) for g in response_json['groups']]
 
         if with_count and params.get('offset') is None:
-            return groups, response.json()['count']
+            return groups, response_json['count']
 
         return groups
 
-    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None, with_count=None):
+    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None, with_count=None, shards=None, raw=False):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -942,6 +1236,10 @@ class OpenReviewClient(object):
         :type offset: int, optional
         :param after: Group id to start getting the list of groups from.
         :type after: str, optional
+        :param shards: If provided, the groups are paginated with this number of parallel cursors using :func:`tools.sharded_get` instead of being streamed in a single response. Only used when the groups are sorted by id.
+        :type shards: int, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Group objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of Groups
         :rtype: list[Group]
@@ -970,8 +1268,36 @@ class OpenReviewClient(object):
         if with_count is not None:
             params['with_count'] = with_count
 
+        if raw:
+            params['raw'] = raw
+
+        if shards and (sort is None or sort == 'id'):
+            params.pop('stream')
+            return tools.sharded_get(self.get_groups, shards=shards, desc='Getting V2 Groups', **params)
+
         return self.get_groups(**params)
 
+    def iter_groups(self, max_pages=2, **params):
+        """
+        Returns a generator over all the Groups that match the filters provided. Unlike :meth:`get_all_groups`, the Groups are not
+        loaded at once: the next pages are requested in the background while the current one is consumed and at most `max_pages`
+        pages are held in memory.
+
+        :param max_pages: Maximum number of pages fetched and not consumed yet
+        :type max_pages: int, optional
+        :param params: Filters accepted by :meth:`get_groups`
+        :type params: dict
+
+        :return: Generator over the Groups
+        :rtype: generator[Group]
+
+        Example:
+
+        >>> for group in client.iter_groups(prefix='ICML.cc/2025/Conference/Submission.*'):
+        ...     print(group.id)
+        """
+        return tools.prefetch_iterget(self.get_groups, max_pages=max_pages, paginate_by='after', **params)
+
     def get_invitations(self,
         id = None,
         ids = None,
@@ -1120,7 +1446,8 @@ class OpenReviewClient(object):
         type = None,
         with_count=None,
         invitation = None,
-        trash = None
+        trash = None,
+        shards = None
     ):
         """
         Gets list of Invitation objects based on the filters provided. The Invitations that will be returned match all the criteria passed in the parameters.
@@ -1155,6 +1482,8 @@ class OpenReviewClient(object):
         :type details: dict, optional
         :param expired: If true, retrieves the Invitations that have expired, otherwise, the ones that have not expired
         :type expired: bool, optional
+        :param shards: If provided, the invitations are fetched with this number of parallel cursors using :func:`tools.sharded_get`. Only used when the invitations are sorted by id.
+        :type shards: int, optional
 
         :return: List of Invitations
         :rtype: list[Invitation]
@@ -1202,6 +1531,9 @@ class OpenReviewClient(object):
         if trash is not None:
             params['trash'] = trash
 
+        if shards and (sort is None or sort == 'id'):
+            return tools.sharded_get(self.get_invitations, shards=shards, desc='Getting V2 Invitations', **params)
+
         return list(tools.efficient_iterget(self.get_invitations, desc='Getting V2 Invitations', **params))
 
     def get_invitation_edit(self, id):
@@ -1268,7 +1600,8 @@ class OpenReviewClient(object):
             details = None,
             sort = None,
             with_count=None,
-            stream=None
+            stream=None,
+            raw=False
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1316,6 +1649,8 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Note objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1372,10 +1707,11 @@ class OpenReviewClient(object):
         response = self.session.get(self.notes_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        notes = [Note.from_json(n) for n in response.json()['notes']]
+        response_json = response.json()
+        notes = response_json['notes'] if raw else [Note.from_json(n) for n in response_json['notes']]
 
         if with_count and params.get('offset') is None:
-            return notes, response.json()['count']
+            return notes, response_json['count']
 
         return notes
 
@@ -1395,7 +1731,9 @@ class OpenReviewClient(object):
             details = None,
             select = None,
             sort = None,
-            with_count=None
+            with_count=None,
+            shards=None,
+            raw=False
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1436,6 +1774,10 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param shards: If provided, the notes are fetched with this number of parallel cursors using :func:`tools.sharded_get`. Only used when the notes are sorted by id.
+        :type shards: int, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Note objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1477,8 +1819,35 @@ class OpenReviewClient(object):
         if with_count is not None:
             params['with_count'] = with_count
 
+        if raw:
+            params['raw'] = raw
+
+        if shards and (sort is None or sort == 'id'):
+            return tools.sharded_get(self.get_notes, shards=shards, desc='Getting V2 Notes', **params)
+
         return list(tools.efficient_iterget(self.get_notes, desc='Getting V2 Notes', **params))
 
+    def iter_notes(self, max_pages=2, **params):
+        """
+        Returns a generator over all the Notes that match the filters provided. Unlike :meth:`get_all_notes`, the Notes are not
+        loaded at once: the next pages are requested in the background while the current one is consumed and at most `max_pages`
+        pages are held in memory.
+
+        :param max_pages: Maximum number of pages fetched and not consumed yet
+        :type max_pages: int, optional
+        :param params: Filters accepted by :meth:`get_notes`
+        :type params: dict
+
+        :return: Generator over the Notes
+        :rtype: generator[Note]
+
+        Example:
+
+        >>> for note in client.iter_notes(invitation='ICML.cc/2025/Conference/-/Submission'):
+        ...     print(note.number)
+        """
+        return tools.prefetch_iterget(self.get_notes, max_pages=max_pages, paginate_by='after', **params)
+
     def get_note_edit(self, id, trash=None):
         """
         Get a single edit by id if available
@@ -1610,7 +1979,7 @@ class OpenReviewClient(object):
         #return response.json()
 
 
-    def get_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None, mintmdate=None, stream=None):
+    def get_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None, mintmdate=None, stream=None, raw=False):
         """
         Gets a list of Tag objects based on the filters provided. The Tags that will be returned match all the criteria passed in the parameters.
 
@@ -1620,6 +1989,8 @@ class OpenReviewClient(object):
         :type forum: str, optional
         :param invitation: An Invitation ID. If provided, returns Tags whose "invitation" field is this Invitation ID.
         :type invitation: str, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Tag objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of tags
         :rtype: list[Tag]
@@ -1654,13 +2025,14 @@ class OpenReviewClient(object):
         response = self.session.get(self.tags_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        tags = [Tag.from_json(t) for t in response.json()['tags']]
+        response_json = response.json()
+        tags = response_json['tags'] if raw else [Tag.from_json(t) for t in response_json['tags']]
         if with_count and params.get('offset') is None:
-            return tags, response.json()['count']
+            return tags, response_json['count']
 
         return tags
 
-    def get_all_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None):
+    def get_all_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None, raw=False):
         """
         Gets a list of Tag objects based on the filters provided. The Tags that will be returned match all the criteria passed in the parameters.
 
@@ -1670,6 +2042,8 @@ class OpenReviewClient(object):
         :type forum: str, optional
         :param invitation: An Invitation ID. If provided, returns Tags whose "invitation" field is this Invitation ID.
         :type invitation: str, optional
+        :param raw: If True, returns the json dicts returned by the API instead of Tag objects, which is faster when only a few fields are needed
+        :type raw: bool, optional
 
         :return: List of tags
         :rtype: list[Tag]
@@ -1684,12 +2058,34 @@ class OpenReviewClient(object):
             'tag': tag,
             'limit': limit,
             'offset': offset,
-            'with_count': with_count
+            'with_count': with_count,
+            'raw': raw
         }
 
         return tools.concurrent_get(self, self.get_tags, **params)
 
-    def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None):
+    def iter_tags(self, max_pages=2, **params):
+        """
+        Returns a generator over all the Tags that match the filters provided. Unlike :meth:`get_all_tags`, the Tags are not
+        loaded at once: the next pages are requested in the background while the current one is consumed and at most `max_pages`
+        pages are held in memory.
+
+        :param max_pages: Maximum number of pages fetched and not consumed yet
+        :type max_pages: int, optional
+        :param params: Filters accepted by :meth:`get_tags`
+        :type params: dict
+
+        :return: Generator over the Tags
+        :rtype: generator[Tag]
+
+        Example:
+
+        >>> for tag in client.iter_tags(invitation='ICML.cc/2025/Conference/Reviewers/-/Bid'):
+        ...     print(tag.tag)
+        """
+        return tools.prefetch_iterget(self.get_tags, max_pages=max_pages, paginate_by='offset', **params)
+
+    def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, raw=False):
         """
         Returns a list of Edge objects based on the filters provided.
 
@@ -1698,6 +2094,7 @@ class OpenReviewClient(object):
         :arg head: Profile ID of the Profile that is connected to the Note ID in tail
         :arg tail: Note ID of the Note that is connected to the Profile ID in head
         :arg label: Label ID of the match
+        :arg raw: If True, returns the json dicts returned by the API instead of Edge objects, which is faster when only a few fields are needed
         """
         params = {}
 
@@ -1715,14 +2112,15 @@ class OpenReviewClient(object):
         response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        edges = [Edge.from_json(e) for e in response.json()['edges']]
+        response_json = response.json()
+        edges = response_json['edges'] if raw else [Edge.from_json(e) for e in response_json['edges']]
 
         if with_count and params.get('offset') is None:
-            return edges, response.json()['count']
+            return edges, response_json['count']
 
         return edges
 
-    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None):
+    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, as_frame=False, raw=False):
         """
         Returns a list of Edge objects based on the filters provided.
 
@@ -1731,6 +2129,8 @@ class OpenReviewClient(object):
         :arg head: Profile ID of the Profile that is connected to the Note ID in tail
         :arg tail: Note ID of the Note that is connected to the Profile ID in head
         :arg label: Label ID of the match
+        :arg as_frame: If True, returns an :class:`EdgeFrame` instead of a list of Edge objects. `limit` and `offset` are honoured and the pages are requested concurrently.
+        :arg raw: If True, returns the json dicts returned by the API instead of Edge objects, which is faster when only a few fields are needed
         """
         params = {
             'id': id,
@@ -1741,11 +2141,39 @@ class OpenReviewClient(object):
             'limit': limit,
             'offset': offset,
             'with_count': with_count,
-            'trash': trash
+            'trash': trash,
+            'raw': raw
         }
 
+        if as_frame:
+            from .edge_frame import EdgeFrame
+            ## the pages are requested concurrently as json dicts and added to the frame as they arrive
+            params.update({ 'with_count': None, 'raw': True })
+            return EdgeFrame.from_edges(tools.concurrent_iterget(self, self.get_edges, **params))
+
         return tools.concurrent_get(self, self.get_edges, **params)
 
+    def iter_edges(self, max_pages=2, **params):
+        """
+        Returns a generator over all the Edges that match the filters provided. Unlike :meth:`get_all_edges`, the Edges are not
+        loaded at once: the next pages are requested in the background while the current one is consumed and at most `max_pages`
+        pages are held in memory.
+
+        :param max_pages: Maximum number of pages fetched and not consumed yet
+        :type max_pages: int, optional
+        :param params: Filters accepted by :meth:`get_edges`
+        :type params: dict
+
+        :return: Generator over the Edges
+        :rtype: generator[Edge]
+
+        Example:
+
+        >>> for edge in client.iter_edges(invitation='ICML.cc/2025/Conference/Reviewers/-/Affinity_Score'):
+        ...     print(edge.head, edge.tail, edge.weight)
+        """
+        return tools.prefetch_iterget(self.get_edges, max_pages=max_pages, paginate_by='offset', **params)
+
     def get_edges_count(self, id = None, invitation = None, head = None, tail = None, label = None):
         """
         Returns a list of Edge objects based on the filters provided.
@@ -1946,6 +2374,7 @@ class OpenReviewClient(object):
         """
         response = self.session.delete(self.notes_url, json = {'id': note_id}, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache('note', note_id)
         return response.json()
 
     def delete_profile_reference(self, reference_id):
@@ -1975,6 +2404,7 @@ class OpenReviewClient(object):
         """
         response = self.session.delete(self.groups_url, json = {'id': group_id}, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache('group', group_id)
         return response.json()
 
     def delete_institution(self, institution_id):
@@ -2139,7 +2569,7 @@ class OpenReviewClient(object):
 
         return response.json()
 
-    def add_members_to_group(self, group, members):
+    def add_members_to_group(self, group, members, return_result=True, prefetched_group=None):
         """
         Adds members to a group
 
@@ -2147,12 +2577,19 @@ class OpenReviewClient(object):
         :type group: Group or str
         :param members: Members that will be added to the group. Members should be in a string, unicode or a list format
         :type members: str, list, unicode
+        :param return_result: If False, the group is not requested again after the edit and None is returned
+        :type return_result: bool, optional
+        :param prefetched_group: Group already loaded, used to get the domain and signatures of the edit instead of requesting the group
+        :type prefetched_group: Group, optional
 
         :return: Group with the members added
         :rtype: Group
         """
         def add_member(group, members):
-            group = self.get_group(group) if type(group) in string_types else group
+            if prefetched_group is not None:
+                group = prefetched_group
+            elif type(group) in string_types:
+                group = self.get_group(group)
             self.post_group_edit(invitation = f'{group.domain}/-/Edit', 
                 signatures = group.signatures, 
                 group = Group(
@@ -2164,7 +2601,8 @@ class OpenReviewClient(object):
                 readers=group.signatures, 
                 writers=group.signatures
             )
-            return self.get_group(group.id)
+            if return_result:
+                return self.get_group(group.id)
 
         member_type = type(members)
         if member_type in string_types:
@@ -2173,7 +2611,7 @@ class OpenReviewClient(object):
             return add_member(group, members)
         raise OpenReviewException("add_members_to_group()- members '"+str(members)+"' ("+str(member_type)+") must be a str, unicode or list, but got " + repr(member_type) + " instead")
 
-    def remove_members_from_group(self, group, members):
+    def remove_members_from_group(self, group, members, return_result=True, prefetched_group=None):
         """
         Removes members from a group
 
@@ -2181,13 +2619,21 @@ class OpenReviewClient(object):
         :type group: Group or str
         :param members: Members that will be removed. Members should be in a string, unicode or a list format
         :type members: str, list, unicode
+        :param return_result: If False, the group is not requested again after the edit and None is returned
+        :type return_result: bool, optional
+        :param prefetched_group: Group already loaded with :meth:`get_group`, used to get the domain, signatures and
+            anonymous ids of the members instead of requesting the group
+        :type prefetched_group: Group, optional
 
         :return: Group without the members that were removed
         :type: Group
         """
         def remove_member(group, members):
             members_to_remove = list(set(members))
-            group = self.get_group(group if type(group) in string_types else group.id)
+            if prefetched_group is not None:
+                group = prefetched_group
+            else:
+                group = self.get_group(group if type(group) in string_types else group.id)
 
             members_to_remove = group.transform_to_anon_ids(members_to_remove)
 
@@ -2202,7 +2648,8 @@ class OpenReviewClient(object):
                 readers=group.signatures, 
                 writers=group.signatures
             )
-            return self.get_group(group.id)                      
+            if return_result:
+                return self.get_group(group.id)
 
         member_type = type(members)
         if member_type in string_types:
@@ -2349,6 +2796,7 @@ class OpenReviewClient(object):
 
         response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_edit(response.json(), edit_json)
 
         if await_process:
             self.__await_process(response.json()['id'])
@@ -2380,6 +2828,7 @@ class OpenReviewClient(object):
 
         response = self.session.post(self.note_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_edit(response.json(), edit_json)
 
         if await_process:
             self.__await_process(response.json()['id'])
@@ -2415,6 +2864,7 @@ class OpenReviewClient(object):
         response = self.__handle_response(response)
 
         posted_edit = response.json()
+        self.__invalidate_edit(posted_edit, edit_json)
         members = posted_edit.get('group', {}).get('members')
         if posted_edit['domain'] in posted_edit['signatures']:
             if flush_members_cache:
@@ -2450,6 +2900,7 @@ class OpenReviewClient(object):
             response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
 
         response = self.__handle_response(response)
+        self.__invalidate_edit(response.json(), edit_json)
 
         return response.json()
 
@@ -2598,22 +3049,9 @@ class OpenReviewClient(object):
             return { 'results': [] }
 
         if wait_for_complete:
-            call_count = 0
-            status_response = self.get_expertise_status(job_id, baseurl=base_url)
-            status = status_response.get('status')
-            while status not in ['Completed', 'Error'] and call_count < call_max:
-                time.sleep(60)
-                status_response = self.get_expertise_status(job_id)
-                status = status_response.get('status')
-                call_count += 1
-
-            if 'Completed' == status:
-                return self.get_expertise_results(job_id, baseurl=base_url)
-            if 'Error' == status:
-                raise OpenReviewException('There was an error computing scores, description: ' + status_response.get('description'))
-            if call_count == call_max:
-                raise OpenReviewException('Time out computing scores, description: ' + status_response.get('description'))
-            raise OpenReviewException('Unknown error, description: ' + status_response.get('description'))
+            from ..expertise import ExpertiseJobTracker
+            ExpertiseJobTracker(self, baseurl=base_url, timeout=call_max * 60).wait_for(job_id)
+            return self.get_expertise_results(job_id, baseurl=base_url)
         else:
             response = self.session.get(base_url + '/expertise/results', params = {'jobId': job_id}, headers = self.headers)
             response = self.__handle_response(response)
@@ -2621,6 +3059,13 @@ class OpenReviewClient(object):
             return response.json()
 
 
+def slot_vars(obj):
+    """
+    Returns the attributes of an object that uses __slots__, like vars() does for regular objects
+    """
+    return { attr: getattr(obj, attr, None) for attr in obj.__slots__ }
+
+
 class Edit(object):
     """
     :param id: Edit id
@@ -2763,6 +3208,10 @@ class Note(object):
     """
     TODO: write docs
     """
+    __slots__ = ('id', 'number', 'cdate', 'pdate', 'odate', 'mdate', 'tcdate', 'tmdate', 'ddate', 'content', 'forum',
+        'replyto', 'readers', 'nonreaders', 'signatures', 'writers', 'details', 'invitations', 'parent_invitations',
+        'domain', 'license')
+
     def __init__(self,
         invitations=None,
         parent_invitations=None,
@@ -2810,12 +3259,12 @@ class Note(object):
         self.license = license
 
     def __repr__(self):
-        content = ','.join([("%s = %r" % (attr, value)) for attr, value in vars(self).items()])
+        content = ','.join([("%s = %r" % (attr, value)) for attr, value in slot_vars(self).items()])
         return 'Note(' + content + ')'
 
     def __str__(self):
         pp = pprint.PrettyPrinter()
-        return pp.pformat(vars(self))
+        return pp.pformat(slot_vars(self))
 
     def to_json(self):
         """
@@ -3157,6 +3606,9 @@ class Invitation(object):
             invitation.type = 'Message'
         return invitation
 class Edge(object):
+    __slots__ = ('id', 'invitation', 'domain', 'head', 'tail', 'weight', 'label', 'cdate', 'ddate', 'readers',
+        'nonreaders', 'writers', 'signatures', 'tcdate', 'tmdate', 'tddate', 'tauthor')
+
     def __init__(self, head, tail, invitation, domain=None, readers=None, writers=None, signatures=None, id=None, weight=None, label=None, cdate=None, ddate=None, nonreaders=None, tcdate=None, tmdate=None, tddate=None, tauthor=None):
         self.id = id
         self.invitation = invitation
@@ -3235,12 +3687,12 @@ class Edge(object):
         return edge
 
     def __repr__(self):
-        content = ','.join([("%s = %r" % (attr, value)) for attr, value in vars(self).items()])
+        content = ','.join([("%s = %r" % (attr, value)) for attr, value in slot_vars(self).items()])
         return 'Edge(' + content + ')'
 
     def __str__(self):
         pp = pprint.PrettyPrinter()
-        return pp.pformat(vars(self))
+        return pp.pformat(slot_vars(self))
 
 class Group(object):
     """
@@ -3275,6 +3727,10 @@ class Group(object):
     :param details:
     :type details: optional
     """
+    __slots__ = ('id', 'invitation', 'invitations', 'parent_invitations', 'content', 'cdate', 'ddate', 'tcdate',
+        'tmdate', 'writers', 'members', 'readers', 'nonreaders', 'signatures', 'signatories', 'anonids', 'web',
+        'impersonators', 'host', 'domain', 'parent', 'deanonymizers', 'details', 'anon_members')
+
     def __init__(self, id=None, content=None, readers=None, writers=None, signatories=None, signatures=None, invitation=None, invitations=None, parent_invitations=None, cdate = None, ddate = None, tcdate=None, tmdate=None, members = None, nonreaders = None, impersonators=None, web = None, anonids= None, deanonymizers=None, host=None, domain=None, parent = None, details = None):
         # post attributes
         self.id=id
@@ -3310,12 +3766,12 @@ class Group(object):
         return default_value
 
     def __repr__(self):
-        content = ','.join([("%s = %r" % (attr, value)) for attr, value in vars(self).items()])
+        content = ','.join([("%s = %r" % (attr, value)) for attr, value in slot_vars(self).items()])
         return 'Group(' + content + ')'
 
     def __str__(self):
         pp = pprint.PrettyPrinter()
-        return pp.pformat(vars(self))
+        return pp.pformat(slot_vars(self))
 
 
     def to_json(self):
@@ -3464,14 +3920,27 @@ class Group(object):
         with open(web) as f:
             self.web = f.read()
 
-    def post(self, client):
+    def post(self, client, return_result=False):
         """
-        Posts a group to OpenReview
+        Posts a group to OpenReview using the edit invitation of its domain
 
         :param client: Client that will post the Group
-        :type client: Client
+        :type client: OpenReviewClient
+        :param return_result: If True, the group is requested after the edit and returned
+        :type return_result: bool, optional
+
+        :return: Group posted if return_result is True, None otherwise
+        :rtype: Group
         """
-        client.post_group(self)
+        client.post_group_edit(
+            invitation = f'{self.domain}/-/Edit',
+            readers = [self.domain],
+            writers = [self.domain],
+            signatures = [self.domain],
+            group = self
+        )
+        if return_result:
+            return client.get_group(self.id)
 
 
     def transform_to_anon_ids(self, elements):
@@ -3507,6 +3976,9 @@ class Tag(object):
     :param nonreaders: List of nonreaders in the Invitation, each nonreader is a Group id
     :type nonreaders: list[str], optional
     """
+    __slots__ = ('id', 'cdate', 'tcdate', 'tmdate', 'ddate', 'tag', 'parent_invitations', 'forum', 'invitation',
+        'readers', 'writers', 'nonreaders', 'signature', 'profile', 'weight', 'label', 'note')
+
     def __init__(self, invitation, signature=None, tag=None, readers=None, writers=None, id=None, parent_invitations=None, cdate=None, tcdate=None, tmdate=None, ddate=None, forum=None, nonreaders=None, profile=None, weight=None, label=None, note=None):
         self.id = id
         self.cdate = cdate
@@ -3613,11 +4085,11 @@ class Tag(object):
         return tag
 
     def __repr__(self):
-        content = ','.join([("%s = %r" % (attr, value)) for attr, value in vars(self).items()])
+        content = ','.join([("%s = %r" % (attr, value)) for attr, value in slot_vars(self).items()])
         return 'Tag(' + content + ')'
 
     def __str__(self):
         pp = pprint.PrettyPrinter()
-        return pp.pformat(vars(self))            
+        return pp.pformat(slot_vars(self))            
 
 
@@ -0,0 +1,377 @@
+from array import array
+
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from ..openreview import OpenReviewException
+from .client import Edge
+
+
+class EdgeFrame(object):
+    """
+    Columnar representation of a list of Edges. Heads, tails, invitations and labels are interned: each column stores integer
+    codes into a table of unique values, and weights are stored as floats. This uses a fraction of the memory of a list of
+    :class:`Edge` objects and allows to group millions of edges by head or tail without creating Python objects per edge.
+
+    Only the id, invitation, head, tail, weight and label of the edges are kept. Edges without weight have a NaN weight and
+    edges without label have the label code -1.
+
+    Example:
+
+    >>> frame = client.get_all_edges(invitation='ICML.cc/2025/Conference/Reviewers/-/Affinity_Score', as_frame=True)
+    >>> for paper_id, scores in frame.groupby('head'):
+    ...     top_reviewers = scores.tail_ids[np.argsort(-scores.weights)[:10]]
+
+    :param head_codes: Index of the head of each edge in `heads`
+    :type head_codes: numpy.ndarray
+    :param tail_codes: Index of the tail of each edge in `tails`
+    :type tail_codes: numpy.ndarray
+    :param weights: Weight of each edge
+    :type weights: numpy.ndarray
+    :param heads: Unique head ids
+    :type heads: numpy.ndarray
+    :param tails: Unique tail ids
+    :type tails: numpy.ndarray
+    :param label_codes: Index of the label of each edge in `labels`, -1 if the edge has no label
+    :type label_codes: numpy.ndarray, optional
+    :param labels: Unique labels
+    :type labels: numpy.ndarray, optional
+    :param invitation_codes: Index of the invitation of each edge in `invitations`
+    :type invitation_codes: numpy.ndarray, optional
+    :param invitations: Unique invitation ids
+    :type invitations: numpy.ndarray, optional
+    :param ids: Id of each edge, None if the edges were not posted yet
+    :type ids: numpy.ndarray, optional
+    """
+
+    def __init__(self, head_codes, tail_codes, weights, heads, tails, label_codes=None, labels=None, invitation_codes=None, invitations=None, ids=None):
+        self.head_codes = np.asarray(head_codes, dtype=np.int32)
+        self.tail_codes = np.asarray(tail_codes, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.heads = np.asarray(heads, dtype=object)
+        self.tails = np.asarray(tails, dtype=object)
+        size = len(self.head_codes)
+        self.label_codes = np.full(size, -1, dtype=np.int32) if label_codes is None else np.asarray(label_codes, dtype=np.int32)
+        self.labels = np.asarray([] if labels is None else labels, dtype=object)
+        self.invitation_codes = np.full(size, -1, dtype=np.int32) if invitation_codes is None else np.asarray(invitation_codes, dtype=np.int32)
+        self.invitations = np.asarray([] if invitations is None else invitations, dtype=object)
+        self.ids = None if ids is None else np.asarray(ids, dtype=object)
+
+        for column in [self.tail_codes, self.weights, self.label_codes, self.invitation_codes] + ([self.ids] if self.ids is not None else []):
+            if len(column) != size:
+                raise OpenReviewException('All the columns of an EdgeFrame must have the same length')
+
+    def __len__(self):
+        return len(self.head_codes)
+
+    def __repr__(self):
+        return 'EdgeFrame(edges = {}, heads = {}, tails = {}, invitations = {})'.format(len(self), len(self.heads), len(self.tails), list(self.invitations))
+
+    @property
+    def head_ids(self):
+        """
+        Head id of each edge
+        """
+        return self.heads[self.head_codes]
+
+    @property
+    def tail_ids(self):
+        """
+        Tail id of each edge
+        """
+        return self.tails[self.tail_codes]
+
+    @property
+    def label_values(self):
+        """
+        Label of each edge, None if the edge has no label
+        """
+        values = np.empty(len(self), dtype=object)
+        has_label = self.label_codes >= 0
+        values[has_label] = self.labels[self.label_codes[has_label]]
+        return values
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Creates an EdgeFrame from Edge objects or edge json dicts. The edges are consumed one by one, so passing a
+        generator like :meth:`OpenReviewClient.iter_edges` avoids loading all the Edge objects at once.
+
+        :param edges: Edges to convert
+        :type edges: iterable[Edge] or iterable[dict]
+
+        :return: EdgeFrame with the edges
+        :rtype: EdgeFrame
+        """
+        heads, tails, labels, invitations = {}, {}, {}, {}
+        head_codes, tail_codes, label_codes, invitation_codes = array('i'), array('i'), array('i'), array('i')
+        weights = array('d')
+        ids = []
+        nan = float('nan')
+
+        for edge in edges:
+            if isinstance(edge, dict):
+                head, tail, invitation, label, weight, id = edge.get('head'), edge.get('tail'), edge.get('invitation'), edge.get('label'), edge.get('weight'), edge.get('id')
+            else:
+                head, tail, invitation, label, weight, id = edge.head, edge.tail, edge.invitation, edge.label, edge.weight, edge.id
+            head_codes.append(heads.setdefault(head, len(heads)))
+            tail_codes.append(tails.setdefault(tail, len(tails)))
+            invitation_codes.append(invitations.setdefault(invitation, len(invitations)))
+            label_codes.append(-1 if label is None else labels.setdefault(label, len(labels)))
+            weights.append(nan if weight is None else weight)
+            ids.append(id)
+
+        return cls(
+            head_codes=np.frombuffer(head_codes, dtype=np.int32) if head_codes else [],
+            tail_codes=np.frombuffer(tail_codes, dtype=np.int32) if tail_codes else [],
+            weights=np.frombuffer(weights, dtype=np.float64) if weights else [],
+            heads=list(heads),
+            tails=list(tails),
+            label_codes=np.frombuffer(label_codes, dtype=np.int32) if label_codes else [],
+            labels=list(labels),
+            invitation_codes=np.frombuffer(invitation_codes, dtype=np.int32) if invitation_codes else [],
+            invitations=list(invitations),
+            ids=ids if any(id is not None for id in ids) else None
+        )
+
+    @classmethod
+    def from_grouped_edges(cls, grouped_edges, invitation=None, groupby='head'):
+        """
+        Creates an EdgeFrame from the result of :meth:`OpenReviewClient.get_grouped_edges`
+
+        :param grouped_edges: Groups of edges, each one of the form {id: {head: paper-1}, values: [{tail: user-1, weight: 0.5}]}
+        :type grouped_edges: list[dict]
+        :param invitation: Invitation of the edges
+        :type invitation: str, optional
+        :param groupby: Field used to group the edges, 'head' or 'tail'
+        :type groupby: str, optional
+
+        :return: EdgeFrame with the edges
+        :rtype: EdgeFrame
+        """
+        other = 'tail' if groupby == 'head' else 'head'
+
+        def edges():
+            for group in grouped_edges:
+                key = group['id'][groupby]
+                for value in group['values']:
+                    yield Edge(**{
+                        groupby: key,
+                        other: value.get(other),
+                        'invitation': value.get('invitation', invitation),
+                        'weight': value.get('weight'),
+                        'label': value.get('label'),
+                        'id': value.get('id')
+                    })
+
+        return cls.from_edges(edges())
+
+    def to_edges(self, readers=None, writers=None, signatures=None, nonreaders=None):
+        """
+        Converts the frame to a list of Edge objects
+
+        :param readers: Readers of the edges, the same for all of them
+        :type readers: list[str], optional
+        :param writers: Writers of the edges, the same for all of them
+        :type writers: list[str], optional
+        :param signatures: Signatures of the edges, the same for all of them
+        :type signatures: list[str], optional
+        :param nonreaders: Nonreaders of the edges, the same for all of them
+        :type nonreaders: list[str], optional
+
+        :return: List of Edges
+        :rtype: list[Edge]
+        """
+        edges = []
+        invitations = list(self.invitations)
+        labels = list(self.labels)
+        heads = self.head_ids.tolist()
+        tails = self.tail_ids.tolist()
+        weights = self.weights.tolist()
+        ids = self.ids.tolist() if self.ids is not None else [None] * len(self)
+        for index, (label_code, invitation_code) in enumerate(zip(self.label_codes.tolist(), self.invitation_codes.tolist())):
+            weight = weights[index]
+            edges.append(Edge(
+                id=ids[index],
+                invitation=invitations[invitation_code] if invitation_code >= 0 else None,
+                head=heads[index],
+                tail=tails[index],
+                weight=None if weight != weight else weight,
+                label=labels[label_code] if label_code >= 0 else None,
+                readers=readers,
+                writers=writers,
+                signatures=signatures,
+                nonreaders=nonreaders
+            ))
+        return edges
+
+    def take(self, indices):
+        """
+        Returns a new EdgeFrame with the edges at the given positions. The tables of unique values are shared with this frame.
+
+        :param indices: Positions or boolean mask of the edges to keep
+        :type indices: numpy.ndarray
+
+        :return: EdgeFrame with the selected edges
+        :rtype: EdgeFrame
+        """
+        return EdgeFrame(
+            head_codes=self.head_codes[indices],
+            tail_codes=self.tail_codes[indices],
+            weights=self.weights[indices],
+            heads=self.heads,
+            tails=self.tails,
+            label_codes=self.label_codes[indices],
+            labels=self.labels,
+            invitation_codes=self.invitation_codes[indices],
+            invitations=self.invitations,
+            ids=self.ids[indices] if self.ids is not None else None
+        )
+
+    def groupby(self, by='head'):
+        """
+        Groups the edges by head or tail. The edges are sorted once by the interned codes, so grouping millions of edges
+        takes a single pass over the arrays.
+
+        :param by: 'head' or 'tail'
+        :type by: str, optional
+
+        :return: Generator of (id, EdgeFrame) tuples, one per unique head or tail
+        :rtype: generator
+        """
+        if by not in ['head', 'tail']:
+            raise OpenReviewException('EdgeFrame can only be grouped by head or tail')
+
+        codes = self.head_codes if by == 'head' else self.tail_codes
+        values = self.heads if by == 'head' else self.tails
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+        starts = np.concatenate(([0], boundaries)) if len(sorted_codes) else np.array([], dtype=np.int64)
+        ends = np.concatenate((boundaries, [len(sorted_codes)])) if len(sorted_codes) else np.array([], dtype=np.int64)
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            yield values[sorted_codes[start]], self.take(order[start:end])
+
+    def to_dict(self, by='head', value='weight'):
+        """
+        Converts the frame to a dict of dicts keyed by head and tail, or tail and head, the structure used by the matching code.
+
+        :param by: Key of the outer dict, 'head' or 'tail'
+        :type by: str, optional
+        :param value: Field used as value of the inner dict, 'weight' or 'label'
+        :type value: str, optional
+
+        :return: Dict of dicts, for example {paper_id: {reviewer_id: weight}}
+        :rtype: dict
+        """
+        values = self.weights.tolist() if value == 'weight' else self.label_values.tolist()
+        outer = self.head_ids.tolist() if by == 'head' else self.tail_ids.tolist()
+        inner = self.tail_ids.tolist() if by == 'head' else self.head_ids.tolist()
+        result = {}
+        for key, other, v in zip(outer, inner, values):
+            result.setdefault(key, {})[other] = v
+        return result
+
+    def to_arrow(self):
+        """
+        Converts the frame to an Arrow table with dictionary encoded head, tail, invitation and label columns.
+        Requires the `pyarrow` package, it can be installed with `pip install openreview-py[arrow]`.
+
+        :return: Arrow table with the edges
+        :rtype: pyarrow.Table
+        """
+        if pyarrow is None:
+            raise OpenReviewException('pyarrow is required to convert an EdgeFrame to Arrow, install it with `pip install openreview-py[arrow]`')
+
+        def dictionary(codes, values):
+            return pyarrow.DictionaryArray.from_arrays(
+                pyarrow.array(codes, mask=codes < 0, type=pyarrow.int32()),
+                pyarrow.array(values.tolist(), type=pyarrow.string())
+            )
+
+        columns = {
+            'invitation': dictionary(self.invitation_codes, self.invitations),
+            'head': dictionary(self.head_codes, self.heads),
+            'tail': dictionary(self.tail_codes, self.tails),
+            'weight': pyarrow.array(self.weights, mask=np.isnan(self.weights)),
+            'label': dictionary(self.label_codes, self.labels)
+        }
+        if self.ids is not None:
+            columns['id'] = pyarrow.array(self.ids.tolist(), type=pyarrow.string())
+        return pyarrow.table(columns)
+
+    @classmethod
+    def from_arrow(cls, table):
+        """
+        Creates an EdgeFrame from an Arrow table with head, tail and optionally invitation, weight, label and id columns
+
+        :param table: Arrow table with the edges
+        :type table: pyarrow.Table
+
+        :return: EdgeFrame with the edges
+        :rtype: EdgeFrame
+        """
+        if pyarrow is None:
+            raise OpenReviewException('pyarrow is required to convert an EdgeFrame from Arrow, install it with `pip install openreview-py[arrow]`')
+
+        def codes_and_values(name):
+            if name not in table.column_names:
+                return np.full(table.num_rows, -1, dtype=np.int32), []
+            column = table.column(name).combine_chunks()
+            if not pyarrow.types.is_dictionary(column.type):
+                column = column.dictionary_encode()
+            codes = column.indices.to_numpy(zero_copy_only=False)
+            codes = np.where(column.is_null().to_numpy(zero_copy_only=False), -1, codes).astype(np.int32)
+            return codes, column.dictionary.to_pylist()
+
+        head_codes, heads = codes_and_values('head')
+        tail_codes, tails = codes_and_values('tail')
+        invitation_codes, invitations = codes_and_values('invitation')
+        label_codes, labels = codes_and_values('label')
+        if 'weight' in table.column_names:
+            weights = table.column('weight').combine_chunks().to_numpy(zero_copy_only=False).astype(np.float64)
+        else:
+            weights = np.full(table.num_rows, np.nan)
+
+        return cls(
+            head_codes=head_codes,
+            tail_codes=tail_codes,
+            weights=weights,
+            heads=heads,
+            tails=tails,
+            label_codes=label_codes,
+            labels=labels,
+            invitation_codes=invitation_codes,
+            invitations=invitations,
+            ids=table.column('id').to_pylist() if 'id' in table.column_names else None
+        )
+
+    def to_parquet(self, path):
+        """
+        Writes the frame to a Parquet file
+
+        :param path: Path of the file
+        :type path: str
+        """
+        pyarrow.parquet.write_table(self.to_arrow(), path)
+
+    @classmethod
+    def read_parquet(cls, path):
+        """
+        Reads an EdgeFrame from a Parquet file written by :meth:`to_parquet`
+
+        :param path: Path of the file
+        :type path: str
+
+        :return: EdgeFrame with the edges
+        :rtype: EdgeFrame
+        """
+        if pyarrow is None:
+            raise OpenReviewException('pyarrow is required to read Parquet files, install it with `pip install openreview-py[arrow]`')
+        return cls.from_arrow(pyarrow.parquet.read_table(path))
@@ -180,8 +180,8 @@ class InvitationBuilder(object):
         process_invitation = self.save_invitation(process_invitation, replacement=False)
         return process_invitation
         
-    def save_invitation(self, invitation, replacement=None):
-        return self.venue_invitation_builder.save_invitation(invitation, replacement)
+    def save_invitation(self, invitation, replacement=None, return_result=True, prefetched_invitation=None):
+        return self.venue_invitation_builder.save_invitation(invitation, replacement, return_result=return_result, prefetched_invitation=prefetched_invitation)
 
     def expire_invitation(self, invitation_id):
         return self.venue_invitation_builder.expire_invitation(invitation_id)
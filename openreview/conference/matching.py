@@ -52,6 +52,7 @@ class Matching(object):
         self.client = conference.client
         self.match_group = match_group
         self.alternate_matching_group = alternate_matching_group
+        self.profile_info_cache = None #expects an openreview.conflicts.ProfileInfoCache, for example with a path to reuse the info of unchanged profiles
         self.is_reviewer = conference.get_reviewers_id() == match_group.id
         self.is_area_chair = conference.get_area_chairs_id() == match_group.id
         self.is_senior_area_chair = conference.get_senior_area_chairs_id() == match_group.id
@@ -236,7 +237,12 @@ class Matching(object):
             other_matching_group = self.client.get_group(self.alternate_matching_group)
             other_matching_profiles = tools.get_profiles(self.client, other_matching_group.members)
             return self._build_profile_conflicts(other_matching_profiles, user_profiles)
-        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        try:
+            return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        finally:
+            ## persist the infos computed so far, even when the build fails
+            if self.profile_info_cache is not None:
+                self.profile_info_cache.flush()
 
     def append_note_conflicts(self, profile_id, build_conflicts=None):
         '''
@@ -252,6 +258,7 @@ class Matching(object):
         get_profile_info = openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info
         info_function = openreview.tools.info_function_builder(get_profile_info)
         user_profiles_info = [info_function(p) for p in user_profiles]
+        user_engine = openreview.conflicts.ConflictEngine(user_profiles_info, rules=openreview.conflicts.CONFERENCE_RULES)
 
         # Re-setup information that would have been initialized in setup()
         submissions = self.conference.client.get_all_notes(
@@ -275,41 +282,24 @@ class Matching(object):
 
             # Extract domains from each profile
             author_profiles = tools.get_profiles(self.client, authorids, with_publications=True)
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()
-
-            for author_profile in author_profiles:
-                author_info = info_function(author_profile)
-                author_domains.update(author_info['domains'])
-                author_emails.update(author_info['emails'])
-                author_relations.update(author_info['relations'])
-                author_publications.update(author_info['publications'])
+            author_info = openreview.conflicts.merge_infos([info_function(author_profile) for author_profile in author_profiles])
 
             # Compute conflicts for the user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection(user_info['emails']))
-                conflicts.update(author_emails.intersection(user_info['relations']))
-                conflicts.update(author_emails.intersection(user_info['emails']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation.id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
+            for code in user_engine.conflicts(author_info):
+                user_info = user_profiles_info[code]
+                edges.append(Edge(
+                    invitation=invitation.id,
+                    head=submission.id,
+                    tail=user_info['id'],
+                    weight=-1,
+                    label='Conflict',
+                    readers=self._get_edge_readers(tail=user_info['id']),
+                    writers=[self.conference.id],
+                    signatures=[self.conference.id]
+                ))
 
         ## Delete any previous conflicts related to single user
-        self.client.delete_edges(invitation.id, tail=user_info['id'], wait_to_finish=True)
+        self.client.delete_edges(invitation.id, tail=user_profiles_info[-1]['id'], wait_to_finish=True)
 
         original_edges_posted = self.client.get_edges_count(invitation=invitation.id)
         openreview.tools.post_bulk_edges(client=self.client, edges=edges)
@@ -326,7 +316,8 @@ class Matching(object):
         '''
         Create conflict edges between the given Notes and Profiles
         '''
-        info_function = tools.info_function_builder(get_profile_info)
+        cache = self.profile_info_cache if self.profile_info_cache is not None else openreview.conflicts.ProfileInfoCache()
+        info_function = tools.info_function_builder(get_profile_info, cache=cache)
         invitation = self._create_edge_invitation(self.conference.get_conflict_score_id(self.match_group.id))
         # Get profile info from the match group
         user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
@@ -340,6 +331,7 @@ class Matching(object):
 
         author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, as_dict=True)
 
+        user_engine = openreview.conflicts.ConflictEngine(user_profiles_info, rules=openreview.conflicts.CONFERENCE_RULES)
         edges = []
 
         for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
@@ -349,40 +341,27 @@ class Matching(object):
                 authorids = submission.details['original']['content']['authorids']
 
             # Extract domains from each autyhorprofile
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()
+            author_infos = []
             for authorid in authorids:
                 if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_domains.update(author_info['domains'])
-                    author_emails.update(author_info['emails'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+                    author_infos.append(info_function(author_profile_by_id[authorid], compute_conflicts_n_years))
                 else:
                     print(f'Profile not found: {authorid}')
+            author_info = openreview.conflicts.merge_infos(author_infos)
 
             # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection(user_info['emails']))
-                conflicts.update(author_emails.intersection(user_info['relations']))
-                conflicts.update(author_emails.intersection(user_info['emails']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation.id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
+            for code in user_engine.conflicts(author_info):
+                user_info = user_profiles_info[code]
+                edges.append(Edge(
+                    invitation=invitation.id,
+                    head=submission.id,
+                    tail=user_info['id'],
+                    weight=-1,
+                    label='Conflict',
+                    readers=self._get_edge_readers(tail=user_info['id']),
+                    writers=[self.conference.id],
+                    signatures=[self.conference.id]
+                ))
 
         ## Delete previous conflicts
         self.client.delete_edges(invitation.id, wait_to_finish=True)
@@ -629,31 +608,19 @@ class Matching(object):
                 alternate_match_group = self.alternate_matching_group,
                 exclusion_inv=self.conference.get_expertise_selection_id(),
                 model=model)
-            status = ''
-            call_count = 0
-            while 'Completed' not in status and 'Error' not in status:
-                if call_count == 1440: ## one day to wait the completion or trigger a timeout
-                    break
-                time.sleep(60)
-                status_response = self.client.get_expertise_status(job_id['jobId'])
-                status = status_response.get('status')
-                desc = status_response.get('description')
-                call_count += 1
-            if 'Completed' in status:
-                result = self.client.get_expertise_results(job_id['jobId'])
-                matching_status['no_profiles'] = result['metadata']['no_profile']
-                matching_status['no_publications'] = result['metadata']['no_publications']
-
-                if self.alternate_matching_group:
-                    scores = [[entry['submission_member'], entry['match_member'], entry['score']] for entry in result['results']]
-                    return self._build_profile_scores(score_invitation_id, scores=scores), matching_status
-
-                scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
-                return self._build_note_scores(score_invitation_id, scores, submissions), matching_status
-            if 'Error' in status:
-                raise openreview.OpenReviewException('There was an error computing scores, description: ' + desc)
-            if call_count == 1440:
-                raise openreview.OpenReviewException('Time out computing scores, description: ' + desc)
+            ## one day to wait the completion or trigger a timeout
+            tracker = openreview.expertise.ExpertiseJobTracker(self.client, timeout=24 * 60 * 60)
+            tracker.wait_for(job_id['jobId'])
+            result = tracker.get_results(job_id['jobId'])
+            matching_status['no_profiles'] = result['metadata']['no_profile']
+            matching_status['no_publications'] = result['metadata']['no_publications']
+
+            if self.alternate_matching_group:
+                scores = [[entry['submission_member'], entry['match_member'], entry['score']] for entry in result['results']]
+                return self._build_profile_scores(score_invitation_id, scores=scores), matching_status
+
+            scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
+            return self._build_note_scores(score_invitation_id, scores, submissions), matching_status
         except openreview.OpenReviewException as e:
             raise openreview.OpenReviewException('There was an error connecting with the expertise API: ' + str(e))
 
@@ -896,7 +863,11 @@ class Matching(object):
         ## Compute conflicts for the matching group
         submissions = self.conference.client.get_all_notes(invitation=self.conference.get_blind_submission_id(), details='original')
         user_profiles = tools.get_profiles(self.client, self.match_group.members, with_publications=build_conflicts)
-        self._build_note_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info)
+        try:
+            self._build_note_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info)
+        finally:
+            if self.profile_info_cache is not None:
+                self.profile_info_cache.flush()
 
         ## Get proposed assignments and conflicts from both groups: match and alternate groups
         proposed_assignment_edges =  { e['id']['head']: [v['tail'] for v in e['values']][0] for e in self.client.get_grouped_edges(invitation=self.conference.get_paper_assignment_id(self.match_group.id),
@@ -0,0 +1,531 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import datetime
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openreview
+from tqdm import tqdm
+
+## (author field, user field) pairs: there is a conflict when a value of the author field is also a value of the user field
+VENUE_RULES = [
+    ('ids', 'id'),
+    ('domains', 'domains'),
+    ('relations', 'id'),
+    ('ids', 'relations'),
+    ('publications', 'publications')
+]
+
+CONFERENCE_RULES = [
+    ('domains', 'domains'),
+    ('relations', 'emails'),
+    ('emails', 'relations'),
+    ('emails', 'emails'),
+    ('publications', 'publications')
+]
+
+ALL_RULES = VENUE_RULES + [('emails', 'emails')]
+
+
+def merge_infos(infos):
+    """
+    Merges the profile info of several authors, as returned by :func:`openreview.tools.get_profile_info`, into a dict of
+    sets with the keys 'ids', 'domains', 'emails', 'relations' and 'publications'
+
+    :param infos: Profile info of the authors
+    :type infos: list[dict]
+
+    :return: Merged info
+    :rtype: dict
+    """
+    merged = { 'ids': set(), 'domains': set(), 'emails': set(), 'relations': set(), 'publications': set() }
+    for info in infos:
+        merged['ids'].add(info['id'])
+        merged['domains'].update(info.get('domains', []))
+        merged['emails'].update(info.get('emails', []))
+        merged['relations'].update(info.get('relations', []))
+        merged['publications'].update(info.get('publications', []))
+    return merged
+
+
+def shared_values(author_info, user_info, rules=VENUE_RULES):
+    """
+    Returns the values of the authors that are also values of the user, following the rules
+
+    :param author_info: Merged info of the authors, see :func:`merge_infos`
+    :type author_info: dict
+    :param user_info: Profile info of the user
+    :type user_info: dict
+    :param rules: List of (author field, user field) pairs that define a conflict
+    :type rules: list[tuple], optional
+
+    :return: Values that cause a conflict
+    :rtype: set[str]
+    """
+    reasons = set()
+    for author_field, user_field in rules:
+        values = [user_info[user_field]] if user_field == 'id' else user_info.get(user_field, [])
+        reasons.update(author_info[author_field].intersection(values))
+    return reasons
+
+
+def info_to_json(info):
+    return { field: { 'set': sorted(value) } if isinstance(value, (set, frozenset)) else value for field, value in info.items() }
+
+
+def info_from_json(info):
+    return { field: set(value['set']) if isinstance(value, dict) and list(value.keys()) == ['set'] else value for field, value in info.items() }
+
+
+class ConflictEngine(object):
+    """
+    Finds the users that conflict with a group of authors using inverted indexes. The indexes map every domain, relation,
+    email, publication and profile id of the users to the positions of the users that have it, and are built once, so
+    the conflicts of a paper are found with one lookup per author value instead of comparing the authors with every user.
+
+    The users that conflict with a paper are the same ones that intersecting the sets of the authors and of each user
+    would find, with the given rules.
+
+    Example:
+
+    >>> engine = ConflictEngine([info_function(p, n_years) for p in reviewer_profiles])
+    >>> for submission in submissions:
+    ...     authors = merge_infos([author_info_by_id[a] for a in submission.content['authorids']['value'] if a in author_info_by_id])
+    ...     conflicted_reviewers = [engine.user_infos[i]['id'] for i in engine.conflicts(authors)]
+
+    :param user_infos: Profile info of the users, as returned by :func:`openreview.tools.get_profile_info`
+    :type user_infos: list[dict]
+    :param rules: List of (author field, user field) pairs that define a conflict, see :data:`VENUE_RULES`
+    :type rules: list[tuple], optional
+    """
+
+    def __init__(self, user_infos, rules=VENUE_RULES):
+        self.user_infos = list(user_infos)
+        self.rules = rules
+        self.indexes = {}
+        for user_field in set(user_field for author_field, user_field in rules):
+            index = {}
+            for code, info in enumerate(self.user_infos):
+                values = [info[user_field]] if user_field == 'id' else info.get(user_field, [])
+                for value in values:
+                    index.setdefault(value, []).append(code)
+            self.indexes[user_field] = { value: np.array(codes, dtype=np.int64) for value, codes in index.items() }
+
+    def __len__(self):
+        return len(self.user_infos)
+
+    def conflicts(self, author_info):
+        """
+        Returns the positions of the users that conflict with the authors, in increasing order
+
+        :param author_info: Merged info of the authors, see :func:`merge_infos`
+        :type author_info: dict
+
+        :return: Positions of the conflicted users in `user_infos`
+        :rtype: numpy.ndarray
+        """
+        mask = self.conflicts_mask(author_info)
+        return np.flatnonzero(mask)
+
+    def conflicts_mask(self, author_info):
+        """
+        Returns a boolean array that is True for the users that conflict with the authors
+
+        :param author_info: Merged info of the authors, see :func:`merge_infos`
+        :type author_info: dict
+
+        :return: Mask over `user_infos`
+        :rtype: numpy.ndarray
+        """
+        mask = np.zeros(len(self.user_infos), dtype=bool)
+        for author_field, user_field in self.rules:
+            index = self.indexes[user_field]
+            for value in author_info[author_field]:
+                codes = index.get(value)
+                if codes is not None:
+                    mask[codes] = True
+        return mask
+
+    def conflicts_many(self, author_infos, workers=None, chunk_size=200, desc='Computing conflicts'):
+        """
+        Returns the positions of the users that conflict with each of the author infos. With more than one worker the
+        author infos are split in chunks that are processed by a pool of processes. The engine is passed to the
+        processes when they start, with the fork start method it is shared with them without being copied, so only the
+        author infos and the positions are sent between processes.
+
+        :param author_infos: Merged info of the authors of each paper, see :func:`merge_infos`
+        :type author_infos: list[dict]
+        :param workers: Number of processes, by default the conflicts are computed in this process
+        :type workers: int, optional
+        :param chunk_size: Number of author infos sent to a process at a time
+        :type chunk_size: int, optional
+
+        :return: Positions of the conflicted users for each author info, see :meth:`conflicts`
+        :rtype: list[numpy.ndarray]
+        """
+        if not workers or workers <= 1 or len(author_infos) <= chunk_size:
+            return [self.conflicts(author_info) for author_info in tqdm(author_infos, desc=desc)]
+
+        chunks = [author_infos[i:i + chunk_size] for i in range(0, len(author_infos), chunk_size)]
+        mp_context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=_set_worker_engine, initargs=(self,)) as executor:
+            for chunk_conflicts in tqdm(executor.map(_worker_conflicts, chunks), total=len(chunks), desc=desc):
+                results.extend(chunk_conflicts)
+        return results
+
+    def conflict_reasons(self, author_info, code):
+        """
+        Returns the values shared by the authors and the user at the given position
+
+        :param author_info: Merged info of the authors, see :func:`merge_infos`
+        :type author_info: dict
+        :param code: Position of the user in `user_infos`
+        :type code: int
+
+        :return: Values that cause the conflict
+        :rtype: set[str]
+        """
+        return shared_values(author_info, self.user_infos[code], self.rules)
+
+
+_worker_engine = None
+
+def _set_worker_engine(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+def _worker_conflicts(author_infos):
+    return [_worker_engine.conflicts(author_info) for author_info in author_infos]
+
+
+class ProfileInfoCache(object):
+    """
+    LRU cache for the profile info computed by the functions returned by :func:`openreview.tools.info_function_builder`,
+    so the info of an author that appears in many submissions is computed once. The entries are keyed by the profile id
+    and tmdate, the number of publications loaded in the profile and the latest publication tmdate, the policy, n_years,
+    the cut off year derived from it and the submission venue id, so a profile that changed is computed again.
+
+    If a path is passed the entries are also stored in a SQLite file and a later run that uses the same path reuses the
+    info of the profiles that did not change. Only profiles with a tmdate are stored on disk.
+
+    Example:
+
+    >>> cache = openreview.conflicts.ProfileInfoCache(path='profile_info.sqlite')
+    >>> info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info, cache=cache)
+    >>> infos = [info_function(profile, 3) for profile in profiles]
+    >>> cache.close()
+
+    :param max_size: Maximum number of entries kept in memory
+    :type max_size: int, optional
+    :param path: Path of the SQLite file used to persist the entries
+    :type path: str, optional
+    """
+
+    def __init__(self, max_size=100000, path=None):
+        self.max_size = max_size
+        self.path = path
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+        self.connection = None
+        self.pending = {}
+        if path:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.execute('CREATE TABLE IF NOT EXISTS profile_info (key TEXT PRIMARY KEY, info TEXT)')
+            self.connection.commit()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def key(profile, policy_function, n_years=None, submission_venueid=None):
+        publications = (profile.content or {}).get('publications', [])
+        publications_tmdate = max([getattr(p, 'tmdate', None) or 0 for p in publications], default=0)
+        cut_off_year = (datetime.datetime.now() - datetime.timedelta(days=365 * n_years)).year if n_years else -1
+        policy = '{}.{}'.format(getattr(policy_function, '__module__', ''), getattr(policy_function, '__qualname__', repr(policy_function)))
+        return json.dumps([profile.id, profile.tmdate, len(publications), publications_tmdate, policy, n_years, cut_off_year, submission_venueid])
+
+    @staticmethod
+    def encode(info):
+        return json.dumps(info_to_json(info))
+
+    @staticmethod
+    def decode(text):
+        return info_from_json(json.loads(text))
+
+    def get(self, key):
+        """
+        Returns the cached info for the key, looking in the SQLite file when it is not in memory
+
+        :return: Profile info or None
+        :rtype: dict
+        """
+        with self.lock:
+            info = self.entries.get(key)
+            if info is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return info
+            if self.connection is not None:
+                info = self.pending.get(key)
+                if info is None:
+                    row = self.connection.execute('SELECT info FROM profile_info WHERE key = ?', (key,)).fetchone()
+                    info = self.decode(row[0]) if row else None
+                if info is not None:
+                    self.__store(key, info)
+                    self.hits += 1
+                    return info
+            self.misses += 1
+            return None
+
+    def __store(self, key, info):
+        self.entries[key] = info
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def set(self, key, info, persist=True):
+        with self.lock:
+            self.__store(key, info)
+            if self.connection is not None and persist:
+                self.pending[key] = info
+                if len(self.pending) >= 1000:
+                    self.flush()
+
+    def get_or_compute(self, profile, policy_function, compute, n_years=None, submission_venueid=None):
+        """
+        Returns the cached info of the profile or computes it with `compute()` and caches it
+        """
+        key = self.key(profile, policy_function, n_years, submission_venueid)
+        info = self.get(key)
+        if info is None:
+            info = compute()
+            self.set(key, info, persist=profile.tmdate is not None)
+        return info
+
+    def flush(self):
+        """
+        Writes the new entries to the SQLite file
+        """
+        with self.lock:
+            if self.connection is None or not self.pending:
+                return
+            self.connection.executemany('INSERT OR REPLACE INTO profile_info (key, info) VALUES (?, ?)', [(key, self.encode(info)) for key, info in self.pending.items()])
+            self.connection.commit()
+            self.pending = {}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.pending = {}
+            if self.connection is not None:
+                self.connection.execute('DELETE FROM profile_info')
+                self.connection.commit()
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.flush()
+                self.connection.close()
+                self.connection = None
+
+
+class ConflictIndex(object):
+    """
+    Index of the merged author info of the papers of a venue and of the info of the profiles checked against them, to
+    answer whether a profile conflicts with a paper without loading the profiles of the authors every time. Papers and
+    profiles are added as they are needed and only computed again when they are older than `max_age_days`, when the
+    authors of the paper change, or when the tmdate of the profile, or of one of the author profiles, is not the one
+    stored in the index. The tmdates are checked by loading the profiles without their publications, which is much
+    cheaper than computing their info again. The index can be saved to a JSON file and loaded by the next run.
+
+    Example:
+
+    >>> index = openreview.conflicts.ConflictIndex.load('conflicts.json', client, policy='NeurIPS', n_years=3)
+    >>> index.add_paper(submission.id, submission.content['authorids']['value'])
+    >>> index.add_profile('~Reviewer_One1')
+    >>> index.conflicts(submission.id, '~Reviewer_One1')
+    ['umass.edu']
+    >>> index.save('conflicts.json')
+
+    :param client: Client used to load the profiles that are not passed to the index
+    :type client: OpenReviewClient
+    :param policy: 'default', 'NeurIPS' or a function, see :func:`openreview.tools.get_conflicts`
+    :type policy: str or function, optional
+    :param n_years: Number of years to be considered for conflict detection
+    :type n_years: int, optional
+    :param rules: List of (author field, user field) pairs that define a conflict
+    :type rules: list[tuple], optional
+    :param max_age_days: Number of days after which papers and profiles are computed again
+    :type max_age_days: float, optional
+    """
+
+    def __init__(self, client=None, policy='default', n_years=None, rules=ALL_RULES, max_age_days=1):
+        tools = openreview.tools
+        self.client = client
+        self.policy = policy
+        self.n_years = n_years
+        self.rules = rules
+        self.max_age_days = max_age_days
+        if callable(policy):
+            policy_function = policy
+        elif policy == 'NeurIPS':
+            policy_function = tools.get_neurips_profile_info
+        else:
+            policy_function = tools.get_profile_info
+        self.info_function = tools.info_function_builder(policy_function, cache=ProfileInfoCache())
+        self.papers = {}
+        self.profiles = {}
+        self.aliases = {}
+
+    def __now(self):
+        return int(time.time() * 1000)
+
+    def __is_fresh(self, entry):
+        return entry is not None and self.__now() - entry['updated'] <= self.max_age_days * 24 * 60 * 60 * 1000
+
+    def __get_profiles(self, ids_or_emails):
+        return openreview.tools.get_profiles(self.client, ids_or_emails, with_publications=True, with_relations=True)
+
+    def __get_tmdates(self, ids_or_emails):
+        return { profile.id: profile.tmdate for profile in openreview.tools.get_profiles(self.client, ids_or_emails) }
+
+    def set_paper(self, paper_id, authorids, author_profiles=None):
+        """
+        Computes the merged info of the authors of a paper. The author profiles are loaded if they are not passed.
+        """
+        if author_profiles is None:
+            author_profiles = self.__get_profiles(authorids)
+        self.papers[paper_id] = {
+            'authorids': list(authorids),
+            'author_tmdates': { profile.id: profile.tmdate for profile in author_profiles },
+            'updated': self.__now(),
+            'info': merge_infos([self.info_function(profile, self.n_years) for profile in author_profiles])
+        }
+
+    def add_paper(self, paper_id, authorids):
+        """
+        Adds a paper to the index unless it is already there with the same authors and none of the author profiles
+        changed since it was computed
+
+        :return: True if the paper info was computed
+        :rtype: bool
+        """
+        paper = self.papers.get(paper_id)
+        if self.__is_fresh(paper) and paper['authorids'] == list(authorids) and paper.get('author_tmdates') == self.__get_tmdates(authorids):
+            return False
+        self.set_paper(paper_id, authorids)
+        return True
+
+    def remove_paper(self, paper_id):
+        self.papers.pop(paper_id, None)
+
+    def set_profile(self, profile, alias=None):
+        """
+        Computes the info of a profile, it is found by its id, the usernames in its names and the alias
+        """
+        self.profiles[profile.id] = {
+            'tmdate': profile.tmdate,
+            'updated': self.__now(),
+            'info': self.info_function(profile, self.n_years)
+        }
+        for name in (profile.content or {}).get('names', []):
+            if name.get('username'):
+                self.aliases[name['username']] = profile.id
+        if alias:
+            self.aliases[alias] = profile.id
+
+    def add_profile(self, id_or_email):
+        """
+        Adds a profile to the index unless it is already there with the same tmdate
+
+        :return: True if the profile info was computed
+        :rtype: bool
+        """
+        profile = self.profiles.get(self.aliases.get(id_or_email, id_or_email))
+        if self.__is_fresh(profile) and list(self.__get_tmdates([id_or_email]).values()) == [profile['tmdate']]:
+            return False
+        profiles = self.__get_profiles([id_or_email])
+        if not profiles:
+            raise openreview.OpenReviewException({ 'name': 'NotFoundError', 'message': f'Profile Not Found: {id_or_email}' })
+        self.set_profile(profiles[0], alias=id_or_email)
+        return True
+
+    def remove_profile(self, profile_id):
+        profile_id = self.aliases.get(profile_id, profile_id)
+        self.profiles.pop(profile_id, None)
+        self.aliases = { alias: id for alias, id in self.aliases.items() if id != profile_id }
+
+    def conflicts(self, paper_id, profile_id):
+        """
+        Returns the values shared by the authors of the paper and the profile, an empty list when there is no conflict
+
+        :param paper_id: Id of a paper added to the index
+        :type paper_id: str
+        :param profile_id: Id, username or alias of a profile added to the index
+        :type profile_id: str
+
+        :return: Conflict reasons
+        :rtype: list[str]
+        """
+        paper = self.papers.get(paper_id)
+        if paper is None:
+            raise openreview.OpenReviewException({ 'name': 'NotFoundError', 'message': f'Paper not found in the conflict index: {paper_id}' })
+        profile = self.profiles.get(self.aliases.get(profile_id, profile_id))
+        if profile is None:
+            raise openreview.OpenReviewException({ 'name': 'NotFoundError', 'message': f'Profile not found in the conflict index: {profile_id}' })
+        return sorted(shared_values(paper['info'], profile['info'], self.rules))
+
+    def save(self, path):
+        """
+        Saves the index to a JSON file
+        """
+        if callable(self.policy):
+            raise openreview.OpenReviewException('A conflict index built with a policy function can not be saved')
+        data = {
+            'policy': self.policy,
+            'n_years': self.n_years,
+            'rules': [list(rule) for rule in self.rules],
+            'papers': { id: dict(paper, info=info_to_json(paper['info'])) for id, paper in self.papers.items() },
+            'profiles': { id: dict(profile, info=info_to_json(profile['info'])) for id, profile in self.profiles.items() },
+            'aliases': self.aliases
+        }
+        with open(path + '.tmp', 'w') as f:
+            json.dump(data, f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path, client=None, policy='default', n_years=None, rules=ALL_RULES, max_age_days=1):
+        """
+        Loads an index saved with :meth:`save`. A new index is returned if the file does not exist or was saved with
+        a different policy, n_years or rules.
+
+        :return: Conflict index
+        :rtype: ConflictIndex
+        """
+        index = cls(client, policy=policy, n_years=n_years, rules=rules, max_age_days=max_age_days)
+        if not path or not os.path.exists(path):
+            return index
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('policy') != policy or data.get('n_years') != n_years or [tuple(rule) for rule in data.get('rules', [])] != list(rules):
+            return index
+        index.papers = { id: dict(paper, info=info_from_json(paper['info'])) for id, paper in data['papers'].items() }
+        index.profiles = { id: dict(profile, info=info_from_json(profile['info'])) for id, profile in data['profiles'].items() }
+        index.aliases = data['aliases']
+        return index
@@ -0,0 +1,250 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+import concurrent.futures
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import openreview
+
+
+class ExpertiseJobTracker(object):
+    """
+    Waits for many expertise jobs at the same time from a single thread. The status of the jobs that are due are
+    requested concurrently, and each job is polled with its own interval: it starts at `min_interval` and grows by
+    `backoff` every time the status did not change, up to `max_interval`, so long jobs are not polled every few seconds
+    and a job that starts running is checked again soon.
+
+    Each watched job gets a :class:`concurrent.futures.Future` that is resolved with the status response of the job
+    when it completes, or with an :class:`openreview.OpenReviewException` when it fails or times out. The jobs are
+    polled by :meth:`wait` or, asynchronously, by the thread started with :meth:`start`.
+
+    Example:
+
+    >>> tracker = openreview.expertise.ExpertiseJobTracker(client)
+    >>> futures = [tracker.watch(job_id, callback=lambda job_id, status: print(job_id, 'completed')) for job_id in job_ids]
+    >>> tracker.wait()
+    >>> results = tracker.get_results(job_ids[0])
+
+    :param client: Client used to request the status and the results of the jobs
+    :type client: api.OpenReviewClient
+    :param baseurl: URL of the expertise API, the client base URL by default
+    :type baseurl: str, optional
+    :param min_interval: Seconds to wait before the first status request of a job
+    :type min_interval: float, optional
+    :param max_interval: Maximum number of seconds between two status requests of a job
+    :type max_interval: float, optional
+    :param backoff: Factor applied to the interval of a job when its status did not change
+    :type backoff: float, optional
+    :param timeout: Seconds after which a job that is not finished fails
+    :type timeout: float, optional
+    :param max_workers: Maximum number of status requests sent at the same time
+    :type max_workers: int, optional
+    """
+
+    def __init__(self, client, baseurl=None, min_interval=10, max_interval=120, backoff=1.5, timeout=24 * 60 * 60, max_workers=10):
+        self.client = client
+        self.baseurl = baseurl
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.thread = None
+        self.stopped = False
+        self.stats = { 'requests': 0, 'completed': 0, 'failed': 0 }
+
+    def watch(self, job_id, callback=None):
+        """
+        Starts watching a job. Watching a job that is already watched returns the same future.
+
+        :param job_id: Id of the expertise job
+        :type job_id: str
+        :param callback: Function called with the job id and its status response when the job completes
+        :type callback: function, optional
+
+        :return: Future resolved with the status response of the job
+        :rtype: concurrent.futures.Future
+        """
+        with self.changed:
+            job = self.jobs.get(job_id)
+            if job is None:
+                now = time.time()
+                job = {
+                    'future': concurrent.futures.Future(),
+                    'status': None,
+                    'finished': False,
+                    'interval': self.min_interval,
+                    'next_poll': now,
+                    'deadline': now + self.timeout
+                }
+                self.jobs[job_id] = job
+                self.changed.notify_all()
+            if callback is not None:
+                job['future'].add_done_callback(lambda future: future.exception() is None and callback(job_id, future.result()))
+            return job['future']
+
+    def pending(self):
+        with self.lock:
+            return [job_id for job_id, job in self.jobs.items() if not job['finished']]
+
+    def __get_status(self, job_id):
+        return self.client.get_expertise_status(job_id, baseurl=self.baseurl)
+
+    def __update(self, job_id, status_response, now):
+        ## returns the function that resolves the future, called without holding the lock since it runs the callbacks
+        job = self.jobs[job_id]
+        status = status_response.get('status')
+        job['finished'] = status in ['Completed', 'Error'] or now >= job['deadline']
+        if status == 'Completed':
+            self.stats['completed'] += 1
+            return lambda: job['future'].set_result(status_response)
+        elif status == 'Error':
+            self.stats['failed'] += 1
+            error = openreview.OpenReviewException('There was an error computing scores, description: ' + str(status_response.get('description')))
+            return lambda: job['future'].set_exception(error)
+        elif now >= job['deadline']:
+            self.stats['failed'] += 1
+            error = openreview.OpenReviewException('Time out computing scores, description: ' + str(status_response.get('description')))
+            return lambda: job['future'].set_exception(error)
+        else:
+            if status == job['status']:
+                job['interval'] = min(job['interval'] * self.backoff, self.max_interval)
+            else:
+                job['interval'] = self.min_interval
+            job['status'] = status
+            job['next_poll'] = now + job['interval']
+
+    def poll(self):
+        """
+        Requests the status of the jobs whose interval elapsed and resolves the futures of the jobs that finished
+
+        :return: Seconds until the next job has to be polled, None when there are no pending jobs
+        :rtype: float
+        """
+        now = time.time()
+        with self.lock:
+            due = [job_id for job_id, job in self.jobs.items() if not job['finished'] and job['next_poll'] <= now]
+
+        if due:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+                futures = { executor.submit(self.__get_status, job_id): job_id for job_id in due }
+                for future in concurrent.futures.as_completed(futures):
+                    job_id = futures[future]
+                    try:
+                        status_response = future.result()
+                    except Exception as e:
+                        ## a failed status request is retried in the next poll
+                        print(f'Error getting the status of job {job_id}: {e}')
+                        status_response = { 'status': self.jobs[job_id]['status'] }
+                    with self.lock:
+                        self.stats['requests'] += 1
+                        resolve = self.__update(job_id, status_response, time.time())
+                    if resolve:
+                        resolve()
+
+        with self.lock:
+            next_polls = [job['next_poll'] for job in self.jobs.values() if not job['finished']]
+        if not next_polls:
+            return None
+        return max(0, min(next_polls) - time.time())
+
+    def wait(self, job_ids=None):
+        """
+        Polls the jobs until the given jobs, or all the watched jobs, are finished
+
+        :param job_ids: Ids of the jobs to wait for
+        :type job_ids: list[str], optional
+
+        :return: Futures of the jobs by job id
+        :rtype: dict
+        """
+        with self.lock:
+            futures = { job_id: self.jobs[job_id]['future'] for job_id in (job_ids if job_ids is not None else list(self.jobs)) }
+        while not all(future.done() for future in futures.values()):
+            if self.thread is not None:
+                concurrent.futures.wait(futures.values())
+                break
+            delay = self.poll()
+            if delay:
+                time.sleep(delay)
+        return futures
+
+    def wait_for(self, job_id):
+        """
+        Watches a job and waits until it is finished
+
+        :param job_id: Id of the expertise job
+        :type job_id: str
+
+        :return: Status response of the completed job
+        :rtype: dict
+        """
+        future = self.watch(job_id)
+        self.wait([job_id])
+        return future.result()
+
+    def get_results(self, job_id):
+        """
+        Returns the results of a completed job
+
+        :param job_id: Id of the expertise job
+        :type job_id: str
+
+        :return: Results of the job
+        :rtype: dict
+        """
+        return self.client.get_expertise_results(job_id, baseurl=self.baseurl)
+
+    def __run(self):
+        while True:
+            with self.changed:
+                if self.stopped:
+                    return
+            delay = self.poll()
+            with self.changed:
+                if self.stopped:
+                    return
+                self.changed.wait(timeout=delay)
+
+    def start(self):
+        """
+        Starts a daemon thread that polls the jobs, so the futures returned by :meth:`watch` are resolved without calling :meth:`wait`
+        """
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.stopped = False
+            self.thread = threading.Thread(target=self.__run, name='ExpertiseJobTracker', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.changed:
+            self.stopped = True
+            self.changed.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def get_job_statuses(self, group_id, paper_ids):
+        """
+        Returns the status of the last job requested for each paper and committee, requesting them concurrently
+
+        :param group_id: Committee id used as entityA of the jobs
+        :type group_id: str
+        :param paper_ids: Ids of the papers used as entityB of the jobs
+        :type paper_ids: list[str]
+
+        :return: Dict from paper id to the status of its job, None when the paper has no job
+        :rtype: dict
+        """
+        def get_status(paper_id):
+            result = self.client.get_expertise_status(paper_id=paper_id, group_id=group_id, baseurl=self.baseurl)
+            return result['results'][0] if (result and result.get('results')) else None
+
+        statuses = openreview.tools.concurrent_requests(get_status, paper_ids, desc='Getting expertise job statuses')
+        with self.lock:
+            self.stats['requests'] += len(paper_ids)
+        return dict(zip(paper_ids, statuses))
@@ -14,12 +14,12 @@ class Assignment(object):
         self.client = journal.client
         self.journal = journal
         self.show_conflict_details = journal.should_show_conflict_details()
+        self.conflict_index = None
 
     def post_submission_edges(self, edges):
         if edges:
-            ## Remove current edges if they exists
-            self.client.delete_edges(invitation=edges[0].invitation, head=edges[0].head, wait_to_finish=True)
-            tools.post_bulk_edges(self.client, edges)
+            ## Post only the edges that changed and remove the current edges that are not in the list
+            tools.sync_edges(self.client, edges[0].invitation, edges, head=edges[0].head)
             # Perform sanity check
             edges_posted = self.client.get_edges_count(invitation=edges[0].invitation, head=edges[0].head)
             if edges_posted != len(edges):
@@ -134,12 +134,13 @@ class Assignment(object):
 
     def compute_conflicts(self, note, reviewer):
 
-        reviewer_profiles = tools.get_profiles(self.client, [reviewer], with_publications=True, with_relations=True)
+        if self.conflict_index is None:
+            self.conflict_index = openreview.conflicts.ConflictIndex(self.client, policy='NeurIPS', n_years=3)
 
-        authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        self.conflict_index.add_paper(note.id, self.journal.get_authors(number=note.number))
+        self.conflict_index.add_profile(reviewer)
 
-        return tools.get_conflicts(author_profiles, reviewer_profiles[0], policy='NeurIPS', n_years=3)
+        return self.conflict_index.conflicts(note.id, reviewer)
 
     def request_expertise(self, note, committee_id):
         job = self.client.request_single_paper_expertise(
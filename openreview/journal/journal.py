@@ -4,6 +4,7 @@ from .invitation import InvitationBuilder
 from .recruitment import Recruitment
 from .assignment import Assignment
 
+import os
 import re
 import csv
 import datetime
@@ -1141,13 +1142,22 @@ Your {lower_formatted_invitation} on a submission has been {action}
             submissions = journal.client.get_all_notes(invitation=journal.get_author_submission_id())
             active_submissions = [s for s in submissions if s.content['venueid']['value'] in [journal.submitted_venue_id, journal.assigning_AE_venue_id, journal.assigned_AE_venue_id]]
 
-            # For each submission check the status of the expertise task
+            # Count the scores and check the status of the expertise tasks of all the submissions at the same time
+            def get_score_counts(submission):
+                return (
+                    journal.client.get_edges_count(invitation=journal.get_ae_affinity_score_id(), head=submission.id),
+                    journal.client.get_edges_count(invitation=journal.get_reviewer_affinity_score_id(), head=submission.id)
+                )
+            score_counts = openreview.tools.concurrent_requests(get_score_counts, active_submissions, desc='Counting affinity scores')
+
+            tracker = openreview.expertise.ExpertiseJobTracker(journal.client)
+            ae_jobs = tracker.get_job_statuses(journal.get_action_editors_id(), [s.id for s, counts in zip(active_submissions, score_counts) if counts[0] == 0])
+            reviewer_jobs = tracker.get_job_statuses(journal.get_reviewers_id(), [s.id for s, counts in zip(active_submissions, score_counts) if counts[1] == 0])
+
             for submission in tqdm(active_submissions):
-                ae_score_count = journal.client.get_edges_count(invitation=journal.get_ae_affinity_score_id(), head=submission.id)
-                if ae_score_count == 0:
+                if submission.id in ae_jobs:
                     print('Submission with no AE scores', submission.id, submission.number)
-                    result = journal.client.get_expertise_status(paper_id=submission.id, group_id=journal.get_action_editors_id())
-                    job_status = result['results'][0] if (result and result['results']) else None
+                    job_status = ae_jobs[submission.id]
                     if job_status and job_status['status'] == 'Completed':
                         print('Job Completed')
                         journal.assignment.setup_ae_assignment(submission, job_status['jobId'])
@@ -1178,11 +1188,9 @@ Your {lower_formatted_invitation} on a submission has been {action}
                                     sender=journal.get_message_sender()
                                 )
 
-                reviewers_score_count = journal.client.get_edges_count(invitation=journal.get_reviewer_affinity_score_id(), head=submission.id)
-                if reviewers_score_count == 0:
+                if submission.id in reviewer_jobs:
                     print('Submission with no reviewers scores', submission.id, submission.number)
-                    result = journal.client.get_expertise_status(paper_id=submission.id, group_id=journal.get_reviewers_id())
-                    job_status = result['results'][0] if (result and result['results']) else None
+                    job_status = reviewer_jobs[submission.id]
                     if job_status and job_status['status'] == 'Completed':
                         print('Job Completed')
                         journal.assignment.setup_reviewer_assignment(submission, job_status['jobId'])
@@ -1706,7 +1714,7 @@ Your {lower_formatted_invitation} on a submission has been {action}
         self.group_builder.set_impersonators(impersonators)
 
     @classmethod
-    def check_new_profiles(Journal, client, support_group_id='OpenReview.net/Support'):
+    def check_new_profiles(Journal, client, support_group_id='OpenReview.net/Support', conflict_index_dir=None):
 
         def mark_as_conflict(journal, edge, submission, user_profile):
             edge.label = 'Conflict Detected'
@@ -1802,6 +1810,9 @@ OpenReview Team'''
             grouped_edges = client.get_grouped_edges(invitation=invite_assignment_invitation_id, label='Pending Sign Up', groupby='tail')
             print('Pending sign up edges found', len(grouped_edges))
 
+            conflict_index_path = os.path.join(conflict_index_dir, journal.venue_id.replace('/', '_') + '.json') if conflict_index_dir else None
+            conflict_index = openreview.conflicts.ConflictIndex.load(conflict_index_path, client, policy='NeurIPS', n_years=3)
+
             for grouped_edge in grouped_edges:
 
                 tail = grouped_edge['id']['tail']
@@ -1834,8 +1845,9 @@ OpenReview Team'''
                                     client.post_edge(invitation_edge)
 
                                 # Check conflicts
-                                author_profiles = openreview.tools.get_profiles(client, submission.content['authorids']['value'], with_publications=True, with_relations=True)
-                                conflicts=openreview.tools.get_conflicts(author_profiles, user_profile, policy='NeurIPS', n_years=3)
+                                conflict_index.add_paper(submission.id, submission.content['authorids']['value'])
+                                conflict_index.set_profile(user_profile, alias=tail)
+                                conflicts=conflict_index.conflicts(submission.id, user_profile.id)
 
                                 if conflicts:
                                     print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
@@ -1853,4 +1865,7 @@ OpenReview Team'''
                 else:
                     print(f'no profile active for {tail}')
 
+            if conflict_index_path:
+                conflict_index.save(conflict_index_path)
+
         return True
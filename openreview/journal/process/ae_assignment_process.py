@@ -25,7 +25,7 @@ def process_update(client, edge, invitation, existing_edge):
 
         client.post_message(subject, recipients, message, parentGroup=group.id, replyTo=journal.contact_info, invitation=journal.get_meta_invitation_id(), signature=journal.venue_id, sender=journal.get_message_sender())
 
-        client.remove_members_from_group(group.id, edge.tail)
+        client.remove_members_from_group(group.id, edge.tail, return_result=False, prefetched_group=group)
 
         ## update assigned_action_editor if exists in the submission
         content = {}
@@ -47,7 +47,7 @@ def process_update(client, edge, invitation, existing_edge):
 
     if not edge.ddate and edge.tail not in group.members:
         print(f'Add member {edge.tail} to {group.id}')
-        client.add_members_to_group(group.id, edge.tail)
+        client.add_members_to_group(group.id, edge.tail, return_result=False, prefetched_group=group)
 
         print('Enable review approval invitation')
         journal.invitation_builder.set_note_review_approval_invitation(note, journal.get_due_date(weeks=journal.get_under_review_approval_period_length()))
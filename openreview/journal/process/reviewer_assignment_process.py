@@ -52,7 +52,7 @@ def process_update(client, edge, invitation, existing_edge):
     ## Unassignment action
     if edge.ddate and edge.tail in group.members:
         print(f'Remove member {edge.tail} from {group.id}')
-        client.remove_members_from_group(group.id, edge.tail)
+        client.remove_members_from_group(group.id, edge.tail, return_result=False, prefetched_group=group)
 
         recipients=[edge.tail]
         subject=f'[{journal.short_name}] You have been unassigned from {journal.short_name} submission {note.number}: {note.content["title"]["value"]}'
@@ -82,7 +82,7 @@ def process_update(client, edge, invitation, existing_edge):
     ## Assignment action
     if not edge.ddate and edge.tail not in group.members:
         print(f'Add member {edge.tail} to {group.id}')
-        client.add_members_to_group(group.id, edge.tail)
+        client.add_members_to_group(group.id, edge.tail, return_result=False, prefetched_group=group)
 
         if pending_review_edge:
             pending_review_edge.weight += 1
@@ -54,7 +54,7 @@ class Recruitment(object):
                     if 'NotFoundError' in error_string:
                         error_string = 'InvalidGroup'
                     else:
-                        self.client.remove_members_from_group(action_editors_invited_id, invitee)
+                        self.client.remove_members_from_group(action_editors_invited_id, invitee, return_result=False)
                     if error_string not in recruitment_status['errors']:
                         recruitment_status['errors'][error_string] = []
                     recruitment_status['errors'][error_string].append(invitee)
@@ -107,7 +107,7 @@ class Recruitment(object):
                     if 'NotFoundError' in error_string:
                         error_string = 'InvalidGroup'
                     else:
-                        self.client.remove_members_from_group(reviewers_invited_id, invitee)
+                        self.client.remove_members_from_group(reviewers_invited_id, invitee, return_result=False)
                     if error_string not in recruitment_status['errors']:
                         recruitment_status['errors'][error_string] = []
                     recruitment_status['errors'][error_string].append(invitee)
@@ -0,0 +1,222 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+import contextlib
+import json
+import threading
+import time
+import urllib.parse as urlparse
+
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+## paths requested by the clients, a path that extends one of them with ids is reported as '<route>/{id}'
+ROUTES = frozenset([
+    '/activatable', '/activate', '/activatelink', '/attachment', '/domains/rename', '/edges', '/edges/archive', '/edges/bulk',
+    '/edges/count', '/edges/rename', '/expertise', '/expertise/results', '/expertise/status', '/expertise/status/all',
+    '/groups', '/groups/attachment', '/groups/edits', '/groups/members', '/groups/members/cache', '/impersonate',
+    '/invitations', '/invitations/attachment', '/invitations/edits', '/jobs/status', '/login', '/logs/process', '/mail',
+    '/messages', '/messages/direct', '/messages/requests', '/notes', '/notes/edits', '/notes/infer', '/notes/search',
+    '/pdf', '/profile/moderate', '/profiles', '/profiles/merge', '/profiles/reference', '/profiles/rename',
+    '/profiles/search', '/references', '/references/pdf', '/register', '/settings/institutions',
+    '/settings/relationReaders', '/tags', '/tags/bulk', '/tags/rename', '/tildeusername', '/user/confirm', '/venues'
+])
+
+
+class RequestMetrics(object):
+    """
+    Collects per endpoint statistics of the requests made by a client: request and error counts, bytes sent and received,
+    a latency histogram, the number of retries made by LogRetry and the time spent decoding JSON responses. Every
+    :class:`openreview.Client` and :class:`openreview.api.OpenReviewClient` has one in `client.metrics`.
+
+    Endpoints are identified by the HTTP method and the route of the url, e.g. 'GET /notes'. Ids in the path are replaced
+    by a placeholder, e.g. 'DELETE /groups/members/cache/{id}', so the number of endpoints stays bounded. The latency is the time until
+    the response headers are received, as measured by `requests`.
+
+    Example:
+
+    >>> with client.metrics.scope() as stats:
+    ...     matching.setup(compute_conflicts=True)
+    >>> print(stats.to_prometheus())
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self.scopes = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def route(path):
+        path = path.rstrip('/') or '/'
+        if path in ROUTES:
+            return path
+        segments = path.strip('/').split('/')
+        for end in range(len(segments) - 1, 0, -1):
+            prefix = '/' + '/'.join(segments[:end])
+            if prefix in ROUTES:
+                return prefix + '/{id}'
+        ## unknown routes keep their first segment only, since the rest may contain ids
+        return '/' + segments[0] + ('/{id}' if len(segments) > 1 else '')
+
+    @staticmethod
+    def endpoint(method, url):
+        return '{} {}'.format((method or '').upper(), RequestMetrics.route(urlparse.urlparse(url or '').path))
+
+    def __entry(self, endpoint):
+        entry = self.endpoints.get(endpoint)
+        if entry is None:
+            entry = {
+                'requests': 0,
+                'errors': 0,
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'latency_seconds': 0.0,
+                'latency_buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+                'retries': 0,
+                'json_decodes': 0,
+                'json_decode_seconds': 0.0
+            }
+            self.endpoints[endpoint] = entry
+        return entry
+
+    def __record(self, endpoint, update):
+        with self.lock:
+            targets = [self] + list(self.scopes)
+        for metrics in targets:
+            with metrics.lock:
+                update(metrics.__entry(endpoint))
+
+    def record_request(self, endpoint, status, latency, bytes_sent, bytes_received):
+        def update(entry):
+            entry['requests'] += 1
+            if status >= 400:
+                entry['errors'] += 1
+            entry['bytes_sent'] += bytes_sent
+            entry['bytes_received'] += bytes_received
+            entry['latency_seconds'] += latency
+            bucket = len(LATENCY_BUCKETS)
+            for index, upper_bound in enumerate(LATENCY_BUCKETS):
+                if latency <= upper_bound:
+                    bucket = index
+                    break
+            entry['latency_buckets'][bucket] += 1
+        self.__record(endpoint, update)
+
+    def record_retry(self, endpoint):
+        def update(entry):
+            entry['retries'] += 1
+        self.__record(endpoint, update)
+
+    def record_json_decode(self, endpoint, seconds):
+        def update(entry):
+            entry['json_decodes'] += 1
+            entry['json_decode_seconds'] += seconds
+        self.__record(endpoint, update)
+
+    def observe_response(self, response, *args, **kwargs):
+        """
+        `requests` response hook used by the clients. It also wraps `response.json` to measure the decoding time.
+        """
+        request = response.request
+        endpoint = self.endpoint(request.method, request.url)
+
+        body = request.body
+        bytes_sent = len(body) if isinstance(body, (bytes, str)) else int(request.headers.get('Content-Length') or 0)
+        if response.headers.get('Content-Length'):
+            bytes_received = int(response.headers['Content-Length'])
+        elif not kwargs.get('stream'):
+            bytes_received = len(response.content or b'')
+        else:
+            bytes_received = 0
+        self.record_request(endpoint, response.status_code, response.elapsed.total_seconds(), bytes_sent, bytes_received)
+
+        decode = response.json
+        def timed_json(**json_kwargs):
+            start = time.perf_counter()
+            try:
+                return decode(**json_kwargs)
+            finally:
+                self.record_json_decode(endpoint, time.perf_counter() - start)
+        response.json = timed_json
+        return response
+
+    @contextlib.contextmanager
+    def scope(self):
+        """
+        Context manager that returns a new RequestMetrics with only the requests made while the block runs. The
+        requests are still recorded in this object too.
+        """
+        scoped = RequestMetrics()
+        with self.lock:
+            self.scopes.append(scoped)
+        try:
+            yield scoped
+        finally:
+            with self.lock:
+                self.scopes.remove(scoped)
+
+    def reset(self):
+        with self.lock:
+            self.endpoints = {}
+
+    def snapshot(self):
+        """
+        Returns the statistics as a dict keyed by endpoint. The latency histogram is returned as a dict of
+        cumulative counts keyed by upper bound, like Prometheus buckets.
+
+        :return: Statistics per endpoint
+        :rtype: dict
+        """
+        with self.lock:
+            endpoints = { endpoint: dict(entry, latency_buckets=list(entry['latency_buckets'])) for endpoint, entry in self.endpoints.items() }
+
+        snapshot = {}
+        for endpoint, entry in sorted(endpoints.items()):
+            cumulative = 0
+            buckets = {}
+            for upper_bound, count in zip([str(b) for b in LATENCY_BUCKETS] + ['+Inf'], entry['latency_buckets']):
+                cumulative += count
+                buckets[upper_bound] = cumulative
+            entry['latency_buckets'] = buckets
+            entry['average_latency_seconds'] = entry['latency_seconds'] / entry['requests'] if entry['requests'] else 0
+            snapshot[endpoint] = entry
+        return snapshot
+
+    def to_json(self, indent=None):
+        """
+        Returns the snapshot serialized as JSON
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix='openreview_client'):
+        """
+        Returns the statistics in the Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        counters = [
+            ('requests_total', 'requests', 'Number of requests'),
+            ('request_errors_total', 'errors', 'Number of responses with status 400 or higher'),
+            ('bytes_sent_total', 'bytes_sent', 'Bytes sent in request bodies'),
+            ('bytes_received_total', 'bytes_received', 'Bytes received in response bodies'),
+            ('retries_total', 'retries', 'Number of retries made by LogRetry'),
+            ('json_decode_seconds_total', 'json_decode_seconds', 'Time spent decoding JSON responses')
+        ]
+
+        def labels(endpoint, **extra):
+            method, path = endpoint.split(' ', 1)
+            values = [('method', method), ('endpoint', path)] + list(extra.items())
+            return '{' + ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in values) + '}'
+
+        lines = []
+        for name, key, description in counters:
+            lines.append('# HELP {}_{} {}'.format(prefix, name, description))
+            lines.append('# TYPE {}_{} counter'.format(prefix, name))
+            for endpoint, entry in snapshot.items():
+                lines.append('{}_{}{} {}'.format(prefix, name, labels(endpoint), entry[key]))
+
+        name = prefix + '_request_duration_seconds'
+        lines.append('# HELP {} Time until the response headers are received'.format(name))
+        lines.append('# TYPE {} histogram'.format(name))
+        for endpoint, entry in snapshot.items():
+            for upper_bound, count in entry['latency_buckets'].items():
+                lines.append('{}_bucket{} {}'.format(name, labels(endpoint, le=upper_bound), count))
+            lines.append('{}_sum{} {}'.format(name, labels(endpoint), entry['latency_seconds']))
+            lines.append('{}_count{} {}'.format(name, labels(endpoint), entry['requests']))
+        return '\n'.join(lines) + '\n'
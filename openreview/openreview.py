@@ -7,6 +7,7 @@ else:
     string_types = [str]
 
 from . import tools
+from .metrics import RequestMetrics
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
@@ -22,12 +23,34 @@ class OpenReviewException(Exception):
 
 class LogRetry(Retry):
      
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)   
+    def __init__(self, *args, metrics=None, limiter=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics
+        self.limiter = limiter
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.metrics = self.metrics
+        retry.limiter = self.limiter
+        return retry
+
+    def sleep(self, response=None):
+        if self.limiter is None:
+            return super().sleep(response)
+        ## the request holds a slot of the limiter while it is sent, do not keep it while waiting to retry
+        self.limiter.release()
+        try:
+            super().sleep(response)
+        finally:
+            self.limiter.acquire()
 
     def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
         # Log retry information before calling the parent class method
         print(f"Retrying request: {method} {url}, response: {response}, error: {error}")
+        if self.limiter is not None:
+            self.limiter.observe_retry(response)
+        if self.metrics is not None:
+            self.metrics.record_retry(RequestMetrics.endpoint(method, url))
 
         # Call the parent class method to perform the actual retry increment
         return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
@@ -43,8 +66,10 @@ class Client(object):
     :type token: str, optional
     :param tokenExpiresIn: Time in seconds before the token expires. This parameter only works when providing a username and a password. If none is set, the value will be set automatically to one day. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param concurrency_limiter: Limiter of the HTTP requests sent at the same time by this client, the same limiter can be passed to several clients. If none is provided, the requests are not limited
+    :type concurrency_limiter: tools.AdaptiveConcurrencyLimiter, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, concurrency_limiter=None):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3000')
         if 'https://api2.openreview.net' in self.baseurl or 'https://devapi2.openreview.net' in self.baseurl:
             correct_baseurl = self.baseurl.replace('api2', 'api')
@@ -89,11 +114,19 @@ class Client(object):
             'Accept': 'application/json',
         }
 
-        retry_strategy = LogRetry(total=3, backoff_factor=0.1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True)
+        self.metrics = RequestMetrics()
+        retry_strategy = LogRetry(total=3, backoff_factor=0.1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True, metrics=self.metrics, limiter=concurrency_limiter)
         self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.concurrency_limiter = concurrency_limiter
+        if concurrency_limiter is None:
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+        else:
+            adapter = tools.LimitedHTTPAdapter(concurrency_limiter, max_retries=retry_strategy)
+            self.session.hooks['response'].append(concurrency_limiter.observe_response)
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
+        self.session.hooks['response'].append(tools.use_fast_json)
+        self.session.hooks['response'].append(self.metrics.observe_response)
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
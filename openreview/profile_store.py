@@ -0,0 +1,173 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+import json
+import sqlite3
+import threading
+import time
+
+import openreview
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+class ProfileStore(object):
+    """
+    SQLite store of the publications loaded by :func:`openreview.tools.get_profiles`, so repeated loads of the same
+    committees only request what changed since the previous load.
+
+    The profiles themselves are still requested, one request for every 1000 profiles, because their tmdate tells
+    whether they changed. The publications of a profile are loaded completely the first time, when the profile tmdate
+    changed, or when they were completely loaded more than `max_age_days` ago. Otherwise only the publications created
+    since the previous load are requested using `mintcdate`. Since publications that are edited or deleted are only
+    seen in a complete load, `max_age_days` bounds how stale the store can be.
+
+    Example:
+
+    >>> store = openreview.profile_store.ProfileStore('profiles.sqlite')
+    >>> profiles = openreview.tools.get_profiles(client, reviewer_ids, with_publications=True, store=store)
+
+    :param path: Path of the SQLite file
+    :type path: str
+    :param max_age_days: Number of days after which the publications of a profile are loaded completely again
+    :type max_age_days: int, optional
+    :param overlap_ms: Milliseconds subtracted from the previous load time when requesting new publications, to cover
+        publications created while that load was running
+    :type overlap_ms: int, optional
+    """
+
+    def __init__(self, path, max_age_days=7, overlap_ms=10 * 60 * 1000):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.overlap_ms = overlap_ms
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS profiles (id TEXT PRIMARY KEY, tmdate INTEGER, loaded INTEGER, fully_loaded INTEGER);
+            CREATE TABLE IF NOT EXISTS publications (profile_id TEXT, api_version INTEGER, id TEXT, note TEXT, PRIMARY KEY (profile_id, api_version, id));
+        ''')
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def get_load_plan(self, profiles, now=None):
+        """
+        Returns the `mintcdate` to use to load the publications of each profile, None when they have to be loaded
+        completely
+
+        :param profiles: Profiles whose publications will be loaded
+        :type profiles: list[Profile]
+
+        :return: Dict from profile id to mintcdate
+        :rtype: dict
+        """
+        now = now or int(time.time() * 1000)
+        with self.lock:
+            rows = {}
+            ids = [p.id for p in profiles]
+            for i in range(0, len(ids), 500):
+                batch = ids[i:i+500]
+                query = 'SELECT id, tmdate, loaded, fully_loaded FROM profiles WHERE id IN ({})'.format(','.join('?' * len(batch)))
+                for row in self.connection.execute(query, batch):
+                    rows[row[0]] = row[1:]
+
+        plan = {}
+        for profile in profiles:
+            row = rows.get(profile.id)
+            if row is None or profile.tmdate is None or row[0] != profile.tmdate or now - row[2] > self.max_age_days * DAY_MS:
+                plan[profile.id] = None
+            else:
+                plan[profile.id] = max(0, row[1] - self.overlap_ms)
+        return plan
+
+    @staticmethod
+    def note_to_json(note):
+        ## to_json of API v2 notes only keeps the fields that can be posted, so the dates and the other fields set by the
+        ## API are added to store the same Note that was loaded
+        body = note.to_json()
+        for field in ['tcdate', 'tmdate', 'number', 'domain', 'details']:
+            value = getattr(note, field, None)
+            if value is not None:
+                body[field] = value
+        return body
+
+    def save_publications(self, profile, publications_by_version, mintcdate, loaded):
+        """
+        Stores the publications loaded for a profile. If mintcdate is None the previous publications of the profile are
+        replaced, otherwise the new ones are added.
+
+        :param profile: Profile
+        :type profile: Profile
+        :param publications_by_version: Dict from API version (1 or 2) to the list of Notes loaded
+        :type publications_by_version: dict
+        :param mintcdate: mintcdate used to load the publications
+        :type mintcdate: int
+        :param loaded: Time in milliseconds when the load started
+        :type loaded: int
+        """
+        with self.lock:
+            if mintcdate is None:
+                self.connection.execute('DELETE FROM publications WHERE profile_id = ?', (profile.id,))
+            for api_version, publications in publications_by_version.items():
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO publications (profile_id, api_version, id, note) VALUES (?, ?, ?, ?)',
+                    [(profile.id, api_version, note.id, json.dumps(self.note_to_json(note))) for note in publications]
+                )
+            if mintcdate is None:
+                self.connection.execute('INSERT OR REPLACE INTO profiles (id, tmdate, loaded, fully_loaded) VALUES (?, ?, ?, ?)', (profile.id, profile.tmdate, loaded, loaded))
+            else:
+                self.connection.execute('UPDATE profiles SET loaded = ? WHERE id = ?', (loaded, profile.id))
+
+    def commit(self):
+        with self.lock:
+            self.connection.commit()
+
+    def get_publications(self, profile_id):
+        """
+        Returns the stored publications of a profile, the API v1 publications first
+
+        :param profile_id: Profile id
+        :type profile_id: str
+
+        :return: Publications
+        :rtype: list[Note]
+        """
+        with self.lock:
+            rows = self.connection.execute('SELECT api_version, note FROM publications WHERE profile_id = ? ORDER BY api_version, rowid', (profile_id,)).fetchall()
+        return [(openreview.Note if api_version == 1 else openreview.api.Note).from_json(json.loads(note)) for api_version, note in rows]
+
+    def load_publications(self, profiles, client_v1, client_v2, verbose=False):
+        """
+        Sets `content['publications']` of the profiles, requesting only the publications that are not in the store
+
+        :param profiles: Profiles
+        :type profiles: list[Profile]
+        :param client_v1: Client used to get the API v1 publications
+        :type client_v1: Client
+        :param client_v2: Client used to get the API v2 publications
+        :type client_v2: api.OpenReviewClient
+        :param verbose: Prints how many profiles are loaded completely and incrementally
+        :type verbose: bool, optional
+        """
+        loaded = int(time.time() * 1000)
+        plan = self.get_load_plan(profiles, loaded)
+        if verbose:
+            incremental = len([mintcdate for mintcdate in plan.values() if mintcdate is not None])
+            print('Loading publications of {} profiles: {} complete loads, {} incremental loads'.format(len(profiles), len(profiles) - incremental, incremental))
+
+        def save(profile, publications_by_version):
+            self.save_publications(profile, publications_by_version, plan[profile.id], loaded)
+
+        openreview.tools.PublicationLoader(client_v1, client_v2).load(profiles, mintcdate_by_id=plan, on_loaded=save)
+        self.commit()
+
+        for profile in profiles:
+            profile.content['publications'] = self.get_publications(profile.id)
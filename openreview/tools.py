@@ -2,9 +2,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 import inspect
+import functools
+import itertools
 
 import json
 import os
+import time
+import hashlib
 
 import openreview
 import re
@@ -17,11 +21,27 @@ from multiprocessing import Pool, cpu_count
 from tqdm import tqdm
 import tld
 import urllib.parse as urlparse
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor
+import concurrent.futures
+import collections
+import copy
+import queue
+import threading
 import random
 import string
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        json_loads = ujson.loads
+    except ImportError:
+        json_loads = json.loads
+
 def decision_to_venue(venue_id, decision_option, accept_options=None):
     """
     Returns the venue for a submission based on its decision
@@ -87,7 +107,160 @@ def format_params(params):
 
     return params
 
-def concurrent_requests(request_func, params, desc='Gathering Responses'):
+class AdaptiveConcurrencyLimiter(object):
+    """
+    Limits the number of requests that the fan-out helpers run at the same time and adapts the limit to how the API
+    responds, following an additive increase / multiplicative decrease strategy: the limit grows by about one slot per
+    round of requests while the latencies stay close to the best latency observed, and it is halved when the API
+    answers with 429 or 5xx. A Retry-After header also pauses the start of new requests for the given number of seconds.
+
+    The limiter is opt-in and belongs to the clients it is passed to, e.g.
+    `openreview.api.OpenReviewClient(concurrency_limiter=AdaptiveConcurrencyLimiter())`. The session of such a client
+    holds a slot for each HTTP request through :class:`LimitedHTTPAdapter`, except while it sleeps between retries, and
+    feeds the limiter with the responses and retries. The fan-out helpers like :func:`concurrent_get` and
+    :class:`GroupMembershipBatcher` size their thread pools with `max_limit` when their client has a limiter, so nested
+    fan-outs share the same slots. Clients created without a limiter are not limited.
+
+    :param initial_limit: Number of concurrent requests allowed at the beginning
+    :type initial_limit: int, optional
+    :param min_limit: Lower bound of the limit
+    :type min_limit: int, optional
+    :param max_limit: Upper bound of the limit, also the number of threads used by the fan-out helpers
+    :type max_limit: int, optional
+    :param latency_tolerance: Latencies up to this factor of the best latency are considered stable
+    :type latency_tolerance: float, optional
+    :param backoff_ratio: Factor applied to the limit when the API is overloaded
+    :type backoff_ratio: float, optional
+    :param decrease_interval: Minimum number of seconds between two decreases, so a burst of errors only halves the limit once
+    :type decrease_interval: float, optional
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=32, latency_tolerance=2.0, backoff_ratio=0.5, decrease_interval=1.0):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.decrease_interval = decrease_interval
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.active = 0
+        self.baseline_latency = None
+        self.paused_until = 0
+        self.last_decrease = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.active < int(self.limit):
+                    break
+                self.condition.wait(timeout=wait if wait > 0 else None)
+            self.active += 1
+
+    def release(self):
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def record_success(self, latency):
+        with self.condition:
+            if self.baseline_latency is None or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            else:
+                ## let the baseline follow slowly when the API gets slower for everybody
+                self.baseline_latency += 0.01 * (latency - self.baseline_latency)
+            if latency <= self.latency_tolerance * self.baseline_latency and self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.condition.notify_all()
+
+    def record_overload(self, retry_after=None):
+        with self.condition:
+            now = time.monotonic()
+            if now - self.last_decrease >= self.decrease_interval:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self.last_decrease = now
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    @staticmethod
+    def parse_retry_after(value):
+        try:
+            return max(0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def observe_response(self, response, *args, **kwargs):
+        """
+        `requests` response hook used by the clients
+        """
+        if response.status_code == 429 or response.status_code >= 500:
+            self.record_overload(self.parse_retry_after(response.headers.get('Retry-After')))
+        elif response.status_code < 400:
+            self.record_success(response.elapsed.total_seconds())
+        return response
+
+    def observe_retry(self, response):
+        """
+        Called by LogRetry every time urllib3 retries a request
+        """
+        if response is None or response.status == 429 or response.status >= 500:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+            self.record_overload(retry_after)
+
+class LimitedHTTPAdapter(HTTPAdapter):
+    """
+    `requests` adapter that holds a slot of a :class:`AdaptiveConcurrencyLimiter` while it sends each request, so the
+    limit applies to the HTTP requests in flight whatever thread or task sends them. The retry strategy of the clients
+    releases the slot while it sleeps before a retry.
+
+    :param limiter: Limiter to acquire
+    :type limiter: AdaptiveConcurrencyLimiter
+    :param kwargs: Parameters of :class:`requests.adapters.HTTPAdapter`, e.g. `max_retries`
+    :type kwargs: dict
+    """
+    def __init__(self, limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        with self.limiter:
+            return super().send(request, **kwargs)
+
+def get_max_workers(client, default):
+    """
+    Returns the number of threads used by a fan-out helper: the `max_limit` of the concurrency limiter of the client when
+    it has one, since the limiter decides how many requests run at the same time, and `default` otherwise
+
+    :param client: Client used by the fan-out
+    :type client: Client or api.OpenReviewClient
+    :param default: Number of threads used when the client has no concurrency limiter
+    :type default: int
+
+    :return: Number of threads
+    :rtype: int
+    """
+    limiter = getattr(client, 'concurrency_limiter', None)
+    if isinstance(limiter, AdaptiveConcurrencyLimiter):
+        return limiter.max_limit
+    return max(1, default)
+
+def use_fast_json(response, *args, **kwargs):
+    """
+    `requests` response hook used by the clients that makes `response.json()` decode the body with :data:`json_loads`,
+    which is orjson or ujson when one of them is installed
+    """
+    if json_loads is not json.loads and not kwargs.get('stream'):
+        response.json = lambda **json_kwargs: json_loads(response.content)
+    return response
+
+def concurrent_requests(request_func, params, desc='Gathering Responses', max_workers=None):
     """
     Returns a list of results given for each request_func param execution. It shows a progress bar to know the progress of the task.
 
@@ -95,16 +268,17 @@ def concurrent_requests(request_func, params, desc='Gathering Responses'):
     :type request_func: function
     :param params: a list of values to be executed by request_func.
     :type params: list
-    :param max_workers: number of workers to use in the multiprocessing tool, default value is 6.
-    :type max_workers: int
+    :param max_workers: number of workers to use in the multiprocessing tool, by default the number of CPUs minus one.
+        Pass :func:`get_max_workers` of the client when it has a concurrency limiter.
+    :type max_workers: int, optional
 
     :return: A list of results given for each func value execution
     :rtype: list
     """
-    max_workers = cpu_count() - 1
     futures = []
     gathering_responses = tqdm(total=len(params), desc=desc)
     results = []
+    max_workers = max_workers or max(1, cpu_count() - 1)
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         for param in params:
@@ -118,6 +292,100 @@ def concurrent_requests(request_func, params, desc='Gathering Responses'):
 
         return results
 
+class PublicationLoader(object):
+    """
+    Loads the publications of many profiles from API v1 and API v2. The notes endpoints filter `content.authorids` by a
+    single author, so the requests of both API versions are scheduled together in one pool sized by
+    :func:`get_max_workers`, instead of loading all the API v1 publications before the API v2 ones. Each profile is
+    requested once even if it appears more than once, and the publications of a profile are passed to `on_loaded` as
+    soon as both of its requests finish. The progress bar shows the number of publications loaded per second.
+
+    Example:
+
+    >>> loader = openreview.tools.PublicationLoader(client_v1, client_v2)
+    >>> loader.load(profiles)
+    >>> print(loader.stats)
+
+    :param client_v1: Client used to get the API v1 publications
+    :type client_v1: Client
+    :param client_v2: Client used to get the API v2 publications
+    :type client_v2: api.OpenReviewClient
+    :param desc: Description of the progress bar
+    :type desc: str, optional
+    """
+
+    def __init__(self, client_v1, client_v2, desc='Loading publications'):
+        self.clients = { 1: client_v1, 2: client_v2 }
+        self.desc = desc
+        self.stats = {}
+
+    @staticmethod
+    def set_publications(profile, publications_by_version):
+        profile.content['publications'] = publications_by_version[1] + publications_by_version[2]
+
+    def load(self, profiles, mintcdate_by_id=None, on_loaded=None):
+        """
+        Loads the publications of the profiles
+
+        :param profiles: Profiles
+        :type profiles: list[Profile]
+        :param mintcdate_by_id: If present, only the publications created after the mintcdate of each profile id are loaded
+        :type mintcdate_by_id: dict, optional
+        :param on_loaded: Function called with the profile and a dict from API version to its publications, by default
+            it sets `profile.content['publications']` with the API v1 publications first
+        :type on_loaded: function, optional
+        """
+        on_loaded = on_loaded or self.set_publications
+        mintcdate_by_id = mintcdate_by_id or {}
+        profiles_by_id = {}
+        for profile in profiles:
+            profiles_by_id.setdefault(profile.id, []).append(profile)
+
+        def get_notes(request):
+            profile_id, api_version = request
+            mintcdate = mintcdate_by_id.get(profile_id)
+            if mintcdate is None:
+                return self.clients[api_version].get_all_notes(content={'authorids': profile_id})
+            return self.clients[api_version].get_all_notes(content={'authorids': profile_id}, mintcdate=mintcdate)
+
+        requests = [(profile_id, api_version) for profile_id in profiles_by_id for api_version in (1, 2)]
+        loaded = {}
+        publications_count = 0
+        start = time.time()
+        progress = tqdm(total=len(requests), desc=self.desc)
+
+        max_workers = get_max_workers(self.clients[2], 6)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = { executor.submit(get_notes, request): request for request in requests }
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    profile_id, api_version = futures[future]
+                    publications = future.result()
+                    publications_count += len(publications)
+                    loaded.setdefault(profile_id, {})[api_version] = publications
+                    if len(loaded[profile_id]) == 2:
+                        publications_by_version = loaded.pop(profile_id)
+                        for profile in profiles_by_id[profile_id]:
+                            on_loaded(profile, publications_by_version)
+                    progress.update(1)
+                    progress.set_postfix(publications=publications_count, per_second=round(publications_count / max(time.time() - start, 1e-6)))
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                progress.close()
+
+        elapsed = time.time() - start
+        self.stats = {
+            'profiles': len(profiles_by_id),
+            'requests': len(requests),
+            'publications': publications_count,
+            'seconds': elapsed,
+            'requests_per_second': len(requests) / elapsed if elapsed else 0,
+            'publications_per_second': publications_count / elapsed if elapsed else 0
+        }
+
 def get_profile(client, value, with_publications=False):
     """
     Get a single profile (a note) by id, if available
@@ -156,13 +424,15 @@ def get_profile(client, value, with_publications=False):
     return profile
 
 
-def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False):
+def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False, store=None):
     '''
     Helper function that repeatedly queries for profiles, given IDs and emails.
     Useful for getting more Profiles than the server will return by default (1000)
 
     :param with_preferred_emails: invitation id to get the edges where the preferred emails are stored
     :type with_preferred_emails: str
+    :param store: store used to load only the publications that changed since the previous call, see :class:`openreview.profile_store.ProfileStore`
+    :type store: openreview.profile_store.ProfileStore, optional
     '''
     ids = []
     emails = []
@@ -228,16 +498,10 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
         client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
         client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
 
-        notes_v1 = concurrent_requests(lambda profile : client_v1.get_all_notes(content={'authorids': profile.id}), profiles, desc='Loading API v1 publications')
-        for idx, publications in enumerate(notes_v1):
-            profiles[idx].content['publications'] = publications
-
-        notes_v2 = concurrent_requests(lambda profile : client_v2.get_all_notes(content={'authorids': profile.id}), profiles, desc='Loading API v2 publications')
-        for idx, publications in enumerate(notes_v2):
-            if profiles[idx].content.get('publications'):
-                profiles[idx].content['publications'] = profiles[idx].content['publications'] +  publications
-            else:
-                profiles[idx].content['publications'] = publications
+        if store is not None:
+            store.load_publications(profiles, client_v1, client_v2)
+        else:
+            PublicationLoader(client_v1, client_v2).load(profiles)
 
     if with_relations:
 
@@ -580,6 +844,71 @@ def load_duplicate_domains():
     return duplicate_domains
 
 
+class DomainCanonicalizer(object):
+    """
+    Computes the domains and subdomains of e-mail addresses and institution domains, replacing the aliases in
+    `duplicate_domains.json` with their canonical domain and leaving out the public suffixes, like 'edu' or 'ac.uk'.
+
+    The aliases are compiled once into a trie keyed by the domain labels from right to left, so every node of the trie is
+    one suffix of an alias. Lookups only walk the trie and never add nodes to it, so its size is fixed by the aliases.
+    Whether a suffix is a public suffix is checked with the `tld` package, and both these checks and the results for each
+    domain are memoized in bounded caches.
+
+    :param duplicate_domains: Dict from alias to canonical domain, defaults to `duplicate_domains.json`
+    :type duplicate_domains: dict, optional
+    :param max_size: Maximum number of domains whose result is memoized
+    :type max_size: int, optional
+    """
+
+    class Node(object):
+        __slots__ = ['children', 'canonical']
+
+        def __init__(self):
+            self.children = {}
+            self.canonical = None
+
+    def __init__(self, duplicate_domains=None, max_size=200000):
+        self.root = DomainCanonicalizer.Node()
+        for alias, canonical in (load_duplicate_domains() if duplicate_domains is None else duplicate_domains).items():
+            node = self.root
+            for label in reversed(alias.split('.')):
+                node = node.children.setdefault(label, DomainCanonicalizer.Node())
+            node.canonical = canonical
+        self.is_public_suffix = functools.lru_cache(maxsize=max_size)(tld.is_tld)
+        self.subdomains = functools.lru_cache(maxsize=max_size)(self.__subdomains)
+
+    def __subdomains(self, domain):
+        labels = [c for c in domain.split('.') if c and not c.isspace()]
+        valid_domains = set()
+        node = self.root
+        for index in range(len(labels) - 1, -1, -1):
+            node = node.children.get(labels[index]) if node is not None else None
+            suffix = '.'.join(labels[index:])
+            if not self.is_public_suffix(suffix):
+                valid_domains.add((node.canonical if node is not None else None) or suffix)
+        return tuple(sorted(valid_domains))
+
+    def canonical_subdomains(self, domains):
+        """
+        Returns the domains and subdomains of all the given domains
+
+        :param domains: e-mail addresses or domains
+        :type domains: list[str]
+
+        :return: Domains and subdomains
+        :rtype: set[str]
+        """
+        result = set()
+        for domain in domains:
+            result.update(self.subdomains(domain))
+        return result
+
+
+@run_once
+def get_domain_canonicalizer():
+    return DomainCanonicalizer()
+
+
 def subdomains(domain):
     """
     Given an email address, returns a list with the domains and subdomains.
@@ -596,15 +925,26 @@ def subdomains(domain):
     [u'iesl.cs.umass.edu', u'cs.umass.edu', u'umass.edu']
     """
 
-    duplicate_domains: dict = load_duplicate_domains()
-    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
-    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
-    valid_domains = set()
-    for d in domains:
-        if not tld.is_tld(d):
-            valid_domains.add(duplicate_domains.get(d, d))
+    return list(get_domain_canonicalizer().subdomains(domain))
+
+def canonical_subdomains(domains):
+    """
+    Given a list of email addresses or domains, returns a set with all their domains and subdomains. The results of
+    each domain are memoized, see :class:`DomainCanonicalizer`.
+
+    :param domains: e-mail addresses or domains
+    :type domains: list[str]
 
-    return sorted(valid_domains)
+    :return: Set of domains and subdomains
+    :rtype: set[str]
+
+    Example:
+
+    >>> sorted(canonical_subdomains(['iesl.cs.umass.edu', 'aberdeen.ac.uk']))
+    ['abdn.ac.uk', 'cs.umass.edu', 'iesl.cs.umass.edu', 'umass.edu']
+    """
+
+    return get_domain_canonicalizer().canonical_subdomains(domains)
 
 def get_paperhash(first_author, title):
     """
@@ -637,7 +977,7 @@ def get_paperhash(first_author, title):
     return (first_author + '|' + title).lower()
 
 
-def replace_members_with_ids(client, group):
+def replace_members_with_ids(client, group, return_result=True):
     """
     Given a Group object, iterates through the Group's members and, for any member represented by an email address, attempts to find a profile associated with that email address. If a profile is found, replaces the email with the profile id.
 
@@ -645,6 +985,8 @@ def replace_members_with_ids(client, group):
     :type client: Client
     :param group: Group for which the profiles will be updated
     :type group: Group
+    :param return_result: If False, the group is not requested again after it is posted with an OpenReviewClient and None is returned
+    :type return_result: bool, optional
 
     :return: Group with the emails replaced by Profile ids
     :rtype: Group
@@ -671,6 +1013,8 @@ def replace_members_with_ids(client, group):
         return client.post_group(group)
 
     if getattr(client, 'post_group_edit', None):
+        ## keep the posted members in the group, callers that do not request it again read them
+        group.members = list(dict.fromkeys(group.members))
         client.post_group_edit(
             invitation = group.domain + '/-/Edit',
             readers = [group.domain],
@@ -678,11 +1022,12 @@ def replace_members_with_ids(client, group):
             signatures = [group.domain],
             group = openreview.api.Group(
                 id = group.id, 
-                members = list(set(group.members))
+                members = group.members
             ),
             flush_members_cache=False
         )
-        return client.get_group(group.id)
+        if return_result:
+            return client.get_group(group.id)
 
 def concurrent_get(client, get_function, **params):
     """
@@ -697,8 +1042,6 @@ def concurrent_get(client, get_function, **params):
     :return: List of results
     :rtype: list
     """
-    max_workers = min(cpu_count() - 1, 6)
-
     if (params.get('limit') or float('inf')) <= client.limit:
         docs = get_function(**params)
         return docs
@@ -734,7 +1077,7 @@ def concurrent_get(client, get_function, **params):
     futures = []
     gathering_responses = tqdm(total=len(offset_list), desc='Gathering Responses')
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with ThreadPoolExecutor(max_workers=get_max_workers(client, min(cpu_count() - 1, 6))) as executor:
         for count, offset in enumerate(offset_list):
             params['offset'] = offset
             if (count + 1) == len(offset_list) and (end - offset) > 0:
@@ -749,6 +1092,55 @@ def concurrent_get(client, get_function, **params):
 
         return docs
 
+def concurrent_iterget(client, get_function, max_pages=4, **params):
+    """
+    Returns a generator over the results of a getter that supports `offset`, like :func:`concurrent_get`, but the pages
+    are yielded in order as they arrive instead of being collected in a list: up to `max_pages` pages are requested at
+    the same time and a page is released once it is consumed. `limit` and `offset` are honoured.
+
+    Example:
+
+    >>> frame = EdgeFrame.from_edges(concurrent_iterget(client, client.get_edges, invitation=invitation_id, raw=True))
+
+    :param client: Client used to make requests, its `limit` is the page size
+    :param get_function: Function that performs the request, it has to accept `offset`, `limit` and `with_count`
+    :type get_function: function
+    :param max_pages: Maximum number of pages requested and not consumed yet
+    :type max_pages: int, optional
+    :param params: Parameters to pass to the get_function
+    :type params: dict
+
+    :return: Generator over the results
+    :rtype: generator
+    """
+    params.pop('with_count', None)
+    offset = params.pop('offset', None) or 0
+    limit = params.pop('limit', None)
+
+    _, count = get_function(with_count=True, limit=1, **params)
+    end = count if limit is None else min(offset + limit, count)
+    offsets = iter(range(offset, end, client.limit))
+    pending = collections.deque()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_pages)) as executor:
+        def submit():
+            for page_offset in offsets:
+                pending.append(executor.submit(get_function, offset=page_offset, limit=min(client.limit, end - page_offset), **params))
+                return
+
+        try:
+            for _ in range(max(1, max_pages)):
+                submit()
+            while pending:
+                page = pending.popleft().result()
+                submit()
+                for obj in page:
+                    yield obj
+                page = None
+        finally:
+            for future in pending:
+                future.cancel()
+
 class iterget:
     """
     This class can create an iterator from a getter method that returns a list. Below all the iterators that can be created from a getter method:
@@ -810,6 +1202,12 @@ class iterget:
 
     next = __next__
 
+def object_id(obj):
+    """
+    Returns the id of an object returned by a getter, which is a dict when the getter was called with `raw=True`
+    """
+    return obj['id'] if isinstance(obj, dict) else obj.id
+
 class efficient_iterget:
     """
     This class can create an iterator from a getter method that returns a list. Below all the iterators that can be created from a getter method:
@@ -845,7 +1243,7 @@ class efficient_iterget:
         self.gathering_responses = tqdm(total=total, desc=desc) if total > self.params['limit'] else None
 
     def update_batch(self):
-        after = self.current_batch[-1].id
+        after = object_id(self.current_batch[-1])
         self.params['after'] = after
         self.params['with_count'] = False
         next_batch = self.get_function(**self.params)
@@ -876,6 +1274,149 @@ class efficient_iterget:
     next = __next__
 
 
+def sharded_get(get_function, shards=4, desc='Gathering Responses', **params):
+    """
+    Returns the same list as :class:`efficient_iterget` but fetches it with several cursors in parallel. The id space
+    is split in `shards` ranges using the ids found at evenly spaced offsets, then each range is paginated with `after`
+    until it reaches the first id of the next range. The objects are returned sorted by id, like the sequential path.
+
+    :param get_function: Getter that supports the `after`, `sort`, `offset`, `limit` and `with_count` parameters, e.g. :meth:`openreview.api.OpenReviewClient.get_notes`
+    :type get_function: function
+    :param shards: Number of ranges fetched at the same time
+    :type shards: int, optional
+    :param params: Parameters passed to the get_function, `sort` can only be the id order
+    :type params: dict
+
+    :return: List of objects sorted by id
+    :rtype: list
+    """
+    if params.get('sort') not in [None, 'id', 'id:asc']:
+        raise openreview.OpenReviewException(f"sharded_get can not be used with sort '{params['sort']}', only with the id order")
+    params.pop('with_count', None)
+    params.pop('after', None)
+    params['sort'] = 'id'
+    limit = params.pop('limit', None) or 1000
+
+    first_batch, total = get_function(limit=limit, with_count=True, **params)
+    shards = max(1, min(shards, -(-total // limit)))
+
+    gathering_responses = tqdm(total=total, desc=desc) if total > limit else None
+
+    ## The last id of each range, a range ends right before the first id of the next one
+    step = -(-total // shards)
+    last_ids = []
+    if shards > 1:
+        with ThreadPoolExecutor(max_workers=shards - 1) as executor:
+            last_batches = list(executor.map(lambda offset: get_function(offset=offset, limit=1, **params), [step * index - 1 for index in range(1, shards)]))
+        last_ids = sorted(set([object_id(batch[0]) for batch in last_batches if batch]))
+
+    def get_range(index):
+        after = last_ids[index - 1] if index > 0 else None
+        last_id = last_ids[index] if index < len(last_ids) else None
+        docs = []
+        batch = first_batch if index == 0 else get_function(after=after, limit=limit, **params)
+        while batch:
+            for doc in batch:
+                if last_id is not None and object_id(doc) > last_id:
+                    return docs
+                docs.append(doc)
+                if object_id(doc) == last_id:
+                    return docs
+            if gathering_responses:
+                gathering_responses.update(len(batch))
+            batch = get_function(after=object_id(batch[-1]), limit=limit, **params)
+        return docs
+
+    with ThreadPoolExecutor(max_workers=len(last_ids) + 1) as executor:
+        ranges = list(executor.map(get_range, range(len(last_ids) + 1)))
+
+    if gathering_responses:
+        gathering_responses.close()
+
+    return [doc for docs in ranges for doc in docs]
+
+
+def prefetch_iterget(get_function, max_pages=2, paginate_by='after', **params):
+    """
+    Returns a generator over all the objects returned by a getter, ignoring the API limit. The next pages are requested
+    in a background thread while the caller consumes the current one, and at most `max_pages` pages are held in memory
+    at any time, including the page being consumed.
+
+    :param get_function: Getter that returns a list of objects, e.g. :meth:`openreview.api.OpenReviewClient.get_notes`
+    :type get_function: function
+    :param max_pages: Maximum number of pages fetched and not consumed yet
+    :type max_pages: int, optional
+    :param paginate_by: 'after' to paginate with the id of the last object sorted by id, or 'offset' for getters that do not support `after`, like :meth:`openreview.api.OpenReviewClient.get_edges`. Offset paging is also used when `sort` is not the id order.
+    :type paginate_by: str, optional
+    :param params: Parameters passed to the get_function
+    :type params: dict
+
+    :return: Generator over the objects
+    :rtype: generator
+
+    Example:
+
+    >>> for edge in prefetch_iterget(client.get_edges, paginate_by='offset', invitation='ICML.cc/2025/Conference/Reviewers/-/Affinity_Score'):
+    ...     scores[edge.head][edge.tail] = edge.weight
+    """
+    if max_pages < 1:
+        raise openreview.OpenReviewException('max_pages must be at least 1')
+
+    params.pop('with_count', None)
+    limit = params.pop('limit', None) or 1000
+    if paginate_by == 'after':
+        ## `after` pages by the id of the last object, so the objects have to be sorted by id
+        if params.get('sort') not in [None, 'id', 'id:asc']:
+            if params.get('after'):
+                raise openreview.OpenReviewException(f"after can not be used with sort '{params['sort']}', only with the id order")
+            paginate_by = 'offset'
+        else:
+            params['sort'] = params.get('sort') or 'id'
+
+    pages = queue.Queue()
+    free_pages = threading.Semaphore(max_pages)
+    stopped = threading.Event()
+    end_of_pages = object()
+
+    def fetch_pages():
+        try:
+            offset = params.pop('offset', None) or 0
+            after = params.pop('after', None)
+            while not stopped.is_set():
+                if not free_pages.acquire(timeout=0.1):
+                    continue
+                if paginate_by == 'after':
+                    batch = get_function(after=after, limit=limit, **params) if after else get_function(limit=limit, **params)
+                else:
+                    batch = get_function(offset=offset, limit=limit, **params)
+                if batch:
+                    pages.put(batch)
+                if len(batch) < limit:
+                    break
+                after = object_id(batch[-1]) if paginate_by == 'after' else None
+                offset += len(batch)
+        except Exception as e:
+            pages.put(e)
+        pages.put(end_of_pages)
+
+    thread = threading.Thread(target=fetch_pages, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            page = pages.get()
+            if page is end_of_pages:
+                break
+            if isinstance(page, Exception):
+                raise page
+            for obj in page:
+                yield obj
+            page = None
+            free_pages.release()
+    finally:
+        stopped.set()
+
+
 def iterget_messages(client, to = None, subject = None, status = None):
     """
     Returns an iterator over Messages ignoring API limit.
@@ -1373,8 +1914,20 @@ def get_all_venues(client):
     """
     return client.get_group("host").members
 
-def info_function_builder(policy_function):
-    def inner(profile, n_years=None, submission_venueid=None):
+def info_function_builder(policy_function, cache=None):
+    """
+    Returns a function that computes the profile info used to find conflicts with the given policy, with the domains
+    expanded to their subdomains and the common email domains removed
+
+    :param policy_function: Function that returns the info of a profile, like :func:`get_profile_info`
+    :type policy_function: function
+    :param cache: Cache for the computed info, it is useful when the same profiles are used many times
+    :type cache: openreview.conflicts.ProfileInfoCache, optional
+
+    :return: Function called with the profile, n_years and submission_venueid
+    :rtype: function
+    """
+    def compute(profile, n_years=None, submission_venueid=None):
         common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
                     'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com']
         argspec = inspect.getfullargspec(policy_function)
@@ -1382,13 +1935,7 @@ def info_function_builder(policy_function):
             result = policy_function(profile, n_years, submission_venueid)
         else:
             result = policy_function(profile, n_years)
-        domains = set()
-        subdomains_dict = {}
-        for domain in result['domains']:
-            if domain not in subdomains_dict:
-                subdomains = openreview.tools.subdomains(domain)
-                subdomains_dict[domain] = subdomains
-            domains.update(subdomains_dict[domain])
+        domains = canonical_subdomains(result['domains'])
 
         # Filter common domains
         for common_domain in common_domains:
@@ -1396,6 +1943,11 @@ def info_function_builder(policy_function):
 
         result['domains'] = list(domains)
         return result
+
+    def inner(profile, n_years=None, submission_venueid=None):
+        if cache is None:
+            return compute(profile, n_years, submission_venueid)
+        return cache.get_or_compute(profile, policy_function, lambda: compute(profile, n_years, submission_venueid), n_years, submission_venueid)
     return inner
 
 def get_conflicts(author_profiles, user_profile, policy='default', n_years=None):
@@ -1675,23 +2227,548 @@ def filter_relations_by_year(relations, cut_off_year, only_relations=None):
 
     return filtered_relations
 
-def post_bulk_edges(client, edges, batch_size = 50000):
-    num_edges = len(edges)
-    result = []
-    for i in tqdm(range(0, num_edges, batch_size), total=(num_edges // batch_size + 1)):
-        end = min(i + batch_size, num_edges)
-        batch = client.post_edges(edges[i:end])
-        result += batch
-    return result
-
-def post_bulk_tags(client, tags, batch_size = 50000):
-    num_tags = len(tags)
-    result = []
-    for i in tqdm(range(0, num_tags, batch_size), total=(num_tags // batch_size + 1)):
-        end = min(i + batch_size, num_tags)
-        batch = client.post_tags(tags[i:end])
-        result += batch
-    return result
+class BulkWriter(object):
+    """
+    Posts a large list of objects in chunks. Several chunks are posted at the same time, failed chunks are retried with
+    exponential backoff and, when a checkpoint file is provided, the chunks that were posted are recorded so an interrupted
+    upload can be resumed by running the same upload again.
+
+    Chunks are identified by a hash of their content, so resuming requires the same objects in the same order and the same
+    batch size. The checkpoint file is removed once all the chunks are posted.
+
+    Failed chunks are not retried by default: a chunk that times out after being saved by the server would be posted
+    again, so only set `retries` when the posted objects are idempotent or duplicates can be tolerated.
+
+    :param post_function: Function that posts a list of objects and returns the posted objects, e.g. `client.post_edges`
+    :type post_function: function
+    :param batch_size: Number of objects per chunk
+    :type batch_size: int, optional
+    :param max_in_flight: Maximum number of chunks posted at the same time
+    :type max_in_flight: int, optional
+    :param retries: Number of times a failed chunk is posted again, 0 by default
+    :type retries: int, optional
+    :param backoff_factor: Seconds to wait before the first retry, the wait is doubled after each retry
+    :type backoff_factor: float, optional
+    :param checkpoint: Path of the checkpoint file
+    :type checkpoint: str, optional
+    :param desc: Description of the progress bar
+    :type desc: str, optional
+
+    Example:
+
+    >>> writer = BulkWriter(client.post_edges, checkpoint='affinity_scores.checkpoint')
+    >>> posted_edges = writer.write(edges)
+    >>> print(writer.chunk_stats)
+    """
+
+    def __init__(self, post_function, batch_size=50000, max_in_flight=4, retries=0, backoff_factor=2, checkpoint=None, desc='Posting'):
+        self.post_function = post_function
+        self.batch_size = batch_size
+        self.max_in_flight = max(1, max_in_flight)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.checkpoint = checkpoint
+        self.desc = desc
+        self.chunk_stats = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def chunk_digest(chunk):
+        return hashlib.sha1(json.dumps([o.to_json() for o in chunk], sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def is_retryable(error):
+        if isinstance(error, openreview.OpenReviewException) and error.args and isinstance(error.args[0], dict):
+            status = error.args[0].get('status')
+            if status is not None:
+                return status == 429 or status >= 500
+            return error.args[0].get('name') not in ['ValidationError', 'ForbiddenError', 'NotFoundError', 'NotAuthenticatedError']
+        return True
+
+    def load_checkpoint(self):
+        posted = {}
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return posted
+        with open(self.checkpoint) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    ## the last line is incomplete if the upload was interrupted while writing it
+                    continue
+                posted[record['digest']] = record['ids']
+        return posted
+
+    def save_chunk(self, digest, posted_objects):
+        if not self.checkpoint:
+            return
+        with self.lock:
+            with open(self.checkpoint, 'a') as f:
+                f.write(json.dumps({ 'digest': digest, 'ids': [o.id for o in posted_objects] }) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def post_chunk(self, index, chunk, digest):
+        attempt = 0
+        start = time.time()
+        while True:
+            try:
+                posted_objects = self.post_function(chunk)
+                break
+            except Exception as e:
+                if attempt >= self.retries or not self.is_retryable(e):
+                    raise
+                wait = self.backoff_factor * (2 ** attempt)
+                print(f'Chunk {index} failed, retrying in {wait} seconds: {e}')
+                time.sleep(wait)
+                attempt += 1
+
+        self.save_chunk(digest, posted_objects)
+        seconds = time.time() - start
+        stats = {
+            'chunk': index,
+            'size': len(chunk),
+            'seconds': seconds,
+            'attempts': attempt + 1,
+            'throughput': len(chunk) / seconds if seconds else float('inf')
+        }
+        with self.lock:
+            self.chunk_stats.append(stats)
+        tqdm.write(f"Chunk {index}: {stats['size']} objects in {seconds:.2f} seconds ({stats['throughput']:.0f} objects/s, {stats['attempts']} attempts)")
+        return posted_objects
+
+    def write(self, objects):
+        """
+        Posts the objects and returns the posted objects in the same order. The objects of chunks that were posted by a
+        previous run are returned with the ids recorded in the checkpoint.
+
+        :param objects: Objects to post
+        :type objects: list
+
+        :return: Posted objects
+        :rtype: list
+        """
+        chunks = [objects[i:i + self.batch_size] for i in range(0, len(objects), self.batch_size)]
+        digests = [self.chunk_digest(chunk) for chunk in chunks] if self.checkpoint else [None] * len(chunks)
+        posted = self.load_checkpoint()
+        results = [None] * len(chunks)
+
+        for index, (chunk, digest) in enumerate(zip(chunks, digests)):
+            if digest in posted and len(posted[digest]) == len(chunk):
+                resumed = []
+                for o, id in zip(chunk, posted[digest]):
+                    o = copy.copy(o)
+                    o.id = id
+                    resumed.append(o)
+                results[index] = resumed
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if len(pending) < len(chunks):
+            print(f'Resuming from {self.checkpoint}: {len(chunks) - len(pending)} of {len(chunks)} chunks already posted')
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            futures = { executor.submit(self.post_chunk, index, chunks[index], digests[index]): index for index in pending }
+            try:
+                for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc=self.desc):
+                    results[futures[future]] = future.result()
+            except Exception:
+                ## chunks already in flight finish and are recorded in the checkpoint
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+        return [o for result in results for o in result]
+
+    def write_stream(self, objects):
+        """
+        Posts the objects of an iterable, like a generator that builds them while a file is read, without keeping them
+        in memory. Chunks are built as the iterable is consumed and at most `max_in_flight` chunks are waiting to be
+        posted, so the memory used does not depend on the number of objects. The posted objects are not returned.
+
+        :param objects: Objects to post
+        :type objects: iterable
+
+        :return: Number of objects posted, including the ones posted by a previous run
+        :rtype: int
+        """
+        posted = self.load_checkpoint()
+        iterator = iter(objects)
+        count = 0
+        resumed_chunks = 0
+        in_flight = set()
+        progress = tqdm(desc=self.desc, unit='objects')
+
+        def update(done):
+            for future in done:
+                progress.update(len(future.result()))
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            try:
+                index = 0
+                while True:
+                    chunk = list(itertools.islice(iterator, self.batch_size))
+                    if not chunk:
+                        break
+                    count += len(chunk)
+                    digest = self.chunk_digest(chunk) if self.checkpoint else None
+                    if digest in posted and len(posted[digest]) == len(chunk):
+                        resumed_chunks += 1
+                        progress.update(len(chunk))
+                    else:
+                        while len(in_flight) >= self.max_in_flight:
+                            done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                            update(done)
+                        in_flight.add(executor.submit(self.post_chunk, index, chunk, digest))
+                    chunk = None
+                    index += 1
+                done, in_flight = concurrent.futures.wait(in_flight)
+                update(done)
+            except Exception:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                progress.close()
+
+        if resumed_chunks:
+            print(f'Resumed from {self.checkpoint}: {resumed_chunks} chunks were already posted')
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+        return count
+
+def post_bulk_edges(client, edges, batch_size = 50000, max_in_flight = 4, retries = 0, checkpoint = None):
+    """
+    Posts a list of edges in chunks using :class:`BulkWriter`
+
+    :param client: Client used to post the edges
+    :type client: Client or OpenReviewClient
+    :param edges: Edges to post
+    :type edges: list[Edge]
+    :param batch_size: Number of edges per chunk
+    :type batch_size: int, optional
+    :param max_in_flight: Maximum number of chunks posted at the same time
+    :type max_in_flight: int, optional
+    :param retries: Number of times a failed chunk is posted again, chunks are not retried by default since posting them is not idempotent
+    :type retries: int, optional
+    :param checkpoint: Path of a checkpoint file used to resume an interrupted upload
+    :type checkpoint: str, optional
+
+    :return: Posted edges
+    :rtype: list[Edge]
+    """
+    writer = BulkWriter(client.post_edges, batch_size=batch_size, max_in_flight=max_in_flight, retries=retries, checkpoint=checkpoint, desc='Posting edges')
+    return writer.write(edges)
+
+def post_bulk_tags(client, tags, batch_size = 50000, max_in_flight = 4, retries = 0, checkpoint = None):
+    """
+    Posts a list of tags in chunks using :class:`BulkWriter`
+
+    :param client: Client used to post the tags
+    :type client: Client or OpenReviewClient
+    :param tags: Tags to post
+    :type tags: list[Tag]
+    :param batch_size: Number of tags per chunk
+    :type batch_size: int, optional
+    :param max_in_flight: Maximum number of chunks posted at the same time
+    :type max_in_flight: int, optional
+    :param retries: Number of times a failed chunk is posted again, chunks are not retried by default since posting them is not idempotent
+    :type retries: int, optional
+    :param checkpoint: Path of a checkpoint file used to resume an interrupted upload
+    :type checkpoint: str, optional
+
+    :return: Posted tags
+    :rtype: list[Tag]
+    """
+    writer = BulkWriter(client.post_tags, batch_size=batch_size, max_in_flight=max_in_flight, retries=retries, checkpoint=checkpoint, desc='Posting tags')
+    return writer.write(tags)
+
+class GroupMembershipBatcher(object):
+    """
+    Collects members added to and removed from many groups and posts them with one group edit per group and
+    operation. The edits of different groups are posted at the same time in a pool sized by :func:`get_max_workers`.
+
+    Unlike :meth:`openreview.api.OpenReviewClient.add_members_to_group`, the groups are not requested before or after
+    the edit when the edit invitation and signatures are known, either because they are passed to the constructor or
+    because the groups were loaded with :meth:`prefetch`. Removing members from a group with anonymous ids needs the
+    anonymous id of each member, so those groups are requested when they were not prefetched.
+
+    When a member is added and removed from the same group before :meth:`flush`, the last change is the one posted.
+
+    :param client: Client used to post the group edits
+    :type client: api.OpenReviewClient
+    :param invitation: Invitation used to edit the groups, e.g. the venue meta invitation
+    :type invitation: str, optional
+    :param signatures: Signatures of the group edits
+    :type signatures: list[str], optional
+    :param desc: Description of the progress bar
+    :type desc: str, optional
+
+    Example:
+
+    >>> batcher = GroupMembershipBatcher(client, invitation='ICML.cc/2025/Conference/-/Edit', signatures=['ICML.cc/2025/Conference'])
+    >>> batcher.add('ICML.cc/2025/Conference/Submission1/Reviewers', ['~Reviewer_One1', '~Reviewer_Two1'])
+    >>> batcher.remove('ICML.cc/2025/Conference/Submission2/Reviewers', '~Reviewer_Three1')
+    >>> result = batcher.flush()
+    >>> print(result['failures'])
+    """
+
+    def __init__(self, client, invitation=None, signatures=None, desc='Updating group members'):
+        self.client = client
+        self.invitation = invitation
+        self.signatures = signatures
+        self.desc = desc
+        self.groups = {}
+        self.changes = {}
+        self.lock = threading.Lock()
+
+    def set_group(self, group, members_by_anonid=None):
+        """
+        Stores the edit invitation, signatures and anonymous ids of a group so it is not requested by :meth:`flush`
+
+        :param group: Group, with its members translated to profile ids when it uses anonymous ids
+        :type group: api.Group
+        :param members_by_anonid: Dict from anonymous group id to its member, used to translate the members of the group
+        :type members_by_anonid: dict, optional
+        """
+        anon_ids = {}
+        if group.anonids:
+            if members_by_anonid is None:
+                anon_ids = dict(zip(group.members, group.transform_to_anon_ids(list(group.members))))
+            else:
+                anon_ids = { members_by_anonid[member]: member for member in group.members or [] if member in members_by_anonid }
+        with self.lock:
+            self.groups[group.id] = {
+                'invitation': f'{group.domain}/-/Edit',
+                'signatures': group.signatures,
+                'anon_ids': anon_ids
+            }
+
+    def prefetch(self, prefix):
+        """
+        Loads all the groups whose id starts with prefix, with one paged request instead of one request per group
+
+        :param prefix: Prefix of the group ids, e.g. the paper group prefix of a venue
+        :type prefix: str
+        """
+        groups = self.client.get_all_groups(prefix=prefix)
+        members_by_anonid = { g.id: g.members[0] for g in groups if g.members }
+        for group in groups:
+            self.set_group(group, members_by_anonid)
+
+    def __change(self, group, members, add):
+        group_id = group if isinstance(group, str) else group.id
+        if isinstance(members, str):
+            members = [members]
+        if not isinstance(members, list):
+            raise openreview.OpenReviewException(f'GroupMembershipBatcher - members {members} must be a str or list, but got {type(members)} instead')
+        with self.lock:
+            changes = self.changes.setdefault(group_id, {})
+            for member in members:
+                changes[member] = add
+
+    def add(self, group, members):
+        """
+        Adds members to a group when :meth:`flush` is called
+
+        :param group: Group (or Group's id) to which the members will be added
+        :type group: Group or str
+        :param members: Members that will be added to the group
+        :type members: str or list[str]
+        """
+        self.__change(group, members, True)
+
+    def remove(self, group, members):
+        """
+        Removes members from a group when :meth:`flush` is called
+
+        :param group: Group (or Group's id) from which the members will be removed
+        :type group: Group or str
+        :param members: Members that will be removed from the group
+        :type members: str or list[str]
+        """
+        self.__change(group, members, False)
+
+    def __get_group(self, group_id, removing):
+        group = self.groups.get(group_id)
+        if group is None and (removing or not self.invitation or not self.signatures):
+            self.set_group(self.client.get_group(group_id))
+            group = self.groups[group_id]
+        if group is None:
+            group = { 'invitation': self.invitation, 'signatures': self.signatures, 'anon_ids': {} }
+        return group
+
+    def __post(self, group_id, changes):
+        added = sorted(member for member, add in changes.items() if add)
+        removed = sorted(member for member, add in changes.items() if not add)
+        group = self.__get_group(group_id, bool(removed))
+
+        for operation, members in [('remove', [group['anon_ids'].get(member, member) for member in removed]), ('add', added)]:
+            if members:
+                self.client.post_group_edit(
+                    invitation=group['invitation'],
+                    signatures=group['signatures'],
+                    readers=group['signatures'],
+                    writers=group['signatures'],
+                    group=openreview.api.Group(
+                        id=group_id,
+                        members={
+                            operation: members
+                        }
+                    )
+                )
+        return len(added), len(removed)
+
+    def flush(self):
+        """
+        Posts the changes collected since the previous flush. A group whose edit fails does not stop the edits of the
+        other groups, the failures are returned by group id.
+
+        :return: Dict with the number of groups edited, members added and removed, and the exception of each group that failed
+        :rtype: dict
+        """
+        with self.lock:
+            changes, self.changes = self.changes, {}
+
+        result = { 'groups': 0, 'added': 0, 'removed': 0, 'failures': {} }
+        if not changes:
+            return result
+
+        with ThreadPoolExecutor(max_workers=get_max_workers(self.client, 6)) as executor:
+            futures = { executor.submit(self.__post, group_id, group_changes): group_id for group_id, group_changes in changes.items() }
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc=self.desc):
+                group_id = futures[future]
+                try:
+                    added, removed = future.result()
+                except Exception as e:
+                    tqdm.write(f'Group {group_id} failed: {e}')
+                    result['failures'][group_id] = e
+                    continue
+                result['groups'] += 1
+                result['added'] += added
+                result['removed'] += removed
+
+        return result
+
+def _sync(current, desired, key, fields, delete_missing, from_json, post_function, desc):
+
+    def value(item, field):
+        item_value = item.get(field) if isinstance(item, dict) else getattr(item, field, None)
+        if isinstance(item_value, list):
+            return tuple(item_value) if item_value else None
+        return item_value
+
+    def signature(item):
+        return tuple(value(item, field) for field in fields)
+
+    current_by_key = {}
+    duplicated = []
+    for item in current:
+        item_key = tuple(value(item, field) for field in key)
+        if item_key in current_by_key:
+            duplicated.append(item)
+        else:
+            current_by_key[item_key] = item
+
+    ## the last desired item of a key wins, otherwise a repeated key would be posted twice
+    desired_by_key = {}
+    for item in desired:
+        desired_by_key[tuple(value(item, field) for field in key)] = item
+
+    changes = { 'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0 }
+    to_post = []
+    for item_key, item in desired_by_key.items():
+        current_item = current_by_key.pop(item_key, None)
+        if current_item is None:
+            to_post.append(item)
+            changes['added'] += 1
+        elif signature(current_item) != signature(item):
+            item.id = value(current_item, 'id')
+            to_post.append(item)
+            changes['updated'] += 1
+        else:
+            changes['unchanged'] += 1
+
+    removed = list(current_by_key.values()) if delete_missing else []
+    now = datetime_millis(datetime.datetime.now())
+    for item in removed + duplicated:
+        item = from_json(item) if isinstance(item, dict) else item
+        item.ddate = now
+        to_post.append(item)
+        changes['deleted'] += 1
+
+    if to_post:
+        post_function(to_post)
+    print('{}: {} added, {} updated, {} deleted, {} unchanged'.format(desc, changes['added'], changes['updated'], changes['deleted'], changes['unchanged']))
+    return changes
+
+def sync_edges(client, invitation, desired_edges, key=('head', 'tail'), fields=('weight', 'label', 'readers', 'nonreaders'), delete_missing=True, current_edges=None, **filters):
+    """
+    Makes the edges of an invitation equal to the desired edges posting only the difference. The current edges are
+    loaded in bulk and matched with the desired edges by the key fields using a dict, the desired edges that are new or
+    whose compared fields changed are posted, and the current edges that are not desired, or repeat a key, are soft
+    deleted. When the desired edges repeat a key, the last one is used. Everything is posted with
+    :func:`post_bulk_edges`, so unchanged edges cost nothing.
+
+    Example:
+
+    >>> openreview.tools.sync_edges(client, conflict_invitation_id, conflict_edges)
+    {'added': 12, 'updated': 0, 'deleted': 3, 'unchanged': 23450}
+
+    :param client: Client used to get and post the edges
+    :type client: OpenReviewClient
+    :param invitation: Invitation id of the edges
+    :type invitation: str
+    :param desired_edges: Edges that the invitation should have
+    :type desired_edges: list[Edge]
+    :param key: Fields that identify an edge
+    :type key: tuple[str], optional
+    :param fields: Fields compared to decide whether an edge changed, empty lists and None are considered equal
+    :type fields: tuple[str], optional
+    :param delete_missing: If False, the current edges that are not desired are kept
+    :type delete_missing: bool, optional
+    :param current_edges: Current edges as Edge objects or json dicts, loaded from the API if not provided
+    :type current_edges: list, optional
+    :param filters: Filters used to load the current edges, e.g. head, to sync only part of the invitation
+    :type filters: dict, optional
+
+    :return: Number of edges added, updated, deleted and unchanged
+    :rtype: dict
+    """
+    if current_edges is None:
+        current_edges = client.get_all_edges(invitation=invitation, raw=True, **filters)
+    return _sync(current_edges, desired_edges, key, fields, delete_missing, openreview.api.Edge.from_json, lambda edges: post_bulk_edges(client, edges), invitation)
+
+def sync_tags(client, invitation, desired_tags, key=('forum', 'note', 'profile'), fields=('tag', 'weight', 'label', 'readers', 'nonreaders'), delete_missing=True, current_tags=None, **filters):
+    """
+    Makes the tags of an invitation equal to the desired tags posting only the difference, see :func:`sync_edges`
+
+    :param client: Client used to get and post the tags
+    :type client: OpenReviewClient
+    :param invitation: Invitation id of the tags
+    :type invitation: str
+    :param desired_tags: Tags that the invitation should have
+    :type desired_tags: list[Tag]
+    :param key: Fields that identify a tag
+    :type key: tuple[str], optional
+    :param fields: Fields compared to decide whether a tag changed, empty lists and None are considered equal
+    :type fields: tuple[str], optional
+    :param delete_missing: If False, the current tags that are not desired are kept
+    :type delete_missing: bool, optional
+    :param current_tags: Current tags as Tag objects or json dicts, loaded from the API if not provided
+    :type current_tags: list, optional
+    :param filters: Filters used to load the current tags, e.g. profile
+    :type filters: dict, optional
+
+    :return: Number of tags added, updated, deleted and unchanged
+    :rtype: dict
+    """
+    if current_tags is None:
+        current_tags = client.get_all_tags(invitation=invitation, raw=True, **filters)
+    return _sync(current_tags, desired_tags, key, fields, delete_missing, openreview.api.Tag.from_json, lambda tags: post_bulk_tags(client, tags), invitation)
 
 def overwrite_pdf(client, note_id, file_path):
     """
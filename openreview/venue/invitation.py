@@ -56,7 +56,7 @@ class InvitationBuilder(object):
         if invitation.content['group_edit_script']['value'] != self.get_process_content('process/group_edit_process.py'):
             return True
 
-    def save_invitation(self, invitation, replacement=None):
+    def save_invitation(self, invitation, replacement=None, return_result=True, prefetched_invitation=None):
         self.client.post_invitation_edit(invitations=self.venue.get_meta_invitation_id(),
             readers=[self.venue_id],
             writers=[self.venue_id],
@@ -64,6 +64,13 @@ class InvitationBuilder(object):
             replacement=replacement,
             invitation=invitation
         )
+
+        if not return_result:
+            ## the invitation is only requested to wait for its date process, known from the invitation already loaded or the one posted
+            date_processes = (prefetched_invitation or invitation).date_processes
+            if not (date_processes and len(date_processes[0].get('dates', [])) > 1 and self.update_date_string == date_processes[0]['dates'][1]):
+                return None
+
         invitation = self.client.get_invitation(invitation.id)
 
         if invitation.date_processes and len(invitation.date_processes[0]['dates']) > 1 and self.update_date_string == invitation.date_processes[0]['dates'][1]:
@@ -93,7 +100,9 @@ class InvitationBuilder(object):
                     duedate=now if (invitation.duedate and invitation.duedate > now) else None,
                     expdate=now,
                     signatures=[self.venue_id]
-                )
+                ),
+                return_result=False,
+                prefetched_invitation=invitation
             )
 
     def unexpire_invitation(self, invitation_id):
@@ -103,8 +112,10 @@ class InvitationBuilder(object):
             self.save_invitation(invitation=Invitation(id=invitation.id,
                     expdate={ "delete": True },
                     signatures=[self.venue_id]
-                )
-            )            
+                ),
+                return_result=False,
+                prefetched_invitation=invitation
+            )
 
     def get_process_content(self, file_path):
         process = None
@@ -1,6 +1,9 @@
 import csv
 import datetime
+import io
+import json
 import os
+import tempfile
 import openreview
 from openreview.api import Edge
 from openreview.api import Invitation
@@ -8,10 +11,17 @@ from tqdm import tqdm
 import time
 import random
 import string
+import numpy as np
 from .. import tools
 from operator import concat
 from functools import reduce
 
+try:
+    import scipy.optimize
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
 class Matching(object):
 
     def __init__(self, venue, match_group, alternate_matching_group=None, submission_content=None):
@@ -40,6 +50,11 @@ class Matching(object):
         self.should_read_by_area_chair = self.is_reviewer and venue.use_area_chairs and (openreview.stages.IdentityReaders.AREA_CHAIRS_ASSIGNED in self.venue.reviewer_identity_readers or openreview.stages.IdentityReaders.AREA_CHAIRS in self.venue.reviewer_identity_readers)
         self.sac_profile_info = None #expects a policy, for example: openreview.tools.get_sac_profile_info
         self.sac_n_years = None
+        self.profile_info_cache = None #expects an openreview.conflicts.ProfileInfoCache, for example with a path to reuse the info of unchanged profiles
+        self.profile_store = None #expects an openreview.profile_store.ProfileStore to load only the publications that changed since the previous setup
+        self.incremental = False
+        self.edge_changes = {}
+        self.conflict_workers = None
         self.submission_content = submission_content
 
     def _get_submission_content_query(self):
@@ -313,17 +328,52 @@ class Matching(object):
         invitation = self.venue.invitation_builder.save_invitation(invitation, replacement=True)
         return invitation
 
+    def _replace_edges(self, invitation_id, edges):
+        """
+        Replaces the edges of the invitation with the given edges. In incremental mode only the difference is posted using
+        :func:`openreview.tools.sync_edges`, otherwise all the edges are deleted and posted again. The edges can be a
+        generator: they are all built and written to a temporary file before the current edges are deleted, so an
+        invalid row leaves the previous edges in place, and they are posted from that file, so they are never all in
+        memory at once.
+
+        :return: Number of edges added, updated, deleted and unchanged
+        :rtype: dict
+        """
+        if not self.incremental:
+            ## the file stays in memory while it is small and is moved to disk when it grows
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024, mode='w+') as spool:
+                edge_class = Edge
+                for edge in edges:
+                    edge_class = type(edge)
+                    spool.write(json.dumps(edge.to_json(), separators=(',', ':')) + '\n')
+                spool.seek(0)
+                self.client.delete_edges(invitation_id, wait_to_finish=True)
+                edges_posted = openreview.tools.BulkWriter(self.client.post_edges, desc='Posting edges').write_stream(edge_class.from_json(json.loads(line)) for line in spool)
+            changes = { 'added': edges_posted, 'updated': 0, 'deleted': None, 'unchanged': 0 }
+            self.edge_changes[invitation_id] = changes
+            return changes
+
+        changes = openreview.tools.sync_edges(self.client, invitation_id, edges)
+        self.edge_changes[invitation_id] = changes
+        return changes
+
     def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
         if self.alternate_matching_group:
             return
-        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        try:
+            return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        finally:
+            ## persist the infos computed so far, even when the build fails
+            if self.profile_info_cache is not None:
+                self.profile_info_cache.flush()
 
     def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
         invitation = self._create_edge_invitation(self.venue.get_conflict_score_id(self.match_group.id))
         invitation_id = invitation.id
         print(invitation_id)
         # Get profile info from the match group
-        info_function = tools.info_function_builder(get_profile_info)
+        cache = self.profile_info_cache if self.profile_info_cache is not None else openreview.conflicts.ProfileInfoCache()
+        info_function = tools.info_function_builder(get_profile_info, cache=cache)
         user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
         # Get profile info from all the authors
         all_authorids = []
@@ -331,95 +381,89 @@ class Matching(object):
             authorids = submission.content['authorids']['value']
             all_authorids = all_authorids + authorids
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
+        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True, store=self.profile_store)
 
         ## for AC conflicts, check SAC conflicts too
         sac_user_info_by_id = {}
         if self.is_area_chair:
             sacs_by_ac =  { g['id']['head']: [v['tail'] for v in g['values']] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.senior_area_chairs_id, deployed=True), groupby='head', select=None)}
             if sacs_by_ac:
-                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, with_relations=True)
+                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, with_relations=True, store=self.profile_store)
                 if self.sac_profile_info:
-                    info_funcion = tools.info_function_builder(self.sac_profile_info)
+                    info_funcion = tools.info_function_builder(self.sac_profile_info, cache=cache)
                     sac_user_info_by_id = { p.id: info_funcion(p, self.sac_n_years, self.venue.get_submission_venue_id()) for p in sac_user_profiles }
                 else:
                     sac_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in sac_user_profiles }
 
             pcs_by_sac = { g['id']['head']: g['values'][0]['tail'] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.venue.get_program_chairs_id(), deployed=True), groupby='head', select=None)}
             if pcs_by_sac:
-                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True)   
+                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True, store=self.profile_store)
                 pc_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in pc_user_profiles }
 
-        edges = []
+        user_engine = openreview.conflicts.ConflictEngine(user_profiles_info)
 
+        ## ACs are also in conflict when one of their assigned SACs, or the PC assigned to those SACs, is in conflict
+        sac_engine = None
+        pc_engine = None
+        acs_by_sac = {}
+        acs_by_pc = {}
+        if self.is_area_chair:
+            sac_engine = openreview.conflicts.ConflictEngine(sac_user_info_by_id.values())
+            if pcs_by_sac:
+                pc_engine = openreview.conflicts.ConflictEngine(pc_user_info_by_id.values())
+            for code, user_info in enumerate(user_profiles_info):
+                for sac in sacs_by_ac.get(user_info['id'], []):
+                    acs_by_sac.setdefault(sac, []).append(code)
+                    if pcs_by_sac:
+                        acs_by_pc.setdefault(pcs_by_sac.get(sac), []).append(code)
+
+        author_infos = []
         for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
             # Get author profiles
             authorids = submission.content['authorids']['value']
 
             # Extract domains from each authorprofile
-            author_ids = set()
-            author_domains = set()
-            author_relations = set()
-            author_publications = set()
+            paper_author_infos = []
             for authorid in authorids:
                 if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_ids.add(author_info['id'])
-                    author_domains.update(author_info['domains'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+                    paper_author_infos.append(info_function(author_profile_by_id[authorid], compute_conflicts_n_years))
                 else:
                     print(f'Profile not found: {authorid}')
+            author_infos.append(openreview.conflicts.merge_infos(paper_author_infos))
 
-            # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_ids.intersection(set([user_info['id']])))
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection([user_info['id']]))
-                conflicts.update(author_ids.intersection(user_info['relations']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                ## Transfer SAC conflicts
-                if len(conflicts) == 0 and self.is_area_chair:
-                    assigned_sacs = sacs_by_ac.get(user_info['id'], [])
-                    for sac in assigned_sacs:
-                        sac_info = sac_user_info_by_id.get(sac)
-                        if sac_info:
-                            conflicts.update(author_ids.intersection(set([sac_info['id']])))
-                            conflicts.update(author_domains.intersection(sac_info['domains']))
-                            conflicts.update(author_relations.intersection([sac_info['id']]))
-                            conflicts.update(author_ids.intersection(sac_info['relations']))
-                            conflicts.update(author_publications.intersection(sac_info['publications']))
-
-                ## Transfer PC conflicts
-                if len(conflicts) == 0 and self.is_area_chair and pcs_by_sac:
-                    assigned_pcs = [pcs_by_sac.get(sac) for sac in assigned_sacs]
-                    for pc in assigned_pcs:
-                        pc_info = pc_user_info_by_id.get(pc)
-                        if pc_info:
-                            conflicts.update(author_ids.intersection(set([pc_info['id']])))                            
-                            conflicts.update(author_domains.intersection(pc_info['domains']))
-                            conflicts.update(author_relations.intersection([pc_info['id']]))
-                            conflicts.update(author_ids.intersection(pc_info['relations']))
-                            conflicts.update(author_publications.intersection(pc_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation_id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
+        # Compute conflicts for each user and all the paper authors
+        user_conflicts = user_engine.conflicts_many(author_infos, workers=self.conflict_workers)
+        sac_conflicts = sac_engine.conflicts_many(author_infos) if sac_engine else None
+        pc_conflicts = pc_engine.conflicts_many(author_infos) if pc_engine else None
 
-        ## Delete previous conflicts
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        edges = []
+        for index, submission in enumerate(submissions):
+            conflicted = np.zeros(len(user_engine), dtype=bool)
+            conflicted[user_conflicts[index]] = True
+
+            ## Transfer SAC and PC conflicts
+            if sac_engine:
+                for code in sac_conflicts[index]:
+                    conflicted[acs_by_sac.get(sac_engine.user_infos[code]['id'], [])] = True
+            if pc_engine:
+                for code in pc_conflicts[index]:
+                    conflicted[acs_by_pc.get(pc_engine.user_infos[code]['id'], [])] = True
+
+            for code in np.flatnonzero(conflicted):
+                user_info = user_profiles_info[code]
+                edges.append(Edge(
+                    invitation=invitation_id,
+                    head=submission.id,
+                    tail=user_info['id'],
+                    weight=-1,
+                    label='Conflict',
+                    readers=self._get_edge_readers(tail=user_info['id']),
+                    writers=[self.venue.id],
+                    signatures=[self.venue.id]
+                ))
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        ## Replace previous conflicts
+        self._replace_edges(invitation_id, edges)
 
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
@@ -457,8 +501,9 @@ class Matching(object):
                     ## Update edge if the new capacity is lower
                     if current_edge.weight > review_capacity:
                         print(f'Update edge for {user_profile.id}')
-                        current_edge.weight=review_capacity
-                        self.client.post_edge(current_edge)
+                        edge = Edge.from_json(current_edge.to_json())
+                        edge.weight = review_capacity
+                        edges.append(edge)
 
                 else:
                     edge = Edge(
@@ -472,21 +517,19 @@ class Matching(object):
                     )
                     edges.append(edge)
 
-
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        openreview.tools.sync_edges(self.client, invitation_id, edges, delete_missing=False, current_edges=list(current_custom_max_edges.values()))
 
         return invitation
 
     def _build_scores_from_file(self, score_invitation_id, score_file, submissions):
         if self.alternate_matching_group:
             return self._build_profile_scores(score_invitation_id, score_file=score_file)
-        scores = []
         with open(score_file) as file_handle:
-            scores = [row for row in csv.reader(file_handle)]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+            return self._build_note_scores(score_invitation_id, csv.reader(file_handle), submissions)
 
     def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions):
-        scores = [input_line.split(',') for input_line in scores_stream.decode().strip().split('\n')]
+        ## Read the rows as they are posted instead of splitting the whole payload
+        scores = csv.reader(io.TextIOWrapper(io.BytesIO(scores_stream), encoding='utf-8'))
         if self.alternate_matching_group:
             return self._build_profile_scores(score_invitation_id, scores=scores)
         return self._build_note_scores(score_invitation_id, scores, submissions)
@@ -495,37 +538,37 @@ class Matching(object):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
-        edges = []
 
         # Validate and select scores
         if not scores and not score_file:
             raise openreview.OpenReviewException('No profile scores provided')
-        if scores:
-            score_handle = scores
-        elif score_file:
-            score_handle = csv.reader(open(score_file))
-
-        for row in tqdm(score_handle, desc='_build_scores'):
-
-            score = str(max(round(float(row[2]), 4), 0))
-            edges.append(Edge(
-                    invitation=invitation_id,
-                    head=row[0],
-                    tail=row[1],
-                    weight=float(score),
-                    readers=self._get_edge_readers(tail=row[1]),
-                    writers=[self.venue.id],
-                    signatures=[self.venue.id]
-                ))
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        def build_edges(score_handle):
+            for row in tqdm(score_handle, desc='_build_scores'):
+                if not row:
+                    continue
+                score = str(max(round(float(row[2]), 4), 0))
+                yield Edge(
+                        invitation=invitation_id,
+                        head=row[0],
+                        tail=row[1],
+                        weight=float(score),
+                        readers=self._get_edge_readers(tail=row[1]),
+                        writers=[self.venue.id],
+                        signatures=[self.venue.id]
+                    )
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        ## Replace previous scores
+        if scores:
+            changes = self._replace_edges(invitation_id, build_edges(scores))
+        else:
+            with open(score_file) as file_handle:
+                changes = self._replace_edges(invitation_id, build_edges(csv.reader(file_handle)))
+        edges_count = changes['added'] + changes['updated'] + changes['unchanged']
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, edges_count, edges_posted))
         return invitation
 
     def _build_note_scores(self, score_invitation_id, scores, submissions):
@@ -535,38 +578,38 @@ class Matching(object):
 
         submissions_per_id = {note.id: note.number for note in submissions}
 
-        edges = []
         deleted_papers = set()
-        for score_line in tqdm(scores, desc='_build_scores'):
-            if score_line:
-                paper_note_id = score_line[0]
-                paper_number = submissions_per_id.get(paper_note_id)
-                if paper_number:
-                    profile_id = score_line[1]
-                    score = str(max(round(float(score_line[2]), 4), 0))
-                    edges.append(openreview.Edge(
-                        invitation=invitation_id,
-                        head=paper_note_id,
-                        tail=profile_id,
-                        weight=float(score),
-                        readers=self._get_edge_readers(tail=profile_id),
-                        # nonreaders=[self.venue.get_authors_id(number=paper_number)],
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
-                else:
-                    deleted_papers.add(paper_note_id)
+        def build_edges():
+            for score_line in tqdm(scores, desc='_build_scores'):
+                if score_line:
+                    paper_note_id = score_line[0]
+                    paper_number = submissions_per_id.get(paper_note_id)
+                    if paper_number:
+                        profile_id = score_line[1]
+                        score = str(max(round(float(score_line[2]), 4), 0))
+                        yield openreview.Edge(
+                            invitation=invitation_id,
+                            head=paper_note_id,
+                            tail=profile_id,
+                            weight=float(score),
+                            readers=self._get_edge_readers(tail=profile_id),
+                            # nonreaders=[self.venue.get_authors_id(number=paper_number)],
+                            writers=[self.venue.id],
+                            signatures=[self.venue.id]
+                        )
+                    else:
+                        deleted_papers.add(paper_note_id)
+
+        ## Replace previous scores
+        changes = self._replace_edges(invitation_id, build_edges())
+        edges_count = changes['added'] + changes['updated'] + changes['unchanged']
 
         print('deleted papers', deleted_papers)
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
-
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Scores found: {1}, Edges posted: {2}'.format(score_invitation_id, edges_count, edges_posted))
         return invitation
 
     def _compute_scores(self, score_invitation_id, submissions, model='specter+mfr'):
@@ -588,31 +631,19 @@ class Matching(object):
                 expertise_selection_id=venue.get_expertise_selection_id(self.match_group.id),
                 model=model
             )
-            status = ''
-            call_count = 0
-            while 'Completed' not in status and 'Error' not in status:
-                if call_count == 1440: ## one day to wait the completion or trigger a timeout
-                    break
-                time.sleep(60)
-                status_response = client.get_expertise_status(job_id['jobId'])
-                status = status_response.get('status')
-                desc = status_response.get('description')
-                call_count += 1
-            if 'Completed' in status:
-                result = client.get_expertise_results(job_id['jobId'])
-                matching_status['no_profiles'] = result['metadata']['no_profile']
-                matching_status['no_publications'] = result['metadata']['no_publications']
-
-                if self.alternate_matching_group:
-                    scores = [[entry['submission_member'], entry['match_member'], entry['score']] for entry in result['results']]
-                    return self._build_profile_scores(score_invitation_id, scores=scores), matching_status
-
-                scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
-                return self._build_note_scores(score_invitation_id, scores, submissions), matching_status
-            if 'Error' in status:
-                raise openreview.OpenReviewException('There was an error computing scores, description: ' + desc)
-            if call_count == 1440:
-                raise openreview.OpenReviewException('Time out computing scores, description: ' + desc)
+            ## one day to wait the completion or trigger a timeout
+            tracker = openreview.expertise.ExpertiseJobTracker(client, timeout=24 * 60 * 60)
+            tracker.wait_for(job_id['jobId'])
+            result = tracker.get_results(job_id['jobId'])
+            matching_status['no_profiles'] = result['metadata']['no_profile']
+            matching_status['no_publications'] = result['metadata']['no_publications']
+
+            if self.alternate_matching_group:
+                scores = [[entry['submission_member'], entry['match_member'], entry['score']] for entry in result['results']]
+                return self._build_profile_scores(score_invitation_id, scores=scores), matching_status
+
+            scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
+            return self._build_note_scores(score_invitation_id, scores, submissions), matching_status
         except openreview.OpenReviewException as e:
             raise openreview.OpenReviewException('There was an error connecting with the expertise API: ' + str(e))
 
@@ -960,10 +991,13 @@ class Matching(object):
 
         invitation = venue.invitation_builder.save_invitation(config_inv)
 
-    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None):
+    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, incremental=False, workers=None):
 
         venue = self.venue
         client = self.client
+        self.incremental = incremental
+        self.conflict_workers = workers
+        self.edge_changes = {}
 
         matching_status = {
             'no_profiles': [],
@@ -978,7 +1012,7 @@ class Matching(object):
                 'WARNING: not all reviewers have been converted to profile IDs.',
                 'Members without profiles will not have metadata created.')
 
-        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, with_relations=compute_conflicts)
+        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, with_relations=compute_conflicts, store=self.profile_store)
 
         submissions = self._get_submissions()
 
@@ -1068,6 +1102,9 @@ class Matching(object):
         self._create_edge_invitation(self.venue.get_custom_user_demands_id(self.match_group.id))
         self.venue.update_conflict_policies(self.match_group.id, compute_conflicts, compute_conflicts_n_years)
 
+        if incremental:
+            matching_status['edge_changes'] = self.edge_changes
+
         return matching_status
 
     def setup_invite_assignment(self, hash_seed, assignment_title=None, due_date=None, invitation_labels={}, invited_committee_name='External_Reviewers', email_template=None, proposed=False):
@@ -1181,16 +1218,20 @@ class Matching(object):
             reviews = [(openreview.api.Note.from_json(reply), s) for s in papers for reply in s.details['directReplies'] if venue.get_invitation_id(name=review_name, number=s.number) in reply['invitations']]
             print(len(reviews))
 
+        membership = tools.GroupMembershipBatcher(client, invitation=venue.get_meta_invitation_id(), signatures=[venue.venue_id], desc='Updating paper committees')
+
         if overwrite:
             if reviews:
                 raise openreview.OpenReviewException('Can not overwrite assignments when there are reviews posted.')
+            ## Load the paper groups at once to get the anonymous ids of the members that are removed
+            membership.prefetch(venue.get_paper_group_prefix())
             ## Remove the members from the groups based on the current assignments
             for paper in tqdm(papers, total=len(papers)):
                 if paper.id in current_assignment_edges:
                     paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
                     current_edges=current_assignment_edges[paper.id]
                     for current_edge in current_edges:
-                        client.remove_members_from_group(paper_committee_id, current_edge['tail'])
+                        membership.remove(paper_committee_id, current_edge['tail'])
                 else:
                     print('assignment not found', paper.id)
             ## Delete current assignment edges with a ddate in case we need to do rollback
@@ -1230,7 +1271,7 @@ class Matching(object):
                         weight=proposed_edge.get('weight')
                     ))
                     assigned_users.append(assigned_user)
-                client.add_members_to_group(paper_committee_id, assigned_users)
+                membership.add(paper_committee_id, assigned_users)
                 return paper_assignment_edges
             else:
                 print('assignment not found', paper.id)
@@ -1238,6 +1279,11 @@ class Matching(object):
 
         assignment_edges = reduce(concat,tools.concurrent_requests(process_paper_assignments, papers))
 
+        result = membership.flush()
+        print('Paper committees updated: {groups} groups, {added} members added, {removed} members removed'.format(**result))
+        if result['failures']:
+            raise openreview.OpenReviewException(f"Members could not be updated in {len(result['failures'])} groups: {', '.join(sorted(result['failures']))}")
+
         print('Posting assignment edges', len(assignment_edges))
         openreview.tools.post_bulk_edges(client=client, edges=assignment_edges)
 
@@ -1332,6 +1378,9 @@ class Matching(object):
             if reviews:
                 raise openreview.OpenReviewException('Can not delete assignments when there are reviews posted.')
 
+        membership = tools.GroupMembershipBatcher(client, invitation=venue.get_meta_invitation_id(), signatures=[venue.venue_id], desc='Updating paper committees')
+        membership.prefetch(venue.get_paper_group_prefix())
+
         def process_paper_assignments(paper):
             if paper.id in proposed_assignment_edges:
                 paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
@@ -1344,16 +1393,21 @@ class Matching(object):
                         for sac_assignment in sac_assignments:
                             assigned_sac = sac_assignment['tail']
                             sac_group_id = venue.get_senior_area_chairs_id(number=paper.number)
-                            client.remove_members_from_group(sac_group_id,[assigned_sac])
+                            membership.remove(sac_group_id, [assigned_sac])
                     assigned_users.append(assigned_user)
                     assignment_edge_id = current_assignment_edges.get(paper.id, {}).get(assigned_user)
                     if assignment_edge_id:
                         client.delete_edges(id=assignment_edge_id, invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
-                client.remove_members_from_group(paper_committee_id, assigned_users)
+                membership.remove(paper_committee_id, assigned_users)
             else:
                 print('assignment not found', paper.id)
 
         tools.concurrent_requests(process_paper_assignments, papers, desc='undeploy_assignments')
+
+        result = membership.flush()
+        print('Paper committees updated: {groups} groups, {removed} members removed'.format(**result))
+        if result['failures']:
+            raise openreview.OpenReviewException(f"Members could not be removed from {len(result['failures'])} groups: {', '.join(sorted(result['failures']))}")
     
     def deploy(self, assignment_title, overwrite=False, enable_reviewer_reassignment=False):
 
@@ -1403,4 +1457,437 @@ class Matching(object):
             self.venue.invitation_builder.expire_invitation(self.venue.get_assignment_id(self.match_group.id, deployed=True))      
             self.venue.invitation_builder.unexpire_invitation(self.venue.get_assignment_id(self.match_group.id))     
             self.venue.invitation_builder.unexpire_invitation(self.venue.get_invitation_id('Proposed_Assignment_Recruitment', prefix=self.match_group.id))
-             
+
+
+def _configuration_value(configuration, name, default=None):
+    content = configuration.content if hasattr(configuration, 'content') else configuration
+    value = content.get(name, default)
+    if isinstance(value, dict) and 'value' in value and len(value) <= 2:
+        value = value['value']
+    return default if value in [None, ''] else value
+
+def _edge_codes(values, index):
+    ## maps the unique head or tail ids of a frame to positions in the matrix, -1 if they are not part of it
+    return np.array([index.get(value, -1) for value in values.tolist()], dtype=np.int64)
+
+class AggregateScore(object):
+    """
+    Aggregate scores of the paper and user pairs of a scores specification, computed the way the matcher does: the
+    score of a pair is the sum over the invitations of the specification of `weight` times the edge score, where the
+    edge score is the value of its label in `translate_map`, its weight otherwise, and `default` when the pair has no
+    edge of that invitation.
+
+    The scores are kept as a sparse paper x user matrix with the difference between the aggregate score and the score
+    of a pair without edges, `base_score`, so only the pairs with at least one edge are stored. The edges of each
+    invitation are converted with array operations over an :class:`openreview.api.EdgeFrame`, without creating a Python
+    object per edge.
+
+    Requires the `scipy` package, it can be installed with `pip install openreview-py[preview]`.
+
+    Example:
+
+    >>> aggregate = openreview.venue.matching.AggregateScore.from_specification(client, scores_specification, user_ids=reviewer_ids)
+    >>> aggregate.get('paper-id', '~Reviewer_One1')
+    >>> aggregate.to_csv('aggregate_scores.csv')
+    >>> aggregate.post(client, 'ICML.cc/2025/Conference/Reviewers/-/Aggregate_Score', label='Preview', readers=['ICML.cc/2025/Conference'], writers=['ICML.cc/2025/Conference'], signatures=['ICML.cc/2025/Conference'])
+
+    :param paper_ids: Ids of the papers, the rows of the matrix
+    :type paper_ids: list[str]
+    :param user_ids: Ids of the users, the columns of the matrix
+    :type user_ids: list[str]
+    """
+
+    def __init__(self, paper_ids, user_ids):
+        if scipy is None:
+            raise openreview.OpenReviewException('scipy is required to aggregate scores, install it with `pip install openreview-py[preview]`')
+        self.paper_ids = list(dict.fromkeys(paper_ids))
+        self.user_ids = list(dict.fromkeys(user_ids))
+        self.paper_index = { id: i for i, id in enumerate(self.paper_ids) }
+        self.user_index = { id: i for i, id in enumerate(self.user_ids) }
+        self.base_score = 0.0
+        self.rows = []
+        self.columns = []
+        self.values = []
+        self.cached_matrix = None
+
+    @property
+    def shape(self):
+        return (len(self.paper_ids), len(self.user_ids))
+
+    @classmethod
+    def from_specification(cls, client, scores_specification, paper_ids=None, user_ids=None):
+        """
+        Loads the edges of each invitation of the scores specification and aggregates them
+
+        :param client: Client used to get the edges
+        :type client: api.OpenReviewClient
+        :param scores_specification: Dict from invitation id to its weight, default and optional translate_map
+        :type scores_specification: dict
+        :param paper_ids: Papers to include, by default the heads of the edges
+        :type paper_ids: list[str], optional
+        :param user_ids: Users to include, by default the tails of the edges
+        :type user_ids: list[str], optional
+
+        :return: Aggregate scores
+        :rtype: AggregateScore
+        """
+        frames = { invitation_id: client.get_all_edges(invitation=invitation_id, as_frame=True) for invitation_id in scores_specification }
+        if paper_ids is None:
+            paper_ids = [head for frame in frames.values() for head in frame.heads.tolist()]
+        if user_ids is None:
+            user_ids = [tail for frame in frames.values() for tail in frame.tails.tolist()]
+
+        aggregate = cls(paper_ids, user_ids)
+        for invitation_id, spec in scores_specification.items():
+            aggregate.add(frames[invitation_id], weight=spec.get('weight', 1), default=spec.get('default', 0), translate_map=spec.get('translate_map'))
+        return aggregate
+
+    def add(self, frame, weight=1, default=0, translate_map=None):
+        """
+        Adds the scores of the edges of one invitation. Edges whose head or tail are not part of the matrix, and edges
+        without weight whose label is not translated, are ignored.
+
+        :param frame: Edges of the invitation
+        :type frame: api.EdgeFrame
+        :param weight: Weight of the invitation in the aggregate score
+        :type weight: float, optional
+        :param default: Score of the pairs without edge
+        :type default: float, optional
+        :param translate_map: Dict from edge label to score
+        :type translate_map: dict, optional
+        """
+        weight, default = float(weight), float(default)
+        self.base_score += weight * default
+        if not len(frame):
+            return
+
+        ## translate the unique heads, tails and labels once, then index the translations with the codes of the edges
+        rows = _edge_codes(frame.heads, self.paper_index)[frame.head_codes]
+        columns = _edge_codes(frame.tails, self.user_index)[frame.tail_codes]
+        values = frame.weights
+        if translate_map:
+            translated = np.array([translate_map.get(label, np.nan) for label in frame.labels.tolist()] + [np.nan], dtype=np.float64)[frame.label_codes]
+            values = np.where(np.isnan(translated), values, translated)
+
+        keep = (rows >= 0) & (columns >= 0) & ~np.isnan(values)
+        self.rows.append(rows[keep])
+        self.columns.append(columns[keep])
+        self.values.append(weight * (values[keep] - default))
+        self.cached_matrix = None
+
+    @property
+    def matrix(self):
+        """
+        Sparse matrix with the difference between the aggregate score of each pair and `base_score`. Pairs with an edge
+        are stored even when the difference is zero.
+        """
+        if self.cached_matrix is None:
+            rows = np.concatenate(self.rows) if self.rows else np.array([], dtype=np.int64)
+            columns = np.concatenate(self.columns) if self.columns else np.array([], dtype=np.int64)
+            values = np.concatenate(self.values) if self.values else np.array([], dtype=np.float64)
+            ## duplicated pairs are summed by the conversion
+            self.cached_matrix = scipy.sparse.coo_matrix((values, (rows, columns)), shape=self.shape).tocsr()
+        return self.cached_matrix
+
+    def get(self, paper_id, user_id):
+        """
+        Returns the aggregate score of a pair
+
+        :param paper_id: Paper id
+        :type paper_id: str
+        :param user_id: User id
+        :type user_id: str
+
+        :return: Aggregate score
+        :rtype: float
+        """
+        return self.base_score + float(self.matrix[self.paper_index[paper_id], self.user_index[user_id]])
+
+    def __pairs(self):
+        matrix = self.matrix
+        paper_codes = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        return paper_codes, matrix.indices, matrix.data + self.base_score
+
+    def to_frame(self, invitation=None, label=None):
+        """
+        Converts the scores of the pairs with at least one edge to an EdgeFrame, which can be written to a Parquet file
+        with :meth:`openreview.api.EdgeFrame.to_parquet`
+
+        :param invitation: Invitation of the edges
+        :type invitation: str, optional
+        :param label: Label of the edges
+        :type label: str, optional
+
+        :return: Aggregate scores as edges
+        :rtype: api.EdgeFrame
+        """
+        paper_codes, user_codes, scores = self.__pairs()
+        size = len(scores)
+        return openreview.api.EdgeFrame(
+            head_codes=paper_codes,
+            tail_codes=user_codes,
+            weights=scores,
+            heads=self.paper_ids,
+            tails=self.user_ids,
+            label_codes=np.full(size, 0 if label is not None else -1, dtype=np.int32),
+            labels=[label] if label is not None else None,
+            invitation_codes=np.full(size, 0 if invitation is not None else -1, dtype=np.int32),
+            invitations=[invitation] if invitation is not None else None
+        )
+
+    def to_csv(self, path):
+        """
+        Writes the scores of the pairs with at least one edge to a CSV file with paper id, user id and score rows, the
+        format read by :meth:`Matching.setup` score files
+
+        :param path: Path of the file
+        :type path: str
+
+        :return: Number of rows written
+        :rtype: int
+        """
+        paper_codes, user_codes, scores = self.__pairs()
+        paper_ids = np.asarray(self.paper_ids, dtype=object)
+        user_ids = np.asarray(self.user_ids, dtype=object)
+        with open(path, 'w', newline='') as f:
+            csv.writer(f).writerows(zip(paper_ids[paper_codes].tolist(), user_ids[user_codes].tolist(), scores.tolist()))
+        return len(scores)
+
+    def post(self, client, invitation, readers, writers, signatures, label=None, nonreaders=None):
+        """
+        Posts the scores of the pairs with at least one edge as edges of the aggregate score invitation, replacing the
+        edges previously posted to the invitation with the same label. The edges are built while they are posted, so
+        they are never all in memory at once.
+
+        :param client: Client used to post the edges
+        :type client: api.OpenReviewClient
+        :param invitation: Aggregate score invitation
+        :type invitation: str
+        :param readers: Readers of the edges
+        :type readers: list[str]
+        :param writers: Writers of the edges
+        :type writers: list[str]
+        :param signatures: Signatures of the edges
+        :type signatures: list[str]
+        :param label: Label of the edges, for example the title of the configuration. When it is not given all the edges
+            of the invitation are replaced
+        :type label: str, optional
+        :param nonreaders: Nonreaders of the edges
+        :type nonreaders: list[str], optional
+
+        :return: Number of edges posted
+        :rtype: int
+        """
+        paper_codes, user_codes, scores = self.__pairs()
+
+        ## posting the scores again must not duplicate the pairs
+        client.delete_edges(invitation, label=label, wait_to_finish=True)
+
+        def edges():
+            for paper_code, user_code, score in zip(paper_codes.tolist(), user_codes.tolist(), scores.tolist()):
+                yield Edge(
+                    invitation=invitation,
+                    head=self.paper_ids[paper_code],
+                    tail=self.user_ids[user_code],
+                    weight=score,
+                    label=label,
+                    readers=readers,
+                    writers=writers,
+                    signatures=signatures,
+                    nonreaders=nonreaders
+                )
+
+        return tools.BulkWriter(client.post_edges, desc='Posting aggregate scores').write_stream(edges())
+
+def _load_pairs(client, invitation_id, paper_index, user_index):
+    frame = client.get_all_edges(invitation=invitation_id, as_frame=True)
+    if not len(frame):
+        return scipy.sparse.csr_matrix((len(paper_index), len(user_index)), dtype=bool)
+    rows = _edge_codes(frame.heads, paper_index)[frame.head_codes]
+    columns = _edge_codes(frame.tails, user_index)[frame.tail_codes]
+    keep = (rows >= 0) & (columns >= 0)
+    return scipy.sparse.csr_matrix((np.ones(keep.sum(), dtype=bool), (rows[keep], columns[keep])), shape=(len(paper_index), len(user_index)))
+
+def _load_custom_values(client, invitation_id, by, default, index):
+    values = np.full(len(index), default, dtype=np.int64)
+    if not invitation_id:
+        return values
+    frame = client.get_all_edges(invitation=invitation_id, as_frame=True)
+    ids = frame.head_ids if by == 'head' else frame.tail_ids
+    for id, weight in zip(ids.tolist(), frame.weights.tolist()):
+        if id in index and weight == weight:
+            values[index[id]] = int(weight)
+    return values
+
+def preview_assignments(client, configuration, paper_ids=None, user_ids=None, candidates_per_paper=100):
+    """
+    Computes the assignments of an Assignment_Configuration locally, without running a matcher job, so the weights of
+    the scores specification, the loads and the conflicts can be checked and tuned quickly.
+
+    The score, conflict and custom load edges are loaded into sparse paper x user matrices and the assignment is solved
+    as a linear program with the HiGHS solver of SciPy: each paper gets `user_demand` users (or its custom demand),
+    each user gets between `min_papers` and `max_papers` papers (or their custom max papers) and the sum of the
+    aggregate scores is maximized. Since the problem is a transportation problem, the solution found is integral.
+
+    To keep the problem small, only the `candidates_per_paper` non conflicted users with the highest aggregate score
+    are considered for each paper, users without scores filling the list when there are not enough scored users, so
+    the result can be slightly worse than the one of the matcher when the loads are tight. When the problem restricted
+    to the candidates is infeasible and some users were left out of it, the status is 'InfeasibleWithCandidates'
+    instead of 'Infeasible', since a larger `candidates_per_paper` may make it feasible.
+
+    Requires the `scipy` package, it can be installed with `pip install openreview-py[preview]`.
+
+    Example:
+
+    >>> configuration = client.get_notes(invitation='ICML.cc/2025/Conference/Reviewers/-/Assignment_Configuration')[0]
+    >>> configuration.content['scores_specification']['value']['ICML.cc/2025/Conference/Reviewers/-/Bid']['weight'] = 2
+    >>> preview = openreview.venue.matching.preview_assignments(client, configuration)
+    >>> print(preview['status'], preview['stats'])
+
+    :param client: Client used to get the edges and the match group
+    :type client: api.OpenReviewClient
+    :param configuration: Assignment configuration note, or dict with the content values of the note: user_demand,
+        max_papers, min_papers, match_group, scores_specification, conflicts_invitation, custom_max_papers_invitation
+        and custom_user_demand_invitation
+    :type configuration: Note or dict
+    :param paper_ids: Papers to assign, by default the heads of the score edges
+    :type paper_ids: list[str], optional
+    :param user_ids: Users to assign, by default the members of the match group
+    :type user_ids: list[str], optional
+    :param candidates_per_paper: Number of users considered for each paper
+    :type candidates_per_paper: int, optional
+
+    :return: Dict with the status ('Optimal', 'Infeasible', 'InfeasibleWithCandidates' or 'Error'), the solver message,
+        the assignments as {paper_id: [(user_id, score)]} and the quality stats
+    :rtype: dict
+    """
+    if scipy is None:
+        raise openreview.OpenReviewException('scipy is required to preview assignments, install it with `pip install openreview-py[preview]`')
+
+    start = time.time()
+    scores_specification = _configuration_value(configuration, 'scores_specification', {})
+    user_demand = int(_configuration_value(configuration, 'user_demand', 1))
+    max_papers = int(_configuration_value(configuration, 'max_papers', 1))
+    min_papers = int(_configuration_value(configuration, 'min_papers', 0))
+
+    if user_ids is None:
+        user_ids = client.get_group(_configuration_value(configuration, 'match_group')).members
+
+    ## scores are stored as the difference with the score of a pair without edges
+    aggregate = AggregateScore.from_specification(client, scores_specification, paper_ids=paper_ids, user_ids=user_ids)
+    paper_ids, user_ids = aggregate.paper_ids, aggregate.user_ids
+    paper_index, user_index = aggregate.paper_index, aggregate.user_index
+    shape = aggregate.shape
+    base_score = aggregate.base_score
+    scores = aggregate.matrix
+
+    conflicts_invitation = _configuration_value(configuration, 'conflicts_invitation')
+    conflicts = _load_pairs(client, conflicts_invitation, paper_index, user_index) if conflicts_invitation else scipy.sparse.csr_matrix(shape, dtype=bool)
+    demands = _load_custom_values(client, _configuration_value(configuration, 'custom_user_demand_invitation'), 'head', user_demand, paper_index)
+    loads = _load_custom_values(client, _configuration_value(configuration, 'custom_max_papers_invitation'), 'tail', max_papers, user_index)
+    minimum_loads = np.minimum(min_papers, loads)
+    load_seconds = time.time() - start
+
+    ## candidate users of each paper: best scored users first, then users without scores, then the negative ones
+    available = np.flatnonzero(loads > 0)
+    candidate_rows, candidate_columns, candidate_scores = [], [], []
+    pruned = False
+    for paper in range(len(paper_ids)):
+        row = scores.getrow(paper)
+        excluded = set(conflicts.getrow(paper).indices.tolist())
+        eligible = len(available) - len([user for user in excluded if loads[user] > 0])
+        scored = [(value, user) for user, value in zip(row.indices.tolist(), row.data.tolist()) if user not in excluded and loads[user] > 0]
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        chosen = [(value, user) for value, user in scored if value >= 0][:candidates_per_paper]
+        if len(chosen) < candidates_per_paper and len(available):
+            scored_users = set(row.indices.tolist())
+            ## start at a different user for each paper to spread the unscored candidates
+            offset = paper * candidates_per_paper
+            for position in range(len(available)):
+                if len(chosen) >= candidates_per_paper:
+                    break
+                user = int(available[(offset + position) % len(available)])
+                if user not in scored_users and user not in excluded:
+                    chosen.append((0.0, user))
+        if len(chosen) < candidates_per_paper:
+            chosen.extend([(value, user) for value, user in scored if value < 0][:candidates_per_paper - len(chosen)])
+        pruned = pruned or len(chosen) < eligible
+        for value, user in chosen:
+            candidate_rows.append(paper)
+            candidate_columns.append(user)
+            candidate_scores.append(base_score + value)
+
+    candidate_rows = np.array(candidate_rows, dtype=np.int64)
+    candidate_columns = np.array(candidate_columns, dtype=np.int64)
+    candidate_scores = np.array(candidate_scores, dtype=np.float64)
+    variables = np.arange(len(candidate_rows))
+
+    result = {
+        'status': None,
+        'message': None,
+        'assignments': {},
+        'stats': {
+            'papers': len(paper_ids),
+            'users': len(user_ids),
+            'candidates': len(candidate_rows),
+            'total_demand': int(demands.sum()),
+            'total_load': int(loads.sum()),
+            'load_seconds': load_seconds
+        }
+    }
+
+    if demands.sum() > loads.sum():
+        result['status'] = 'Infeasible'
+        result['message'] = f'The total demand of the papers ({demands.sum()}) is larger than the total load of the users ({loads.sum()})'
+        return result
+
+    solve_start = time.time()
+    paper_constraints = scipy.sparse.csr_matrix((np.ones(len(variables)), (candidate_rows, variables)), shape=(len(paper_ids), len(variables)))
+    user_constraints = scipy.sparse.csr_matrix((np.ones(len(variables)), (candidate_columns, variables)), shape=(len(user_ids), len(variables)))
+    solution = scipy.optimize.linprog(
+        -candidate_scores,
+        A_ub=scipy.sparse.vstack([user_constraints, -user_constraints]),
+        b_ub=np.concatenate([loads, -minimum_loads]),
+        A_eq=paper_constraints,
+        b_eq=demands,
+        bounds=(0, 1),
+        method='highs'
+    )
+    result['stats']['solve_seconds'] = time.time() - solve_start
+    result['message'] = solution.message
+
+    if solution.status == 2 and pruned:
+        result['status'] = 'InfeasibleWithCandidates'
+        result['message'] += f'. Only {candidates_per_paper} candidates per paper were considered, the problem may be feasible with a larger candidates_per_paper'
+        return result
+
+    if solution.status != 0:
+        result['status'] = 'Infeasible' if solution.status == 2 else 'Error'
+        short_papers = np.flatnonzero(np.bincount(candidate_rows, minlength=len(paper_ids)) < demands)
+        if len(short_papers):
+            result['message'] += f'. {len(short_papers)} papers have fewer candidates than their demand, e.g. {paper_ids[short_papers[0]]}'
+        return result
+
+    assigned = np.flatnonzero(solution.x > 0.5)
+    paper_scores = np.zeros(len(paper_ids))
+    user_loads = np.zeros(len(user_ids), dtype=np.int64)
+    for variable in assigned.tolist():
+        paper, user, score = candidate_rows[variable], candidate_columns[variable], candidate_scores[variable]
+        result['assignments'].setdefault(paper_ids[paper], []).append((user_ids[user], float(score)))
+        paper_scores[paper] += score
+        user_loads[user] += 1
+
+    assigned_scores = candidate_scores[assigned]
+    result['status'] = 'Optimal'
+    result['stats'].update({
+        'assignments': len(assigned),
+        'total_score': float(assigned_scores.sum()),
+        'mean_score': float(assigned_scores.mean()) if len(assigned) else 0.0,
+        'min_paper_score': float(paper_scores.min()) if len(paper_ids) else 0.0,
+        'assignments_with_default_score': int((assigned_scores == base_score).sum()),
+        'users_without_assignments': int((user_loads == 0).sum()),
+        'min_load': int(user_loads.min()) if len(user_ids) else 0,
+        'max_load': int(user_loads.max()) if len(user_ids) else 0,
+        'mean_load': float(user_loads.mean()) if len(user_ids) else 0.0
+    })
+    return result
@@ -2,6 +2,7 @@ import csv
 import json
 import re
 import io
+import os
 import datetime
 import requests
 from io import StringIO
@@ -663,7 +664,7 @@ class Venue(object):
 
         # setup paper matching
         ethics_chairs_group = tools.get_group(self.client, self.get_ethics_chairs_id())
-        tools.replace_members_with_ids(self.client, ethics_chairs_group)
+        tools.replace_members_with_ids(self.client, ethics_chairs_group, return_result=False)
         group = tools.get_group(self.client, id=self.get_ethics_reviewers_id())
         if group and len(group.members) > 0:
             self.setup_committee_matching(
@@ -777,7 +778,7 @@ class Venue(object):
         results = []
         errors = {}
 
-        with ThreadPoolExecutor(max_workers=min(6, cpu_count() - 1)) as executor:
+        with ThreadPoolExecutor(max_workers=tools.get_max_workers(self.client, min(6, cpu_count() - 1))) as executor:
             for _decision in decisions_data:
                 _future = executor.submit(post_decision, _decision)
                 futures.append(_future)
@@ -946,14 +947,14 @@ Total Errors: {len(errors)}
 
         tools.concurrent_requests(send_notification, paper_notes)
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, incremental=False, workers=None):
         if committee_id is None:
             committee_id=self.get_reviewers_id()
         if self.use_senior_area_chairs and committee_id == self.get_senior_area_chairs_id() and not alternate_matching_group and not self.sac_paper_assignments:
             alternate_matching_group = self.get_area_chairs_id()
         venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None)
 
-        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years)
+        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, incremental, workers)
 
     def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False):
 
@@ -992,7 +993,8 @@ Total Errors: {len(errors)}
                 sac_group_id = self.get_committee_id(row[1]).strip()
                 sac_group = openreview.tools.get_group(self.client, sac_group_id)
                 if sac_group:
-                    sacs = openreview.tools.replace_members_with_ids(self.client, sac_group).members
+                    openreview.tools.replace_members_with_ids(self.client, sac_group, return_result=False)
+                    sacs = sac_group.members
                     sac_tracks[track] = sac_tracks[track] + sacs
                     all_sacs = all_sacs + sacs
                     self.client.post_group_edit(
@@ -1077,7 +1079,8 @@ Total Errors: {len(errors)}
             ac_group = openreview.tools.get_group(self.client, self.get_committee_id(ac_role))
             if not ac_group:
                 raise openreview.OpenReviewException(f'Group not found: {self.get_committee_id(ac_role)}')
-            acs = openreview.tools.replace_members_with_ids(self.client, ac_group).members
+            openreview.tools.replace_members_with_ids(self.client, ac_group, return_result=False)
+            acs = ac_group.members
             all_acs = all_acs + acs
 
             for sac in sacs:
@@ -1562,20 +1565,13 @@ Total Errors: {len(errors)}
             num_comments,
             np.sum(review_days_late))
 
-        self.client.delete_tags(invitation=f'{reviewers_id}/-/Review_Assignment_Count', wait_to_finish=True, soft_delete=True)
-        openreview.tools.post_bulk_tags(self.client, review_assignment_count_tags)       
-
-        self.client.delete_tags(invitation=f'{reviewers_id}/-/Review_Count', wait_to_finish=True, soft_delete=True)
-        openreview.tools.post_bulk_tags(self.client, review_count_tags)       
-
-        self.client.delete_tags(invitation=f'{reviewers_id}/-/Discussion_Reply_Sum', wait_to_finish=True, soft_delete=True)
-        openreview.tools.post_bulk_tags(self.client, comment_count_tags)       
-
-        self.client.delete_tags(invitation=f'{reviewers_id}/-/Review_Days_Late_Sum', wait_to_finish=True, soft_delete=True)
-        openreview.tools.post_bulk_tags(self.client, review_days_late_tags)       
+        openreview.tools.sync_tags(self.client, f'{reviewers_id}/-/Review_Assignment_Count', review_assignment_count_tags, key=('profile',))
+        openreview.tools.sync_tags(self.client, f'{reviewers_id}/-/Review_Count', review_count_tags, key=('profile',))
+        openreview.tools.sync_tags(self.client, f'{reviewers_id}/-/Discussion_Reply_Sum', comment_count_tags, key=('profile',))
+        openreview.tools.sync_tags(self.client, f'{reviewers_id}/-/Review_Days_Late_Sum', review_days_late_tags, key=('profile',))
     
     @classmethod
-    def check_new_profiles(Venue, client):
+    def check_new_profiles(Venue, client, conflict_index_dir=None):
 
         def mark_as_conflict(venue_group, edge, submission, user_profile):
             edge.label='Conflict Detected'
@@ -1685,6 +1681,9 @@ OpenReview Team'''
                 
                 print(f'Check active venue {venue_group.id}')
 
+                conflict_index_path = os.path.join(conflict_index_dir, venue_id.replace('/', '_') + '.json') if conflict_index_dir else None
+                conflict_index = openreview.conflicts.ConflictIndex.load(conflict_index_path, client, policy=venue_group.content.get('reviewers_conflict_policy', {}).get('value') or 'default', n_years=venue_group.content.get('reviewers_conflict_n_years', {}).get('value'))
+
                 edge_invitations = client.get_all_invitations(prefix=venue_id, type='edge')
                 invite_assignment_invitations = [inv.id for inv in edge_invitations if inv.id.endswith('Invite_Assignment')]
 
@@ -1729,8 +1728,9 @@ OpenReview Team'''
                                                 client.post_edge(invitation_edge)
 
                                             ## Check conflicts
-                                            author_profiles = openreview.tools.get_profiles(client, submission.content['authorids']['value'], with_publications=True, with_relations=True)
-                                            conflicts=openreview.tools.get_conflicts(author_profiles, user_profile, policy=venue_group.content.get('reviewers_conflict_policy', {}).get('value'), n_years=venue_group.content.get('reviewers_conflict_n_years', {}).get('value'))
+                                            conflict_index.add_paper(submission.id, submission.content['authorids']['value'])
+                                            conflict_index.set_profile(user_profile, alias=tail)
+                                            conflicts=conflict_index.conflicts(submission.id, user_profile.id)
 
                                             if conflicts:
                                                 print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
@@ -1747,5 +1747,8 @@ OpenReview Team'''
 
                             else:
                                 print(f'no profile active for {tail}')                                             
+
+                if conflict_index_path:
+                    conflict_index.save(conflict_index_path)
         
         return True
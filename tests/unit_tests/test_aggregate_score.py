@@ -0,0 +1,99 @@
+import csv
+import random
+import numpy as np
+from openreview.api import Edge, EdgeFrame
+from openreview.venue.matching import AggregateScore
+
+
+class FakeClient:
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.posted = []
+
+    def get_all_edges(self, invitation, as_frame=False):
+        return EdgeFrame.from_edges([e for e in self.edges if e.invitation == invitation])
+
+    def post_edges(self, edges):
+        self.posted.extend(edges)
+        return edges
+
+    def delete_edges(self, invitation, label=None, wait_to_finish=False):
+        self.posted = [e for e in self.posted if e.invitation != invitation or (label is not None and e.label != label)]
+
+
+SPECIFICATION = {
+    'Venue/Reviewers/-/Affinity_Score': { 'weight': 1, 'default': 0 },
+    'Venue/Reviewers/-/Bid': { 'weight': 2, 'default': 0.1, 'translate_map': { 'Very High': 1.0, 'High': 0.5, 'Very Low': -1.0 } },
+    'Venue/Reviewers/-/Recommendation': { 'weight': 1, 'default': 0 }
+}
+
+
+def naive_scores(edges, papers, users):
+    values = {}
+    for e in edges:
+        spec = SPECIFICATION[e.invitation]
+        value = spec.get('translate_map', {}).get(e.label, e.weight)
+        if value is not None:
+            values[(e.invitation, e.head, e.tail)] = value
+    return { (p, u): sum(spec['weight'] * values.get((invitation, p, u), spec['default']) for invitation, spec in SPECIFICATION.items()) for p in papers for u in users }
+
+
+class TestAggregateScore:
+
+    def get_edges(self):
+        rng = random.Random(5)
+        papers = [f'paper{i}' for i in range(20)]
+        users = [f'~User{i}' for i in range(30)]
+        edges = []
+        for p in papers:
+            for u in rng.sample(users, 10):
+                edges.append(Edge(invitation='Venue/Reviewers/-/Affinity_Score', head=p, tail=u, weight=round(rng.random(), 3)))
+            for u in rng.sample(users, 5):
+                edges.append(Edge(invitation='Venue/Reviewers/-/Bid', head=p, tail=u, label=rng.choice(['Very High', 'High', 'Very Low', 'Neutral'])))
+            edges.append(Edge(invitation='Venue/Reviewers/-/Recommendation', head=p, tail=rng.choice(users), weight=1))
+        ## labels without translation use the weight, or the default when there is no weight
+        edges.append(Edge(invitation='Venue/Reviewers/-/Bid', head='paper0', tail='~User0', label='Other', weight=0.25))
+        return papers, users, edges
+
+    def test_same_scores_as_loops(self):
+        papers, users, edges = self.get_edges()
+        aggregate = AggregateScore.from_specification(FakeClient(edges), SPECIFICATION, paper_ids=papers, user_ids=users)
+        expected = naive_scores(edges, papers, users)
+
+        assert aggregate.base_score == 0.2
+        dense = aggregate.matrix.toarray() + aggregate.base_score
+        for (p, u), score in expected.items():
+            assert abs(dense[aggregate.paper_index[p], aggregate.user_index[u]] - score) < 1e-9
+            assert abs(aggregate.get(p, u) - score) < 1e-9
+
+        ## only the pairs with scored edges are stored
+        pairs = { (e.head, e.tail) for e in edges if e.weight is not None or e.label in SPECIFICATION[e.invitation].get('translate_map', {}) }
+        frame = aggregate.to_frame(invitation='Venue/Reviewers/-/Aggregate_Score', label='Preview')
+        assert len(frame) == len(pairs)
+        assert set(zip(frame.head_ids.tolist(), frame.tail_ids.tolist())) == pairs
+        assert np.allclose(frame.weights, [expected[pair] for pair in zip(frame.head_ids.tolist(), frame.tail_ids.tolist())])
+        assert set(frame.label_values.tolist()) == { 'Preview' }
+
+    def test_export_and_post(self, tmp_path):
+        papers, users, edges = self.get_edges()
+        client = FakeClient(edges)
+        aggregate = AggregateScore.from_specification(client, SPECIFICATION)
+        expected = naive_scores(edges, papers, users)
+
+        path = str(tmp_path / 'scores.csv')
+        count = aggregate.to_csv(path)
+        with open(path) as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == count == aggregate.matrix.nnz
+        assert all(abs(float(score) - expected[(p, u)]) < 1e-9 for p, u, score in rows)
+
+        assert aggregate.post(client, 'Venue/Reviewers/-/Aggregate_Score', readers=['Venue'], writers=['Venue'], signatures=['Venue'], label='Preview') == count
+        assert len(client.posted) == count
+        assert all(e.invitation == 'Venue/Reviewers/-/Aggregate_Score' and e.label == 'Preview' and abs(e.weight - expected[(e.head, e.tail)]) < 1e-9 for e in client.posted)
+
+        ## posting again replaces the edges with the same label and keeps the other labels
+        aggregate.post(client, 'Venue/Reviewers/-/Aggregate_Score', readers=['Venue'], writers=['Venue'], signatures=['Venue'], label='Other')
+        aggregate.post(client, 'Venue/Reviewers/-/Aggregate_Score', readers=['Venue'], writers=['Venue'], signatures=['Venue'], label='Preview')
+        assert len(client.posted) == 2 * count
+        assert len(set((e.head, e.tail, e.label) for e in client.posted)) == 2 * count
@@ -0,0 +1,161 @@
+import asyncio
+import jwt
+import pytest
+import openreview
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+
+def run_with_server(routes, test):
+    async def main():
+        app = web.Application()
+        app.add_routes(routes)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await test(f"http://127.0.0.1:{port}")
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestAsyncOpenReviewClient:
+
+    def test_login_and_get_note(self):
+        token = jwt.encode({"user": {"id": "~Test_User1"}}, "a-secret-key-that-is-long-enough-for-hs256")
+        requests_received = []
+
+        async def login(request):
+            body = await request.json()
+            requests_received.append(("login", body["id"]))
+            return web.json_response({"token": token, "user": {"profile": {"id": "~Test_User1"}}})
+
+        async def notes(request):
+            requests_received.append(("notes", request.headers.get("Authorization"), request.query.get("id")))
+            return web.json_response({"notes": [{"id": request.query["id"], "number": 1, "content": {"title": {"value": "Paper"}}}]})
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl, username="test@mail.com", password="1234") as client:
+                notes = await asyncio.gather(*[client.get_note(f"note{i}") for i in range(5)])
+                assert client.profile.id == "~Test_User1"
+                return notes
+
+        notes = run_with_server([web.post("/login", login), web.get("/notes", notes)], test)
+
+        assert [n.id for n in notes] == [f"note{i}" for i in range(5)]
+        assert requests_received[0] == ("login", "test@mail.com")
+        assert all(r[1] == "Bearer " + token for r in requests_received[1:])
+
+    def test_retry_on_server_error(self):
+        calls = {"count": 0}
+
+        async def groups(request):
+            calls["count"] += 1
+            if calls["count"] < 3:
+                return web.json_response({"name": "Error", "message": "unavailable"}, status=503, headers={"Retry-After": "0"})
+            return web.json_response({"groups": [{"id": "Venue/Reviewers", "members": ["~Reviewer1"]}]})
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                return await client.get_group("Venue/Reviewers")
+
+        group = run_with_server([web.get("/groups", groups)], test)
+
+        assert calls["count"] == 3
+        assert group.members == ["~Reviewer1"]
+
+    def test_error_response(self):
+
+        async def invitations(request):
+            return web.json_response({"name": "NotFoundError", "message": "Invitation Not Found"}, status=404)
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                with pytest.raises(openreview.OpenReviewException, match=r".*Invitation Not Found.*"):
+                    await client.get_invitation("Venue/-/Submission")
+
+        run_with_server([web.get("/invitations", invitations)], test)
+
+    def test_get_all_notes(self):
+        all_ids = [f"id{i:04d}" for i in range(2500)]
+
+        async def notes(request):
+            after = request.query.get("after")
+            limit = int(request.query["limit"])
+            start = all_ids.index(after) + 1 if after else 0
+            return web.json_response({"notes": [{"id": i} for i in all_ids[start:start + limit]]})
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                return await client.get_all_notes(invitation="Venue/-/Submission")
+
+        notes = run_with_server([web.get("/notes", notes)], test)
+
+        assert [n.id for n in notes] == all_ids
+
+    def test_get_all_notes_sorted_by_other_field(self):
+        all_ids = [f"id{i:04d}" for i in range(2500)]
+        queries = []
+
+        async def notes(request):
+            queries.append(dict(request.query))
+            offset = int(request.query.get("offset", 0))
+            limit = int(request.query["limit"])
+            return web.json_response({"notes": [{"id": i} for i in reversed(all_ids)][offset:offset + limit]})
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                return await client.get_all_notes(invitation="Venue/-/Submission", sort="number:desc")
+
+        notes = run_with_server([web.get("/notes", notes)], test)
+
+        assert [n.id for n in notes] == list(reversed(all_ids))
+        assert all(q["sort"] == "number:desc" and "after" not in q for q in queries)
+        assert [q.get("offset") for q in queries] == [None, "1000", "2000"]
+
+    def test_get_all_edges_honours_limit(self):
+        all_ids = [f"id{i:04d}" for i in range(2500)]
+
+        async def edges(request):
+            offset = int(request.query.get("offset", 0))
+            limit = int(request.query["limit"])
+            return web.json_response({"edges": [{"id": i, "head": "paper1", "tail": i} for i in all_ids[offset:offset + limit]], "count": len(all_ids)})
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                return await client.get_all_edges(invitation="Venue/-/Affinity_Score", offset=500, limit=1200)
+
+        edges = run_with_server([web.get("/edges", edges)], test)
+
+        assert [e.id for e in edges] == all_ids[500:1700]
+
+    def test_no_retry_of_posts_after_disconnect(self):
+        calls = {"get": 0, "post": 0}
+
+        async def edges_get(request):
+            calls["get"] += 1
+            if calls["get"] < 2:
+                request.transport.close()
+                return web.Response()
+            return web.json_response({"edges": [], "count": 0})
+
+        async def edges_post(request):
+            calls["post"] += 1
+            request.transport.close()
+            return web.Response()
+
+        async def test(baseurl):
+            async with openreview.api.AsyncOpenReviewClient(baseurl=baseurl) as client:
+                await client.get_edges(invitation="Venue/-/Affinity_Score")
+                with pytest.raises(aiohttp.ClientConnectionError):
+                    await client.post_edges([openreview.api.Edge(invitation="Venue/-/Affinity_Score", head="paper1", tail="~Reviewer1", weight=1)])
+
+        run_with_server([web.get("/edges", edges_get), web.post("/edges/bulk", edges_post)], test)
+
+        assert calls["get"] == 2
+        assert calls["post"] == 1
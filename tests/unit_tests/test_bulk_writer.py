@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+import pytest
+import openreview
+from openreview.api import Edge
+
+
+def get_edges(count):
+    return [Edge(invitation='Venue/Reviewers/-/Affinity_Score', head=f'paper{i}', tail='~Reviewer_One1', weight=i / count) for i in range(count)]
+
+
+class FakePoster:
+
+    def __init__(self, failures=None, delay=0):
+        self.failures = failures or {}
+        self.delay = delay
+        self.posted = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def post(self, edges):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            first = edges[0].head
+            with self.lock:
+                if self.failures.get(first):
+                    self.failures[first] -= 1
+                    raise self.failures.get('error', openreview.OpenReviewException({ 'name': 'Error', 'status': 502, 'message': 'Bad Gateway' }))
+            posted = []
+            for edge in edges:
+                posted.append(Edge(id='id_' + edge.head, invitation=edge.invitation, head=edge.head, tail=edge.tail, weight=edge.weight))
+            with self.lock:
+                self.posted.extend(posted)
+            return posted
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestBulkWriter:
+
+    def test_concurrent_chunks_keep_order(self):
+        poster = FakePoster(delay=0.05)
+        edges = get_edges(1000)
+
+        writer = openreview.tools.BulkWriter(poster.post, batch_size=100, max_in_flight=4)
+        posted = writer.write(edges)
+
+        assert [e.id for e in posted] == ['id_' + e.head for e in edges]
+        assert 1 < poster.max_in_flight <= 4
+        assert sorted(s['chunk'] for s in writer.chunk_stats) == list(range(10))
+        assert all(s['throughput'] > 0 for s in writer.chunk_stats)
+
+    def test_failed_chunks_are_retried(self):
+        poster = FakePoster(failures={ 'paper200': 2 })
+
+        writer = openreview.tools.BulkWriter(poster.post, batch_size=100, retries=3, backoff_factor=0)
+        posted = writer.write(get_edges(500))
+
+        assert len(posted) == 500
+        assert len(poster.posted) == 500
+        assert [s['attempts'] for s in writer.chunk_stats if s['chunk'] == 2] == [3]
+
+    def test_failed_chunks_are_not_retried_by_default(self):
+        poster = FakePoster(failures={ 'paper200': 1 })
+
+        with pytest.raises(openreview.OpenReviewException, match='Bad Gateway'):
+            openreview.tools.BulkWriter(poster.post, batch_size=100, max_in_flight=1, backoff_factor=0).write(get_edges(500))
+        assert 'paper200' not in [e.head for e in poster.posted]
+
+    def test_validation_errors_are_not_retried(self):
+        poster = FakePoster(failures={ 'paper0': 1, 'error': openreview.OpenReviewException({ 'name': 'ValidationError', 'status': 400, 'message': 'Invalid' }) })
+
+        with pytest.raises(openreview.OpenReviewException, match='Invalid'):
+            openreview.tools.BulkWriter(poster.post, batch_size=100, retries=3, backoff_factor=0).write(get_edges(100))
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        checkpoint = str(tmp_path / 'edges.checkpoint')
+        edges = get_edges(500)
+
+        poster = FakePoster(failures={ 'paper300': 10 })
+        with pytest.raises(openreview.OpenReviewException):
+            openreview.tools.BulkWriter(poster.post, batch_size=100, max_in_flight=1, retries=1, backoff_factor=0, checkpoint=checkpoint).write(edges)
+        already_posted = len(poster.posted)
+        assert already_posted >= 300
+        assert os.path.exists(checkpoint)
+
+        poster = FakePoster()
+        posted = openreview.tools.BulkWriter(poster.post, batch_size=100, checkpoint=checkpoint).write(edges)
+
+        assert len(poster.posted) == 500 - already_posted
+        assert [e.id for e in posted] == ['id_' + e.head for e in edges]
+        assert edges[0].id is None
+        assert not os.path.exists(checkpoint)
+
+    def test_post_bulk_edges(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        poster = FakePoster()
+        client.post_edges = poster.post
+
+        posted = openreview.tools.post_bulk_edges(client, get_edges(250), batch_size=100)
+        assert len(posted) == 250
+
+    def test_write_stream_is_bounded(self):
+        poster = FakePoster(delay=0.01)
+        built = []
+        def generate(count):
+            for edge in get_edges(count):
+                built.append(edge.head)
+                ## edges are only built when there is room for their chunk
+                assert len(built) - len(poster.posted) <= 4 * 10
+                yield edge
+
+        writer = openreview.tools.BulkWriter(poster.post, batch_size=10, max_in_flight=3)
+        assert writer.write_stream(generate(205)) == 205
+        assert sorted(e.head for e in poster.posted) == sorted(f'paper{i}' for i in range(205))
+        assert poster.max_in_flight <= 3
+        assert len(writer.chunk_stats) == 21
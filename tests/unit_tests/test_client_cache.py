@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+import openreview
+
+
+def json_response(body):
+    response = MagicMock()
+    response.json.return_value = body
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestClientCache:
+
+    def get_client(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        client.session = MagicMock()
+        return client
+
+    def test_cache_disabled_by_default(self):
+        client = self.get_client()
+        client.session.get.return_value = json_response({'invitations': [{'id': 'Venue/-/Submission', 'tmdate': 1}]})
+
+        client.get_invitation('Venue/-/Submission')
+        client.get_invitation('Venue/-/Submission')
+
+        assert client.session.get.call_count == 2
+
+    def test_repeated_reads_are_cached(self):
+        client = self.get_client()
+        client.enable_cache(ttl=60)
+        client.session.get.return_value = json_response({'groups': [{'id': 'Venue', 'tmdate': 1, 'members': ['~PC1'], 'domain': 'Venue', 'signatures': ['~Super_User1']}]})
+
+        group = client.get_group('Venue')
+        group.members.append('~PC2')
+        group = client.get_group('Venue')
+
+        assert client.session.get.call_count == 1
+        ## cached entities are copies
+        assert group.members == ['~PC1']
+        assert client.cache.hits == 1
+
+    def test_edit_invalidates_cached_entity(self):
+        client = self.get_client()
+        client.enable_cache(ttl=60)
+        client.session.get.return_value = json_response({'groups': [{'id': 'Venue/Reviewers', 'tmdate': 1, 'members': ['~Reviewer1'], 'domain': 'Venue', 'signatures': ['Venue']}]})
+        client.session.post.return_value = json_response({'id': 'edit1', 'domain': 'Venue', 'signatures': ['Venue'], 'group': {'id': 'Venue/Reviewers', 'members': {'add': ['~Reviewer2']}}})
+
+        client.get_group('Venue/Reviewers')
+        client.post_group_edit(invitation='Venue/-/Edit', signatures=['Venue'], group=openreview.api.Group(id='Venue/Reviewers', members={'add': ['~Reviewer2']}), flush_members_cache=False)
+        client.get_group('Venue/Reviewers')
+
+        assert client.session.get.call_count == 2
+
+    def test_note_edit_invalidates_forum(self):
+        client = self.get_client()
+        client.enable_cache(ttl=60)
+        client.session.get.return_value = json_response({'notes': [{'id': 'forum1', 'forum': 'forum1', 'tmdate': 1, 'details': {'replies': []}}]})
+        client.session.post.return_value = json_response({'id': 'edit1', 'note': {'id': 'reply1', 'forum': 'forum1'}})
+
+        client.get_note('forum1', details='replies')
+        client.post_note_edit(invitation='Venue/Submission1/-/Official_Comment', signatures=['~User1'], note=openreview.api.Note(forum='forum1', replyto='forum1'))
+        client.get_note('forum1', details='replies')
+
+        assert client.session.get.call_count == 2
+
+    def test_expired_entries_and_revalidation(self):
+        client = self.get_client()
+        cache = client.enable_cache(ttl=0, revalidate=True)
+        client.session.get.return_value = json_response({'invitations': [{'id': 'Venue/-/Submission', 'tmdate': 1}]})
+
+        first = client.get_invitation('Venue/-/Submission')
+        second = client.get_invitation('Venue/-/Submission')
+
+        assert client.session.get.call_count == 2
+        assert first.id == second.id
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        cache = openreview.api.client.EntityCache(ttl=60, max_size=2)
+        cache.set(('note', 'a', None), openreview.api.Note(id='a'))
+        cache.set(('note', 'b', None), openreview.api.Note(id='b'))
+        cache.get(('note', 'a', None))
+        cache.set(('note', 'c', None), openreview.api.Note(id='c'))
+
+        assert cache.get(('note', 'b', None))[0] is None
+        assert cache.get(('note', 'a', None))[0].id == 'a'
+        assert cache.get(('note', 'c', None))[0].id == 'c'
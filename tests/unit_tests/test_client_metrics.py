@@ -0,0 +1,102 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openreview
+
+
+class Handler(BaseHTTPRequestHandler):
+    failures = 0
+
+    def send_json(self, status, body, headers=None):
+        body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith('/invitations') and Handler.failures:
+            Handler.failures -= 1
+            return self.send_json(503, { 'name': 'Error', 'message': 'unavailable' }, { 'Retry-After': '0' })
+        if self.path.startswith('/invitations'):
+            return self.send_json(200, { 'invitations': [{ 'id': 'Venue/-/Submission' }] })
+        self.send_json(200, { 'groups': [{ 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1'] }] })
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        self.send_json(200, { 'id': 'edit1', 'domain': 'Venue', 'signatures': ['Venue'], 'group': { 'id': 'Venue/Reviewers' } })
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestClientMetrics:
+
+    def setup_method(self):
+        Handler.failures = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.baseurl = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_are_recorded_per_endpoint(self):
+        client = openreview.api.OpenReviewClient(baseurl=self.baseurl)
+        Handler.failures = 1
+
+        client.get_group('Venue/Reviewers')
+        client.get_group('Venue/Reviewers')
+        client.get_invitation('Venue/-/Submission')
+        client.post_group_edit(invitation='Venue/-/Edit', signatures=['Venue'], group=openreview.api.Group(id='Venue/Reviewers'), flush_members_cache=False)
+
+        snapshot = client.metrics.snapshot()
+        groups = snapshot['GET /groups']
+        assert groups['requests'] == 2
+        assert groups['bytes_received'] > 0
+        assert groups['json_decodes'] == 2
+        assert groups['latency_buckets']['+Inf'] == 2
+        assert snapshot['GET /invitations']['retries'] == 1
+        assert snapshot['GET /invitations']['requests'] == 1
+        assert snapshot['POST /groups/edits']['bytes_sent'] > 0
+        assert json.loads(client.metrics.to_json()) == snapshot
+
+    def test_scope(self):
+        client = openreview.Client(baseurl=self.baseurl)
+
+        client.get_group('Venue/Reviewers')
+        with client.metrics.scope() as stats:
+            client.get_group('Venue/Reviewers')
+
+        assert stats.snapshot()['GET /groups']['requests'] == 1
+        assert client.metrics.snapshot()['GET /groups']['requests'] == 2
+        assert client.metrics.scopes == []
+
+    def test_prometheus(self):
+        metrics = openreview.metrics.RequestMetrics()
+        metrics.record_request('GET /notes', 200, 0.2, 0, 100)
+        metrics.record_request('GET /notes', 404, 3, 0, 10)
+        metrics.record_retry('GET /notes')
+
+        text = metrics.to_prometheus()
+        assert 'openreview_client_requests_total{method="GET",endpoint="/notes"} 2' in text
+        assert 'openreview_client_request_errors_total{method="GET",endpoint="/notes"} 1' in text
+        assert 'openreview_client_retries_total{method="GET",endpoint="/notes"} 1' in text
+        assert 'openreview_client_request_duration_seconds_bucket{method="GET",endpoint="/notes",le="0.25"} 1' in text
+        assert 'openreview_client_request_duration_seconds_bucket{method="GET",endpoint="/notes",le="+Inf"} 2' in text
+
+    def test_ids_are_removed_from_endpoints(self):
+        endpoint = openreview.metrics.RequestMetrics.endpoint
+        assert endpoint('get', 'https://api2.openreview.net/notes?id=abc') == 'GET /notes'
+        assert endpoint('get', 'https://api2.openreview.net/profiles/search') == 'GET /profiles/search'
+        assert endpoint('delete', 'https://api2.openreview.net/groups/members/cache/ICML.cc/2025/Conference/Reviewers') == 'DELETE /groups/members/cache/{id}'
+        assert endpoint('delete', 'https://api2.openreview.net/settings/institutions/mit.edu') == 'DELETE /settings/institutions/{id}'
+        assert endpoint('get', 'https://api2.openreview.net/profiles/~Reviewer_One1') == 'GET /profiles/{id}'
+        assert endpoint('put', 'https://api2.openreview.net/activate/token123') == 'PUT /activate/{id}'
+        assert endpoint('get', 'https://api2.openreview.net/unknown/abc/def') == 'GET /unknown/{id}'
+        assert endpoint('get', 'https://api2.openreview.net') == 'GET /'
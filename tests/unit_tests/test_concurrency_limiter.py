@@ -0,0 +1,127 @@
+import threading
+import time
+from unittest.mock import MagicMock
+import requests
+import openreview
+from requests.packages.urllib3.util.retry import Retry
+from openreview.tools import AdaptiveConcurrencyLimiter
+from openreview.api.client import LogRetry
+
+
+def response(status, retry_after=None, elapsed=0.1):
+    r = MagicMock()
+    r.status_code = status
+    r.headers = { 'Retry-After': retry_after } if retry_after is not None else {}
+    r.elapsed.total_seconds.return_value = elapsed
+    return r
+
+
+class TestAdaptiveConcurrencyLimiter:
+
+    def test_additive_increase_while_latency_is_stable(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+        for _ in range(100):
+            limiter.observe_response(response(200, elapsed=0.1))
+        assert limiter.limit == 8
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+        limiter.observe_response(response(200, elapsed=0.1))
+        limit = limiter.limit
+        for _ in range(10):
+            limiter.observe_response(response(200, elapsed=1.0))
+        assert limiter.limit == limit
+
+    def test_multiplicative_decrease_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=32)
+        limiter.observe_response(response(503))
+        limiter.observe_response(response(503))
+        assert limiter.limit == 8
+
+        limiter.last_decrease = 0
+        limiter.observe_response(response(429, retry_after='0.3'))
+        assert limiter.limit == 4
+
+        start = time.monotonic()
+        with limiter:
+            pass
+        assert time.monotonic() - start >= 0.25
+
+    def test_limits_concurrent_requests(self, monkeypatch):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=8)
+        running = { 'now': 0, 'max': 0 }
+        lock = threading.Lock()
+
+        def send(adapter, request, **kwargs):
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.02)
+            with lock:
+                running['now'] -= 1
+            return request
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', send)
+        adapter = openreview.tools.LimitedHTTPAdapter(limiter)
+
+        def request(param):
+            ## the slot is held by each HTTP request, not by the task that sends them
+            return adapter.send(param) + adapter.send(param)
+
+        results = openreview.tools.concurrent_requests(request, list(range(30)), max_workers=limiter.max_limit)
+
+        assert results == [p * 2 for p in range(30)]
+        assert running['max'] == 3
+
+    def test_nested_fan_out_is_limited_without_deadlock(self, monkeypatch):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        running = { 'now': 0, 'max': 0 }
+        lock = threading.Lock()
+
+        def send(adapter, request, **kwargs):
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.005)
+            with lock:
+                running['now'] -= 1
+            return request
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', send)
+        adapter = openreview.tools.LimitedHTTPAdapter(limiter)
+
+        def outer(param):
+            adapter.send(param)
+            return sum(openreview.tools.concurrent_requests(adapter.send, list(range(5)), max_workers=4))
+
+        assert openreview.tools.concurrent_requests(outer, list(range(4)), max_workers=4) == [10] * 4
+        assert running['max'] == 2
+
+    def test_client_session_reports_to_limiter(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        assert client.concurrency_limiter is None
+        assert not isinstance(client.session.get_adapter('http://localhost:3001'), openreview.tools.LimitedHTTPAdapter)
+        assert openreview.tools.get_max_workers(client, 6) == 6
+
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001', concurrency_limiter=limiter)
+        other_client = openreview.Client(baseurl='http://localhost:3000')
+        adapter = client.session.get_adapter('http://localhost:3001')
+        assert limiter.observe_response in client.session.hooks['response']
+        assert isinstance(adapter, openreview.tools.LimitedHTTPAdapter)
+        assert adapter.limiter is limiter
+        assert adapter.max_retries.limiter is limiter
+        assert openreview.tools.get_max_workers(client, 6) == 16
+        assert limiter.observe_response not in other_client.session.hooks['response']
+
+    def test_slot_is_released_while_waiting_to_retry(self, monkeypatch):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        active_while_sleeping = []
+        monkeypatch.setattr(Retry, 'sleep', lambda retry, response=None: active_while_sleeping.append(limiter.active))
+
+        retry = LogRetry(total=3, limiter=limiter).new(total=2)
+        with limiter:
+            retry.sleep()
+            assert limiter.active == 1
+
+        assert active_while_sleeping == [0]
+        assert limiter.active == 0
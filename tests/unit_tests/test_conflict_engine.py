@@ -0,0 +1,61 @@
+import random
+import openreview
+from openreview.conflicts import ConflictEngine, merge_infos, VENUE_RULES, CONFERENCE_RULES, ALL_RULES
+
+
+def random_info(rng, id):
+    return {
+        'id': id,
+        'domains': set(rng.sample([f'university{i}.edu' for i in range(40)], rng.randint(0, 3))),
+        'emails': set(rng.sample([f'user{i}@mail.com' for i in range(300)], rng.randint(0, 2))),
+        'relations': set(rng.sample([f'~User_{i}1' for i in range(300)] + [f'user{i}@mail.com' for i in range(300)], rng.randint(0, 4))),
+        'publications': set(rng.sample([f'pub{i}' for i in range(500)], rng.randint(0, 5)))
+    }
+
+
+def naive_conflicts(author_info, user_info, rules):
+    conflicts = set()
+    for author_field, user_field in rules:
+        values = [user_info[user_field]] if user_field == 'id' else user_info[user_field]
+        conflicts.update(author_info[author_field].intersection(values))
+    return conflicts
+
+
+class TestConflictEngine:
+
+    def test_same_conflicts_as_set_intersections(self):
+        rng = random.Random(42)
+        users = [random_info(rng, f'~User_{i}1') for i in range(300)]
+        papers = [[random_info(rng, f'~User_{rng.randint(0, 400)}1') for _ in range(rng.randint(1, 4))] for _ in range(100)]
+
+        for rules in [VENUE_RULES, CONFERENCE_RULES, ALL_RULES]:
+            engine = ConflictEngine(users, rules=rules)
+            for authors in papers:
+                author_info = merge_infos(authors)
+                expected = [code for code, user in enumerate(users) if naive_conflicts(author_info, user, rules)]
+                assert engine.conflicts(author_info).tolist() == expected
+                for code in expected[:3]:
+                    assert engine.conflict_reasons(author_info, code) == naive_conflicts(author_info, users[code], rules)
+
+    def test_get_conflicts(self):
+        def profile(id, emails, history=None, relations=None, publications=None):
+            return openreview.Profile(id=id, content={ 'emails': emails, 'history': history or [], 'relations': relations or [], 'publications': publications or [] })
+
+        author = profile('~Author_One1', ['author@umass.edu'], relations=[{ 'username': '~Reviewer_One1', 'relation': 'Coauthor' }])
+        reviewer = profile('~Reviewer_One1', ['reviewer@mit.edu'])
+        other = profile('~Reviewer_Two1', ['reviewer@cmu.edu'], history=[{ 'institution': { 'domain': 'cs.umass.edu' } }])
+        unrelated = profile('~Reviewer_Three1', ['reviewer@gmail.com'])
+
+        assert openreview.tools.get_conflicts([author], reviewer) == ['~Reviewer_One1']
+        assert openreview.tools.get_conflicts([author], other) == ['umass.edu']
+        assert openreview.tools.get_conflicts([author], unrelated) == []
+
+    def test_conflicts_many_with_workers(self):
+        rng = random.Random(7)
+        users = [random_info(rng, f'~User_{i}1') for i in range(300)]
+        papers = [merge_infos([random_info(rng, f'~User_{rng.randint(0, 400)}1') for _ in range(rng.randint(1, 4))]) for _ in range(250)]
+
+        engine = ConflictEngine(users)
+        expected = [engine.conflicts(author_info).tolist() for author_info in papers]
+        assert [codes.tolist() for codes in engine.conflicts_many(papers)] == expected
+        assert [codes.tolist() for codes in engine.conflicts_many(papers, workers=2, chunk_size=40)] == expected
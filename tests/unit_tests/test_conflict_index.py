@@ -0,0 +1,76 @@
+import pytest
+import openreview
+from openreview.conflicts import ConflictIndex
+
+
+def profile(id, emails, tmdate=1, history=None, relations=None):
+    return openreview.Profile(id=id, tmdate=tmdate, content={ 'names': [{ 'username': id }], 'emails': emails, 'history': history or [], 'relations': relations or [], 'publications': [] })
+
+
+PROFILES = {
+    '~Author_One1': profile('~Author_One1', ['author@umass.edu'], relations=[{ 'username': '~Reviewer_One1', 'relation': 'Coauthor' }]),
+    '~Author_Two1': profile('~Author_Two1', ['author@cmu.edu']),
+    '~Reviewer_One1': profile('~Reviewer_One1', ['reviewer@mit.edu']),
+    '~Reviewer_Two1': profile('~Reviewer_Two1', ['reviewer@cs.umass.edu']),
+    '~Reviewer_Three1': profile('~Reviewer_Three1', ['reviewer@gmail.com'])
+}
+
+
+class TestConflictIndex:
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        loads = []
+        def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False):
+            if with_publications:
+                loads.append(list(ids_or_emails))
+            return [PROFILES[id] for id in ids_or_emails]
+        monkeypatch.setattr(openreview.tools, 'get_profiles', get_profiles)
+        return loads
+
+    def test_conflicts_match_get_conflicts(self, loads, monkeypatch):
+        index = ConflictIndex()
+        index.add_paper('paper1', ['~Author_One1', '~Author_Two1'])
+        for reviewer in ['~Reviewer_One1', '~Reviewer_Two1', '~Reviewer_Three1']:
+            index.add_profile(reviewer)
+            expected = openreview.tools.get_conflicts([PROFILES['~Author_One1'], PROFILES['~Author_Two1']], PROFILES[reviewer])
+            assert index.conflicts('paper1', reviewer) == sorted(expected)
+
+        assert index.conflicts('paper1', '~Reviewer_One1') == ['~Reviewer_One1']
+        assert index.conflicts('paper1', '~Reviewer_Three1') == []
+
+        ## papers and profiles are only loaded once with their publications
+        assert not index.add_paper('paper1', ['~Author_One1', '~Author_Two1'])
+        assert not index.add_profile('~Reviewer_One1')
+        assert len(loads) == 4
+
+        ## a profile, or an author profile, with a new tmdate is computed again
+        monkeypatch.setitem(PROFILES, '~Reviewer_One1', profile('~Reviewer_One1', ['reviewer@umass.edu'], tmdate=2))
+        assert index.add_profile('~Reviewer_One1')
+        assert index.conflicts('paper1', '~Reviewer_One1') == ['umass.edu', '~Reviewer_One1']
+        monkeypatch.setitem(PROFILES, '~Author_Two1', profile('~Author_Two1', ['author@mit.edu'], tmdate=2))
+        assert index.add_paper('paper1', ['~Author_One1', '~Author_Two1'])
+        assert index.conflicts('paper1', '~Reviewer_Three1') == []
+        assert not index.add_paper('paper1', ['~Author_One1', '~Author_Two1'])
+        assert len(loads) == 6
+
+        ## a change of authors computes the paper again
+        assert index.add_paper('paper1', ['~Author_Two1'])
+        assert index.conflicts('paper1', '~Reviewer_One1') == []
+
+        with pytest.raises(openreview.OpenReviewException):
+            index.conflicts('paper2', '~Reviewer_One1')
+
+    def test_save_and_load(self, loads, tmp_path):
+        path = str(tmp_path / 'index.json')
+        index = ConflictIndex(policy='NeurIPS', n_years=3)
+        index.add_paper('paper1', ['~Author_One1'])
+        index.set_profile(PROFILES['~Reviewer_Two1'], alias='reviewer@cs.umass.edu')
+        index.save(path)
+
+        loaded = ConflictIndex.load(path, policy='NeurIPS', n_years=3)
+        assert loaded.conflicts('paper1', 'reviewer@cs.umass.edu') == index.conflicts('paper1', '~Reviewer_Two1') == ['umass.edu']
+        assert not loaded.add_paper('paper1', ['~Author_One1'])
+
+        ## other settings start from scratch
+        assert ConflictIndex.load(path, policy='default', n_years=3).papers == {}
@@ -0,0 +1,49 @@
+import tld
+from openreview import tools
+
+
+def legacy_subdomains(domain):
+    duplicate_domains = tools.load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    valid_domains = set()
+    for d in domains:
+        if not tld.is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+    return sorted(valid_domains)
+
+
+class TestDomainCanonicalizer:
+
+    def test_same_result_as_tld_lookup(self):
+        domains = list(tools.load_duplicate_domains().keys()) + [
+            'johnsmith@iesl.cs.umass.edu', 'cs.umass.edu', 'gmail.com', 'lab.ox.ac.uk', 'ox.ac.uk', 'ac.uk', 'edu',
+            'foo.github.io', 'x.y.z.example.co.jp', 'CS.UMass.edu', '..mit.edu', ' .mit.edu', 'localhost', '', 'mail.aberdeen.ac.uk'
+        ]
+        canonicalizer = tools.DomainCanonicalizer()
+        for domain in domains:
+            assert list(canonicalizer.subdomains(domain)) == legacy_subdomains(domain), domain
+            assert tools.subdomains(domain) == legacy_subdomains(domain), domain
+
+    def test_canonical_subdomains(self):
+        assert tools.canonical_subdomains(['iesl.cs.umass.edu', 'mail.aberdeen.ac.uk', 'gmail.com']) == {
+            'iesl.cs.umass.edu', 'cs.umass.edu', 'umass.edu', 'mail.aberdeen.ac.uk', 'abdn.ac.uk', 'gmail.com'
+        }
+
+        canonicalizer = tools.DomainCanonicalizer({ 'old.edu': 'new.edu' }, max_size=10)
+        assert canonicalizer.canonical_subdomains(['cs.old.edu', 'cs.old.edu']) == { 'cs.old.edu', 'new.edu' }
+        assert canonicalizer.subdomains.cache_info().hits == 1
+
+    def test_lookups_do_not_grow_the_trie(self):
+        def count(node):
+            return 1 + sum(count(child) for child in node.children.values())
+
+        canonicalizer = tools.DomainCanonicalizer({ 'old.edu': 'new.edu' }, max_size=10)
+        size = count(canonicalizer.root)
+        for index in range(100):
+            canonicalizer.subdomains(f'user@lab{index}.cs.old{index}.edu')
+        canonicalizer.subdomains('cs.old.edu')
+
+        assert count(canonicalizer.root) == size
+        assert canonicalizer.subdomains.cache_info().currsize == 10
+        assert canonicalizer.is_public_suffix.cache_info().currsize <= 10
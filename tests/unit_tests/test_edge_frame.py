@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+import openreview
+from openreview.api import Edge, EdgeFrame
+
+
+def get_edges():
+    return [
+        Edge(id='e1', invitation='Venue/Reviewers/-/Affinity_Score', head='paper1', tail='~Reviewer_One1', weight=0.5),
+        Edge(id='e2', invitation='Venue/Reviewers/-/Affinity_Score', head='paper1', tail='~Reviewer_Two1', weight=0.25),
+        Edge(id='e3', invitation='Venue/Reviewers/-/Affinity_Score', head='paper2', tail='~Reviewer_One1', weight=1.0),
+        Edge(id='e4', invitation='Venue/Reviewers/-/Conflict', head='paper2', tail='~Reviewer_Two1', weight=-1, label='Conflict'),
+        Edge(id='e5', invitation='Venue/Reviewers/-/Custom_Max_Papers', head='Venue/Reviewers', tail='~Reviewer_Two1', label='3'),
+    ]
+
+
+def as_tuples(edges):
+    return [(e.id, e.invitation, e.head, e.tail, e.weight, e.label) for e in edges]
+
+
+class TestEdgeFrame:
+
+    def test_round_trip_with_edges(self):
+        edges = get_edges()
+        frame = EdgeFrame.from_edges(edges)
+
+        assert len(frame) == 5
+        assert list(frame.heads) == ['paper1', 'paper2', 'Venue/Reviewers']
+        assert frame.tail_codes.dtype == np.int32
+        assert as_tuples(frame.to_edges()) == as_tuples(edges)
+
+    def test_from_json_and_grouped_edges(self):
+        frame = EdgeFrame.from_edges(e.to_json() for e in get_edges())
+        assert len(frame) == 5
+
+        grouped = [
+            { 'id': { 'head': 'paper1' }, 'values': [{ 'tail': '~Reviewer_One1', 'weight': 0.5 }, { 'tail': '~Reviewer_Two1', 'weight': 0.25 }] },
+            { 'id': { 'head': 'paper2' }, 'values': [{ 'tail': '~Reviewer_One1', 'weight': 1.0 }] }
+        ]
+        frame = EdgeFrame.from_grouped_edges(grouped, invitation='Venue/Reviewers/-/Affinity_Score')
+        assert frame.to_dict() == { 'paper1': { '~Reviewer_One1': 0.5, '~Reviewer_Two1': 0.25 }, 'paper2': { '~Reviewer_One1': 1.0 } }
+
+    def test_groupby(self):
+        frame = EdgeFrame.from_edges(get_edges())
+
+        by_tail = { tail: sorted(group.head_ids.tolist()) for tail, group in frame.groupby('tail') }
+        assert by_tail == { '~Reviewer_One1': ['paper1', 'paper2'], '~Reviewer_Two1': ['Venue/Reviewers', 'paper1', 'paper2'] }
+
+        by_head = { head: group.weights.tolist() for head, group in frame.groupby('head') }
+        assert by_head['paper1'] == [0.5, 0.25]
+        assert np.isnan(by_head['Venue/Reviewers'][0])
+
+        assert list(EdgeFrame.from_edges([]).groupby('head')) == []
+        with pytest.raises(openreview.OpenReviewException):
+            list(frame.groupby('label'))
+
+    def test_parquet(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        frame = EdgeFrame.from_edges(get_edges())
+        frame.to_parquet(str(tmp_path / 'edges.parquet'))
+
+        loaded = EdgeFrame.read_parquet(str(tmp_path / 'edges.parquet'))
+        assert as_tuples(loaded.to_edges()) == as_tuples(get_edges())
+
+    def test_get_all_edges_as_frame_honours_limit_and_offset(self):
+        edges = [e.to_json() for e in get_edges()]
+
+        class FakeClient:
+            limit = 2
+
+            def get_edges(self, limit=None, offset=None, with_count=None, raw=False, **params):
+                page = edges[offset or 0:(offset or 0) + min(limit or self.limit, self.limit)]
+                if with_count and offset is None:
+                    return page, len(edges)
+                return page
+
+        frame = openreview.api.OpenReviewClient.get_all_edges(FakeClient(), invitation='Venue/Reviewers/-/Affinity_Score', offset=1, limit=3, as_frame=True)
+        assert list(frame.ids) == ['e2', 'e3', 'e4']
+
+        frame = openreview.api.OpenReviewClient.get_all_edges(FakeClient(), invitation='Venue/Reviewers/-/Affinity_Score', as_frame=True)
+        assert list(frame.ids) == ['e1', 'e2', 'e3', 'e4', 'e5']
+
+    def test_concurrent_iterget_bounds_the_pages_in_memory(self):
+        edges = [{ 'id': f'e{i}', 'head': f'paper{i % 7}', 'tail': f'~User{i % 11}', 'weight': i / 100 } for i in range(95)]
+        requested = []
+
+        class FakeClient:
+            limit = 10
+
+            def get_edges(self, limit=None, offset=None, with_count=None, raw=False, **params):
+                if with_count:
+                    return edges[:limit], len(edges)
+                requested.append(offset)
+                return edges[offset:offset + limit]
+
+        consumed = 0
+        for edge in openreview.tools.concurrent_iterget(FakeClient(), FakeClient().get_edges, max_pages=3, offset=5, limit=80, raw=True):
+            assert edge['id'] == f'e{5 + consumed}'
+            consumed += 1
+            ## the pages requested ahead of the one being consumed are bounded
+            assert len(requested) <= consumed // 10 + 4
+        assert consumed == 80
+        assert requested == list(range(5, 85, 10))
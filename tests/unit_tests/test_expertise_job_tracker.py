@@ -0,0 +1,100 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+import openreview
+from openreview.expertise import ExpertiseJobTracker
+
+
+class FakeClient:
+
+    def __init__(self, statuses):
+        self.statuses = { job_id: list(s) for job_id, s in statuses.items() }
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get_expertise_status(self, job_id=None, group_id=None, paper_id=None, baseurl=None):
+        with self.lock:
+            if paper_id:
+                self.requests.append(paper_id)
+                return { 'results': [{ 'jobId': 'job-' + paper_id, 'status': 'Completed' }] } if paper_id != 'paper3' else { 'results': [] }
+            self.requests.append(job_id)
+            statuses = self.statuses[job_id]
+            status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return { 'jobId': job_id, 'status': status, 'description': status }
+
+
+class TestExpertiseJobTracker:
+
+    def test_wait_for_many_jobs(self):
+        client = FakeClient({
+            'job1': ['Queued', 'Running', 'Completed'],
+            'job2': ['Completed'],
+            'job3': ['Running', 'Error']
+        })
+        tracker = ExpertiseJobTracker(client, min_interval=0.01, max_interval=0.05)
+        completed = []
+        futures = [tracker.watch(job_id, callback=lambda job_id, status: completed.append(job_id)) for job_id in ['job1', 'job2', 'job3']]
+        assert tracker.watch('job1') is futures[0]
+
+        tracker.wait()
+        assert futures[0].result()['status'] == 'Completed'
+        assert futures[1].result()['status'] == 'Completed'
+        with pytest.raises(openreview.OpenReviewException, match='There was an error computing scores'):
+            futures[2].result()
+        assert sorted(completed) == ['job1', 'job2']
+        assert client.requests.count('job2') == 1
+        assert tracker.pending() == []
+        assert tracker.stats == { 'requests': 6, 'completed': 2, 'failed': 1 }
+
+    def test_backoff_and_timeout(self):
+        client = FakeClient({ 'job1': ['Running'] })
+        tracker = ExpertiseJobTracker(client, min_interval=0.01, max_interval=0.04, backoff=2, timeout=0.2)
+        future = tracker.watch('job1')
+        tracker.poll()
+        tracker.poll()
+        assert tracker.jobs['job1']['interval'] == 0.01
+        intervals = []
+        while not future.done():
+            delay = tracker.poll()
+            intervals.append(tracker.jobs['job1']['interval'])
+            if delay:
+                threading.Event().wait(delay)
+        assert max(intervals) == 0.04
+        with pytest.raises(openreview.OpenReviewException, match='Time out'):
+            future.result()
+
+    def test_background_thread(self):
+        client = FakeClient({ 'job1': ['Running', 'Completed'] })
+        tracker = ExpertiseJobTracker(client, min_interval=0.01)
+        tracker.start()
+        try:
+            assert tracker.watch('job1').result(timeout=5)['status'] == 'Completed'
+            assert tracker.wait_for('job1')['jobId'] == 'job1'
+        finally:
+            tracker.stop()
+        assert tracker.thread is None
+
+    def test_get_job_statuses(self):
+        tracker = ExpertiseJobTracker(FakeClient({}))
+        statuses = tracker.get_job_statuses('Journal/Action_Editors', ['paper1', 'paper2', 'paper3'])
+        assert statuses['paper1'] == { 'jobId': 'job-paper1', 'status': 'Completed' }
+        assert statuses['paper3'] is None
+
+    def test_empty_profile_scores_are_rejected(self):
+        client = FakeClient({ 'job1': ['Completed'] })
+        client.request_expertise = lambda **kwargs: { 'jobId': 'job1' }
+        client.get_expertise_results = lambda job_id, baseurl=None: { 'metadata': { 'no_profile': [], 'no_publications': [] }, 'results': [] }
+        client.delete_edges = MagicMock()
+
+        matching = openreview.venue.matching.Matching.__new__(openreview.venue.matching.Matching)
+        matching.client = client
+        matching.venue = MagicMock()
+        matching.match_group = openreview.api.Group(id='Venue/Reviewers')
+        matching.alternate_matching_group = 'Venue/Area_Chairs'
+        matching.submission_content = None
+        matching._create_edge_invitation = MagicMock()
+
+        ## an empty result must not replace the current scores
+        with pytest.raises(openreview.OpenReviewException, match='No profile scores provided'):
+            matching._compute_scores('Venue/Reviewers/-/Affinity_Score', [])
+        client.delete_edges.assert_not_called()
@@ -0,0 +1,79 @@
+import copy
+import json
+from unittest.mock import MagicMock
+import pytest
+import openreview
+from openreview.api import Edge, Note, Group, Tag
+
+
+def json_response(body):
+    response = MagicMock()
+    response.json.return_value = body
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestFastDeserialization:
+
+    def test_models_use_slots(self):
+        edge = Edge(invitation='Venue/-/Affinity_Score', head='paper1', tail='~Reviewer_One1', weight=0.5)
+        for obj in [edge, Note(id='note1'), Group(id='Venue'), Tag(invitation='Venue/-/Bid', tag='High')]:
+            assert not hasattr(obj, '__dict__')
+            with pytest.raises(AttributeError):
+                obj.unknown_field = 1
+
+        ## copies and repr still work
+        assert copy.deepcopy(edge).weight == 0.5
+        assert "head = 'paper1'" in repr(edge)
+
+    def test_raw_mode(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        client.session = MagicMock()
+        client.session.get.return_value = json_response({ 'edges': [{ 'id': 'e1', 'head': 'paper1', 'tail': '~Reviewer_One1', 'weight': 0.5 }], 'count': 1 })
+
+        edges, count = client.get_edges(invitation='Venue/-/Affinity_Score', raw=True, with_count=True)
+        assert edges == [{ 'id': 'e1', 'head': 'paper1', 'tail': '~Reviewer_One1', 'weight': 0.5 }]
+        assert count == 1
+        ## the body is decoded once even when the count is requested
+        assert client.session.get.return_value.json.call_count == 1
+
+        assert isinstance(client.get_edges(invitation='Venue/-/Affinity_Score')[0], Edge)
+
+    def test_raw_mode_for_groups_and_notes(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        client.session = MagicMock()
+
+        client.session.get.return_value = json_response({ 'groups': [{ 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1'] }], 'count': 1 })
+        groups, count = client.get_groups(prefix='Venue', raw=True, with_count=True)
+        assert groups == [{ 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1'] }]
+        assert count == 1
+        assert client.get_all_groups(prefix='Venue', raw=True) == [{ 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1'] }]
+        assert isinstance(client.get_groups(prefix='Venue')[0], Group)
+
+        client.session.get.return_value = json_response({ 'notes': [{ 'id': 'note1', 'number': 1, 'content': {} }], 'count': 1 })
+        notes, count = client.get_notes(invitation='Venue/-/Submission', raw=True, with_count=True)
+        assert notes == [{ 'id': 'note1', 'number': 1, 'content': {} }]
+        assert count == 1
+        client.session.get.side_effect = [json_response({ 'notes': [{ 'id': 'note1', 'number': 1, 'content': {} }], 'count': 1 }), json_response({ 'notes': [] })]
+        assert client.get_all_notes(invitation='Venue/-/Submission', raw=True) == [{ 'id': 'note1', 'number': 1, 'content': {} }]
+        client.session.get.side_effect = None
+        assert isinstance(client.get_notes(invitation='Venue/-/Submission')[0], Note)
+
+    def test_raw_mode_with_keyset_pagination(self):
+        ids = ['id{:04d}'.format(i) for i in range(2500)]
+
+        def get_notes(after=None, limit=1000, sort=None, with_count=None, raw=None, offset=None):
+            start = ids.index(after) + 1 if after else 0
+            notes = [{ 'id': i } for i in ids[start:start + limit]]
+            return (notes, len(ids)) if with_count else notes
+
+        assert [n['id'] for n in openreview.tools.efficient_iterget(get_notes, raw=True)] == ids
+        assert [n['id'] for n in openreview.tools.sharded_get(get_notes, shards=3, raw=True)] == ids
+
+    def test_fast_json_hook(self, monkeypatch):
+        monkeypatch.setattr(openreview.tools, 'json_loads', lambda body: { 'decoded_by': 'fast', 'body': json.loads(body) })
+        response = MagicMock()
+        response.content = b'{"notes": []}'
+
+        openreview.tools.use_fast_json(response)
+        assert response.json() == { 'decoded_by': 'fast', 'body': { 'notes': [] } }
@@ -0,0 +1,96 @@
+import threading
+import pytest
+import openreview
+from openreview.api import Group
+
+
+class FakeClient:
+
+    def __init__(self, groups, fail=None):
+        self.groups = { g.id: g for g in groups }
+        self.fail = fail or []
+        self.edits = []
+        self.gets = []
+        self.lock = threading.Lock()
+
+    def get_all_groups(self, prefix):
+        return [Group.from_json(g.to_json()) for id, g in self.groups.items() if id.startswith(prefix)]
+
+    def get_group(self, id):
+        self.gets.append(id)
+        group = Group.from_json(self.groups[id].to_json())
+        if group.anonids:
+            members = [self.groups[m].members[0] if m in self.groups else m for m in group.members]
+            group.anon_members = [m for m in group.members if m in self.groups]
+            group.members = members
+        return group
+
+    def post_group_edit(self, invitation, signatures, group, readers, writers):
+        if group.id in self.fail:
+            raise openreview.OpenReviewException({ 'name': 'ForbiddenError', 'status': 403 })
+        with self.lock:
+            self.edits.append((invitation, signatures, group.id, group.members))
+            stored = self.groups[group.id]
+            if 'add' in group.members:
+                stored.members = stored.members + [m for m in group.members['add'] if m not in stored.members]
+            if 'remove' in group.members:
+                stored.members = [m for m in stored.members if m not in group.members['remove']]
+
+
+def group(id, members, anonids=False):
+    return Group(id=id, domain='Venue', signatures=['Venue'], readers=['Venue'], writers=['Venue'], signatories=['Venue'], members=members, anonids=anonids)
+
+
+class TestGroupMembershipBatcher:
+
+    def test_add_without_reads(self):
+        client = FakeClient([group('Venue/Submission1/Reviewers', []), group('Venue/Submission2/Reviewers', ['~A1'])])
+        batcher = openreview.tools.GroupMembershipBatcher(client, invitation='Venue/-/Edit', signatures=['Venue'])
+        batcher.add('Venue/Submission1/Reviewers', ['~A1', '~B1'])
+        batcher.add('Venue/Submission1/Reviewers', '~C1')
+        batcher.add('Venue/Submission2/Reviewers', '~B1')
+
+        result = batcher.flush()
+        assert result == { 'groups': 2, 'added': 4, 'removed': 0, 'failures': {} }
+        assert client.gets == []
+        assert len(client.edits) == 2
+        assert client.groups['Venue/Submission1/Reviewers'].members == ['~A1', '~B1', '~C1']
+        assert client.groups['Venue/Submission2/Reviewers'].members == ['~A1', '~B1']
+        assert batcher.flush()['groups'] == 0
+
+    def test_remove_anonymous_members(self):
+        groups = [
+            group('Venue/Submission1/Reviewers', ['Venue/Submission1/Reviewer_abc', 'Venue/Submission1/Reviewer_def'], anonids=True),
+            group('Venue/Submission1/Reviewer_abc', ['~A1']),
+            group('Venue/Submission1/Reviewer_def', ['~B1'])
+        ]
+
+        client = FakeClient(groups)
+        batcher = openreview.tools.GroupMembershipBatcher(client, invitation='Venue/-/Edit', signatures=['Venue'])
+        batcher.prefetch('Venue/Submission')
+        batcher.remove('Venue/Submission1/Reviewers', ['~A1'])
+        assert batcher.flush()['removed'] == 1
+        assert client.gets == []
+        assert client.groups['Venue/Submission1/Reviewers'].members == ['Venue/Submission1/Reviewer_def']
+
+        ## groups that were not prefetched are requested to get the anonymous ids
+        batcher = openreview.tools.GroupMembershipBatcher(client, invitation='Venue/-/Edit', signatures=['Venue'])
+        batcher.remove('Venue/Submission1/Reviewers', ['~B1'])
+        batcher.flush()
+        assert client.gets == ['Venue/Submission1/Reviewers']
+        assert client.groups['Venue/Submission1/Reviewers'].members == []
+
+    def test_last_change_wins_and_failures(self):
+        client = FakeClient([group('Venue/Submission1/Reviewers', ['~A1']), group('Venue/Submission2/Reviewers', [])], fail=['Venue/Submission2/Reviewers'])
+        batcher = openreview.tools.GroupMembershipBatcher(client, invitation='Venue/-/Edit', signatures=['Venue'])
+        batcher.remove('Venue/Submission1/Reviewers', '~A1')
+        batcher.add('Venue/Submission1/Reviewers', '~A1')
+        batcher.add('Venue/Submission2/Reviewers', '~B1')
+
+        result = batcher.flush()
+        assert result['groups'] == 1
+        assert list(result['failures']) == ['Venue/Submission2/Reviewers']
+        assert client.groups['Venue/Submission1/Reviewers'].members == ['~A1']
+
+        with pytest.raises(openreview.OpenReviewException):
+            batcher.add('Venue/Submission1/Reviewers', { 'id': '~A1' })
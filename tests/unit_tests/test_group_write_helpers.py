@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+import openreview
+
+
+class TestGroupWriteHelpers:
+
+    def get_client(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        client.get_group = MagicMock(return_value=openreview.api.Group(id='Venue/Reviewers', domain='Venue', signatures=['Venue'], members=['~Reviewer1']))
+        client.post_group_edit = MagicMock(return_value={})
+        return client
+
+    def test_add_members(self):
+        client = self.get_client()
+        group = client.add_members_to_group('Venue/Reviewers', '~Reviewer2')
+        assert group.id == 'Venue/Reviewers'
+        assert client.get_group.call_count == 2
+
+        client = self.get_client()
+        prefetched_group = openreview.api.Group(id='Venue/Reviewers', domain='Venue', signatures=['Venue'], members=[])
+        assert client.add_members_to_group('Venue/Reviewers', ['~Reviewer2'], return_result=False, prefetched_group=prefetched_group) is None
+        assert client.get_group.call_count == 0
+        kwargs = client.post_group_edit.call_args.kwargs
+        assert kwargs['invitation'] == 'Venue/-/Edit'
+        assert kwargs['group'].members == { 'add': ['~Reviewer2'] }
+
+    def test_remove_anonymous_members(self):
+        client = self.get_client()
+        prefetched_group = openreview.api.Group(id='Venue/Submission1/Reviewers', domain='Venue', signatures=['Venue'], members=['~Reviewer1'], anonids=True)
+        prefetched_group.anon_members = ['Venue/Submission1/Reviewer_abc']
+        assert client.remove_members_from_group(prefetched_group.id, '~Reviewer1', return_result=False, prefetched_group=prefetched_group) is None
+        assert client.get_group.call_count == 0
+        assert client.post_group_edit.call_args.kwargs['group'].members == { 'remove': ['Venue/Submission1/Reviewer_abc'] }
+
+    def test_group_post(self):
+        client = self.get_client()
+        group = openreview.api.Group(id='Venue/Reviewers', domain='Venue', members=['~Reviewer1'])
+        assert group.post(client) is None
+        assert client.post_group_edit.call_args.kwargs['invitation'] == 'Venue/-/Edit'
+        assert group.post(client, return_result=True).id == 'Venue/Reviewers'
+
+    def test_replace_members_with_ids(self, monkeypatch):
+        client = self.get_client()
+        monkeypatch.setattr(openreview.tools, 'get_profiles', lambda client, ids, as_dict=False: { '~Reviewer1': openreview.Profile(id='~Reviewer1'), 'reviewer@mail.com': openreview.Profile(id='~Reviewer2') })
+        group = openreview.api.Group(id='Venue/Reviewers', domain='Venue', members=['~Reviewer1', 'reviewer@mail.com'])
+        assert openreview.tools.replace_members_with_ids(client, group, return_result=False) is None
+        assert group.members == ['~Reviewer1', '~Reviewer2']
+        assert client.get_group.call_count == 0
+
+        ## an email and the tilde id of the same profile are posted once, and the local group has the posted members
+        group = openreview.api.Group(id='Venue/Reviewers', domain='Venue', members=['~Reviewer2', '~Reviewer1', 'reviewer@mail.com'])
+        monkeypatch.setattr(openreview.tools, 'get_profiles', lambda client, ids, as_dict=False: { '~Reviewer1': openreview.Profile(id='~Reviewer1'), '~Reviewer2': openreview.Profile(id='~Reviewer2'), 'reviewer@mail.com': openreview.Profile(id='~Reviewer2') })
+        openreview.tools.replace_members_with_ids(client, group, return_result=False)
+        assert group.members == ['~Reviewer2', '~Reviewer1']
+        assert client.post_group_edit.call_args.kwargs['group'].members == group.members
@@ -0,0 +1,126 @@
+import weakref
+import pytest
+from openreview.api import Edge
+from openreview.venue.matching import Matching
+
+
+class FakeClient:
+
+    def __init__(self, edges):
+        self.edges = { e['id']: e for e in edges }
+        self.posted = []
+        self.deleted = []
+
+    def get_all_edges(self, invitation, raw=False):
+        return [dict(e) for e in self.edges.values() if e['invitation'] == invitation]
+
+    def post_edges(self, edges):
+        self.posted.extend(edges)
+        for edge in edges:
+            if edge.ddate:
+                self.edges.pop(edge.id)
+            else:
+                edge.id = edge.id or 'new-{}'.format(len(self.edges))
+                self.edges[edge.id] = edge.to_json()
+        return edges
+
+    def delete_edges(self, invitation, wait_to_finish=False):
+        self.deleted.append(invitation)
+        self.edges = { id: e for id, e in self.edges.items() if e['invitation'] != invitation }
+
+
+def edge(head, tail, weight, id=None):
+    return Edge(id=id, invitation='Venue/Reviewers/-/Conflict', head=head, tail=tail, weight=weight, label='Conflict', readers=['Venue', tail], writers=['Venue'], signatures=['Venue'])
+
+
+class TestIncrementalMatching:
+
+    def matching(self, client, incremental):
+        matching = Matching.__new__(Matching)
+        matching.client = client
+        matching.incremental = incremental
+        matching.edge_changes = {}
+        return matching
+
+    def test_applies_the_difference(self):
+        current = [edge('paper1', '~A1', -1, 'e1'), edge('paper1', '~B1', -1, 'e2'), edge('paper2', '~A1', -1, 'e3'), edge('paper2', '~A1', -1, 'e4')]
+        client = FakeClient([e.to_json() for e in current])
+        matching = self.matching(client, incremental=True)
+
+        desired = [edge('paper1', '~A1', -1), edge('paper1', '~B1', 0.5), edge('paper3', '~C1', -1)]
+        changes = matching._replace_edges('Venue/Reviewers/-/Conflict', desired)
+
+        assert changes == { 'added': 1, 'updated': 1, 'deleted': 2, 'unchanged': 1 }
+        assert matching.edge_changes['Venue/Reviewers/-/Conflict'] == changes
+        assert client.deleted == []
+        assert len(client.posted) == 4
+        assert sorted((e['head'], e['tail'], e['weight']) for e in client.edges.values()) == [('paper1', '~A1', -1), ('paper1', '~B1', 0.5), ('paper3', '~C1', -1)]
+        assert client.edges['e2']['weight'] == 0.5
+
+        ## nothing changed, nothing is posted
+        client.posted = []
+        changes = matching._replace_edges('Venue/Reviewers/-/Conflict', [edge('paper1', '~A1', -1), edge('paper1', '~B1', 0.5), edge('paper3', '~C1', -1)])
+        assert changes == { 'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 3 }
+        assert client.posted == []
+
+    def test_full_replace(self):
+        client = FakeClient([edge('paper1', '~A1', -1, 'e1').to_json()])
+        matching = self.matching(client, incremental=False)
+        changes = matching._replace_edges('Venue/Reviewers/-/Conflict', [edge('paper1', '~A1', -1)])
+        assert client.deleted == ['Venue/Reviewers/-/Conflict']
+        assert changes['added'] == 1
+
+    def test_full_replace_does_not_keep_the_edges_in_memory(self):
+        client = FakeClient([edge('paper1', '~A1', -1, 'e1').to_json()])
+        matching = self.matching(client, incremental=False)
+        built = []
+
+        class TrackedEdge(Edge):
+            pass
+
+        def build_edges():
+            for index in range(1000):
+                e = TrackedEdge.from_json(edge(f'paper{index}', '~A1', -1).to_json())
+                built.append(weakref.ref(e))
+                ## the edges that were already built were written to the file and released
+                assert sum(ref() is not None for ref in built) <= 2
+                yield e
+                e = None
+
+        changes = matching._replace_edges('Venue/Reviewers/-/Conflict', build_edges())
+        assert changes['added'] == 1000
+        assert client.deleted == ['Venue/Reviewers/-/Conflict']
+        assert sorted(e['head'] for e in client.edges.values()) == sorted(f'paper{index}' for index in range(1000))
+        assert all(isinstance(e, Edge) and e.readers == ['Venue', '~A1'] for e in client.posted)
+
+    def test_invalid_rows_keep_the_previous_edges(self):
+        client = FakeClient([edge('paper1', '~A1', -1, 'e1').to_json()])
+        matching = self.matching(client, incremental=False)
+
+        def build_edges():
+            yield edge('paper1', '~A1', -1)
+            raise ValueError('could not convert string to float')
+
+        with pytest.raises(ValueError):
+            matching._replace_edges('Venue/Reviewers/-/Conflict', build_edges())
+        assert client.deleted == []
+        assert list(client.edges) == ['e1']
+
+    def test_streamed_scores(self):
+        client = FakeClient([])
+        client.get_edges_count = lambda invitation: len(client.edges)
+        matching = self.matching(client, incremental=False)
+        matching.venue = type('Venue', (), { 'id': 'Venue', 'venue_id': 'Venue' })()
+        matching.alternate_matching_group = None
+        matching.should_read_by_area_chair = False
+        matching.is_ethics_reviewer = False
+        matching._create_edge_invitation = lambda invitation_id: type('Invitation', (), { 'id': invitation_id })()
+
+        submissions = [type('Note', (), { 'id': f'paper{i}', 'number': i + 1 })() for i in range(3)]
+        stream = b'paper0,~A1,0.51234\npaper1,~A1,-0.2\r\npaper9,~B1,0.3\npaper2,~B1,0.7\n'
+        matching._build_scores_from_stream('Venue/Reviewers/-/Affinity_Score', stream, submissions)
+
+        assert matching.edge_changes['Venue/Reviewers/-/Affinity_Score']['added'] == 3
+        assert sorted((e['head'], e['tail'], e['weight'], e['readers'][-1]) for e in client.edges.values()) == [
+            ('paper0', '~A1', 0.5123, '~A1'), ('paper1', '~A1', 0.0, '~A1'), ('paper2', '~B1', 0.7, '~B1')
+        ]
@@ -0,0 +1,77 @@
+import threading
+import time
+import pytest
+import openreview
+
+
+class FakeObject:
+    def __init__(self, id):
+        self.id = id
+
+
+class FakeEndpoint:
+
+    def __init__(self, total, fail_at=None):
+        self.ids = [f'id{i:05d}' for i in range(total)]
+        self.fail_at = fail_at
+        self.fetched = 0
+        self.lock = threading.Lock()
+
+    def get(self, after=None, offset=None, limit=1000, sort=None, invitation=None):
+        start = offset or 0
+        if after is not None:
+            start = self.ids.index(after) + 1
+        if self.fail_at is not None and start >= self.fail_at:
+            raise openreview.OpenReviewException('Server error')
+        with self.lock:
+            self.fetched += 1
+        return [FakeObject(i) for i in self.ids[start:start + limit]]
+
+
+class TestPrefetchIterget:
+
+    def test_same_result_as_efficient_iterget(self):
+        for total in [0, 1, 99, 100, 101, 1234]:
+            for paginate_by in ['after', 'offset']:
+                endpoint = FakeEndpoint(total)
+                objects = openreview.tools.prefetch_iterget(endpoint.get, paginate_by=paginate_by, invitation='Venue/-/Submission', limit=100)
+                assert [o.id for o in objects] == endpoint.ids
+
+    def test_pages_in_memory_are_bounded(self):
+        endpoint = FakeEndpoint(1000)
+        objects = openreview.tools.prefetch_iterget(endpoint.get, max_pages=3, limit=10)
+
+        next(objects)
+        time.sleep(0.3)
+        ## one page being consumed and two prefetched
+        assert endpoint.fetched == 3
+
+        for _ in range(10):
+            next(objects)
+        time.sleep(0.3)
+        assert endpoint.fetched == 4
+        objects.close()
+
+    def test_errors_are_raised_to_the_caller(self):
+        endpoint = FakeEndpoint(1000, fail_at=200)
+        objects = openreview.tools.prefetch_iterget(endpoint.get, limit=100)
+
+        with pytest.raises(openreview.OpenReviewException, match='Server error'):
+            for _ in objects:
+                pass
+
+    def test_other_sort_pages_by_offset(self):
+        endpoint = FakeEndpoint(250)
+        calls = []
+
+        def get(**params):
+            calls.append(params)
+            return endpoint.get(**params)
+
+        objects = list(openreview.tools.prefetch_iterget(get, paginate_by='after', sort='number:desc', limit=100))
+        assert [o.id for o in objects] == endpoint.ids
+        assert all(call.get('after') is None and call['sort'] == 'number:desc' for call in calls)
+        assert [call['offset'] for call in calls] == [0, 100, 200]
+
+        with pytest.raises(openreview.OpenReviewException):
+            list(openreview.tools.prefetch_iterget(get, paginate_by='after', sort='number:desc', after='id00010'))
@@ -0,0 +1,103 @@
+import itertools
+import random
+import openreview
+from openreview.api import Edge, EdgeFrame, Group
+from openreview.venue.matching import preview_assignments
+
+
+class FakeClient:
+
+    def __init__(self, edges, members):
+        self.edges = edges
+        self.members = members
+
+    def get_all_edges(self, invitation, as_frame=False):
+        return EdgeFrame.from_edges([e for e in self.edges if e.invitation == invitation])
+
+    def get_group(self, id):
+        return Group(id=id, members=self.members)
+
+
+def edge(invitation, head, tail, weight=None, label=None):
+    return Edge(invitation=invitation, head=head, tail=tail, weight=weight, label=label)
+
+
+CONFIGURATION = {
+    'user_demand': '2',
+    'max_papers': '2',
+    'min_papers': '0',
+    'match_group': 'Venue/Reviewers',
+    'scores_specification': {
+        'Venue/Reviewers/-/Affinity_Score': { 'weight': 1, 'default': 0 },
+        'Venue/Reviewers/-/Bid': { 'weight': 1, 'default': 0, 'translate_map': { 'High': 0.5, 'Very Low': -1.0 } }
+    },
+    'conflicts_invitation': 'Venue/Reviewers/-/Conflict',
+    'custom_max_papers_invitation': 'Venue/Reviewers/-/Custom_Max_Papers'
+}
+
+
+class TestPreviewAssignments:
+
+    def test_optimal_assignment(self):
+        rng = random.Random(3)
+        papers = [f'paper{i}' for i in range(4)]
+        users = [f'~User{i}' for i in range(5)]
+        edges = [edge('Venue/Reviewers/-/Affinity_Score', p, u, weight=round(rng.random(), 2)) for p in papers for u in users]
+        edges += [
+            edge('Venue/Reviewers/-/Bid', 'paper0', '~User0', label='High'),
+            edge('Venue/Reviewers/-/Bid', 'paper1', '~User1', label='Very Low'),
+            edge('Venue/Reviewers/-/Conflict', 'paper2', '~User2', weight=-1),
+            edge('Venue/Reviewers/-/Custom_Max_Papers', 'Venue/Reviewers', '~User4', weight=0)
+        ]
+        client = FakeClient(edges, users)
+
+        preview = preview_assignments(client, CONFIGURATION)
+        assert preview['status'] == 'Optimal'
+        assert preview['stats']['assignments'] == 8
+        assignments = preview['assignments']
+        assert all(len(assignments[p]) == 2 for p in papers)
+        assert '~User2' not in [u for u, _ in assignments['paper2']]
+        assert '~User4' not in [u for assigned in assignments.values() for u, _ in assigned]
+
+        ## the same as the best assignment found by brute force
+        def score(p, u):
+            affinity = { (e.head, e.tail): e.weight for e in edges if e.invitation.endswith('Affinity_Score') }
+            bid = { ('paper0', '~User0'): 0.5, ('paper1', '~User1'): -1.0 }
+            return affinity[(p, u)] + bid.get((p, u), 0)
+
+        best = None
+        options = [[pair for pair in itertools.combinations(users[:4], 2) if not (p == 'paper2' and '~User2' in pair)] for p in papers]
+        for choice in itertools.product(*options):
+            loads = [u for pair in choice for u in pair]
+            if all(loads.count(u) <= 2 for u in users):
+                total = sum(score(p, u) for p, pair in zip(papers, choice) for u in pair)
+                best = total if best is None else max(best, total)
+        assert abs(preview['stats']['total_score'] - best) < 1e-6
+
+    def test_infeasible(self):
+        users = ['~User0', '~User1']
+        edges = [edge('Venue/Reviewers/-/Affinity_Score', f'paper{i}', u, weight=0.5) for i in range(3) for u in users]
+        preview = preview_assignments(FakeClient(edges, users), CONFIGURATION)
+        assert preview['status'] == 'Infeasible'
+        assert preview['assignments'] == {}
+
+        ## papers without enough candidates
+        edges.append(edge('Venue/Reviewers/-/Conflict', 'paper0', '~User0', weight=-1))
+        preview = preview_assignments(FakeClient(edges, users + ['~User2']), CONFIGURATION, paper_ids=['paper0'])
+        assert preview['status'] == 'Optimal'
+        preview = preview_assignments(FakeClient(edges, users + ['~User2']), dict(CONFIGURATION, user_demand='3'), paper_ids=['paper0'])
+        assert preview['status'] == 'Infeasible'
+        assert 'fewer candidates' in preview['message']
+
+    def test_infeasible_with_candidates(self):
+        users = ['~User0', '~User1', '~User2']
+        edges = [edge('Venue/Reviewers/-/Affinity_Score', f'paper{i}', u, weight=0.9 if u == '~User0' else 0.1) for i in range(2) for u in users]
+        configuration = dict(CONFIGURATION, user_demand='1', max_papers='1')
+
+        ## both papers only consider ~User0, who can review a single paper
+        preview = preview_assignments(FakeClient(edges, users), configuration, candidates_per_paper=1)
+        assert preview['status'] == 'InfeasibleWithCandidates'
+        assert 'candidates_per_paper' in preview['message']
+
+        preview = preview_assignments(FakeClient(edges, users), configuration, candidates_per_paper=3)
+        assert preview['status'] == 'Optimal'
@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import MagicMock
+import openreview
+from openreview.conflicts import ProfileInfoCache
+
+
+def profile(id, tmdate, domain):
+    return openreview.Profile(id=id, tmdate=tmdate, content={ 'emails': [f'user@{domain}'], 'history': [{ 'institution': { 'domain': domain } }], 'relations': [], 'publications': [] })
+
+
+class TestProfileInfoCache:
+
+    def test_computes_each_profile_once(self):
+        calls = []
+        def policy(profile, n_years=None):
+            calls.append(profile.id)
+            return openreview.tools.get_profile_info(profile, n_years)
+
+        cache = ProfileInfoCache(max_size=10)
+        info_function = openreview.tools.info_function_builder(policy, cache=cache)
+        author = profile('~Author_One1', 1, 'cs.umass.edu')
+
+        first = info_function(author, 3)
+        for _ in range(5):
+            assert info_function(author, 3) is first
+        assert calls == ['~Author_One1']
+        assert sorted(first['domains']) == ['cs.umass.edu', 'umass.edu']
+
+        ## different n_years or a modified profile are computed again
+        info_function(author, 5)
+        info_function(profile('~Author_One1', 2, 'mit.edu'), 3)
+        assert calls == ['~Author_One1'] * 3
+        assert cache.hits == 5 and cache.misses == 3
+
+    def test_lru_eviction(self):
+        cache = ProfileInfoCache(max_size=2)
+        info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info, cache=cache)
+        a, b, c = [profile(f'~User_{i}1', 1, 'mit.edu') for i in 'ABC']
+        info_function(a)
+        info_function(b)
+        info_function(a)
+        info_function(c)
+        assert len(cache) == 2
+        keys = list(cache.entries.keys())
+        assert keys == [ProfileInfoCache.key(a, openreview.tools.get_profile_info), ProfileInfoCache.key(c, openreview.tools.get_profile_info)]
+
+    def test_disk_backing(self, tmp_path):
+        path = str(tmp_path / 'profile_info.sqlite')
+        calls = []
+        def policy(profile, n_years=None):
+            calls.append(profile.id)
+            return openreview.tools.get_profile_info(profile, n_years)
+
+        with ProfileInfoCache(path=path) as cache:
+            info_function = openreview.tools.info_function_builder(policy, cache=cache)
+            expected = info_function(profile('~Author_One1', 1, 'cs.umass.edu'))
+            info_function(profile('~Author_Two1', None, 'mit.edu'))
+
+        with ProfileInfoCache(path=path) as cache:
+            info_function = openreview.tools.info_function_builder(policy, cache=cache)
+            info = info_function(profile('~Author_One1', 1, 'cs.umass.edu'))
+            assert sorted(info['domains']) == sorted(expected['domains'])
+            assert info['emails'] == expected['emails'] and isinstance(info['emails'], set)
+            ## profiles without tmdate are not persisted and changed profiles are computed again
+            info_function(profile('~Author_Two1', None, 'mit.edu'))
+            info_function(profile('~Author_One1', 2, 'cs.umass.edu'))
+
+        assert calls == ['~Author_One1', '~Author_Two1', '~Author_Two1', '~Author_One1']
+
+    def test_matching_flushes_the_cache(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'profile_info.sqlite')
+        cache = ProfileInfoCache(path=path)
+
+        matching = openreview.venue.matching.Matching.__new__(openreview.venue.matching.Matching)
+        matching.client = MagicMock()
+        matching.venue = MagicMock()
+        matching.match_group = openreview.api.Group(id='Venue/Reviewers')
+        matching.profile_info_cache = cache
+        matching.profile_store = None
+        matching.alternate_matching_group = None
+        matching._create_edge_invitation = MagicMock()
+
+        def get_profiles(*args, **kwargs):
+            raise openreview.OpenReviewException('Failed to load the author profiles')
+        monkeypatch.setattr(openreview.tools, 'get_profiles', get_profiles)
+
+        submission = openreview.api.Note(id='paper1', content={ 'authorids': { 'value': ['~Author_One1'] } })
+        with pytest.raises(openreview.OpenReviewException, match='author profiles'):
+            matching._build_conflicts([submission], [profile('~Reviewer_One1', 1, 'mit.edu')], openreview.tools.get_profile_info, None)
+
+        ## the info computed before the failure is in the file
+        assert cache.pending == {}
+        cache.close()
+        with ProfileInfoCache(path=path) as cache:
+            assert cache.connection.execute('SELECT COUNT(*) FROM profile_info').fetchone()[0] == 1
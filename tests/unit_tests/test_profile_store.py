@@ -0,0 +1,63 @@
+import time
+import openreview
+from openreview.profile_store import ProfileStore
+
+
+class FakeClient:
+
+    def __init__(self, note_class, notes_by_author):
+        self.note_class = note_class
+        self.notes_by_author = notes_by_author
+        self.calls = []
+
+    def get_all_notes(self, content, mintcdate=None):
+        author = content['authorids']
+        self.calls.append((author, mintcdate))
+        return [self.note_class.from_json(n) for n in self.notes_by_author.get(author, []) if mintcdate is None or n['tcdate'] >= mintcdate]
+
+
+def profile(id, tmdate):
+    return openreview.Profile(id=id, tmdate=tmdate, content={ 'names': [{ 'username': id }] })
+
+
+class TestProfileStore:
+
+    def test_incremental_publication_loads(self, tmp_path, capsys):
+        client_v1 = FakeClient(openreview.Note, { '~A1': [{ 'id': 'v1a', 'tcdate': 1000, 'pdate': 1000, 'content': {} }] })
+        client_v2 = FakeClient(openreview.api.Note, {
+            '~A1': [{ 'id': 'v2a', 'number': 5, 'tcdate': 2000, 'tmdate': 2500, 'domain': 'Venue', 'content': { 'title': { 'value': 'A' } } }],
+            '~B1': [{ 'id': 'v2b', 'tcdate': 3000, 'content': {} }]
+        })
+        path = str(tmp_path / 'profiles.sqlite')
+
+        with ProfileStore(path, overlap_ms=0) as store:
+            profiles = [profile('~A1', 10), profile('~B1', 20)]
+            store.load_publications(profiles, client_v1, client_v2)
+            assert 'Loading publications of' not in capsys.readouterr().out
+            assert [p.id for p in profiles[0].content['publications']] == ['v1a', 'v2a']
+            assert isinstance(profiles[0].content['publications'][0], openreview.Note)
+            assert profiles[0].content['publications'][1].content == { 'title': { 'value': 'A' } }
+            ## the fields that API v2 Note.to_json leaves out are stored too
+            stored = store.get_publications('~A1')[1]
+            assert (stored.number, stored.tcdate, stored.tmdate, stored.domain) == (5, 2000, 2500, 'Venue')
+            assert store.get_publications('~A1')[0].tcdate == 1000
+            assert [p.id for p in profiles[1].content['publications']] == ['v2b']
+            assert all(mintcdate is None for _, mintcdate in client_v1.calls + client_v2.calls)
+            first_load = store.get_load_plan(profiles)['~A1']
+
+        client_v1.calls, client_v2.calls = [], []
+        now = int(time.time() * 1000)
+        client_v2.notes_by_author['~A1'].append({ 'id': 'v2new', 'tcdate': now + 1000, 'content': {} })
+
+        with ProfileStore(path, overlap_ms=0) as store:
+            ## ~B1 changed its profile so its publications are loaded again completely
+            profiles = [profile('~A1', 10), profile('~B1', 21)]
+            capsys.readouterr()
+            store.load_publications(profiles, client_v1, client_v2, verbose=True)
+            assert '1 complete loads, 1 incremental loads' in capsys.readouterr().out
+            assert dict(client_v2.calls) == { '~A1': first_load, '~B1': None }
+            assert [p.id for p in profiles[0].content['publications']] == ['v1a', 'v2a', 'v2new']
+            assert [p.id for p in profiles[1].content['publications']] == ['v2b']
+
+        with ProfileStore(path, max_age_days=0) as store:
+            assert store.get_load_plan([profile('~A1', 10)], now + 1000) == { '~A1': None }
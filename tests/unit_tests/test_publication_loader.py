@@ -0,0 +1,59 @@
+import threading
+import time
+import pytest
+import openreview
+
+
+class FakeClient:
+
+    def __init__(self, prefix, delay):
+        self.prefix = prefix
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def get_all_notes(self, content, mintcdate=None):
+        with self.lock:
+            self.calls.append(content['authorids'])
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return [openreview.Note(id=f"{self.prefix}-{content['authorids']}", content={}, readers=[], writers=[], signatures=[], invitation=None)]
+
+
+class TestPublicationLoader:
+
+    def test_loads_both_versions_in_one_pool(self):
+        client_v1 = FakeClient('v1', 0.02)
+        client_v2 = FakeClient('v2', 0.01)
+        profiles = [openreview.Profile(id=f'~User_{i}1', content={}) for i in range(20)]
+        duplicate = openreview.Profile(id='~User_01', content={})
+
+        streamed = []
+        def on_loaded(profile, publications_by_version):
+            streamed.append(profile.id)
+            openreview.tools.PublicationLoader.set_publications(profile, publications_by_version)
+
+        loader = openreview.tools.PublicationLoader(client_v1, client_v2)
+        loader.load(profiles + [duplicate], on_loaded=on_loaded)
+
+        assert sorted(streamed) == sorted([p.id for p in profiles] + [duplicate.id])
+        assert sorted(client_v1.calls) == sorted(client_v2.calls) == sorted(p.id for p in profiles)
+        for profile in profiles + [duplicate]:
+            assert [n.id for n in profile.content['publications']] == [f'v1-{profile.id}', f'v2-{profile.id}']
+        assert client_v1.max_active > 1
+        assert loader.stats['profiles'] == 20 and loader.stats['requests'] == 40 and loader.stats['publications'] == 40
+
+    def test_errors_are_raised(self):
+        class FailingClient(FakeClient):
+            def get_all_notes(self, content, mintcdate=None):
+                raise openreview.OpenReviewException({ 'name': 'ForbiddenError', 'status': 403 })
+
+        loader = openreview.tools.PublicationLoader(FakeClient('v1', 0), FailingClient('v2', 0))
+        with pytest.raises(openreview.OpenReviewException) as e:
+            loader.load([openreview.Profile(id='~User_A1', content={})])
+        assert e.value.args[0]['status'] == 403
@@ -0,0 +1,57 @@
+import random
+import string
+import threading
+import pytest
+import openreview
+
+
+class FakeObject:
+    def __init__(self, id):
+        self.id = id
+
+
+class FakeEndpoint:
+
+    def __init__(self, total):
+        random.seed(total)
+        self.ids = sorted(set(''.join(random.choices(string.ascii_letters + string.digits + '_-', k=10)) for _ in range(total)))
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get(self, after=None, offset=None, limit=1000, sort=None, with_count=None, invitation=None):
+        assert sort == 'id'
+        with self.lock:
+            self.calls += 1
+        start = 0
+        if after is not None:
+            start = len([i for i in self.ids if i <= after])
+        if offset is not None:
+            start = offset
+        docs = [FakeObject(i) for i in self.ids[start:start + limit]]
+        if with_count and offset is None:
+            return docs, len(self.ids)
+        return docs
+
+
+class TestShardedGet:
+
+    def test_same_result_as_sequential(self):
+        for total in [0, 1, 999, 1000, 1001, 4321]:
+            for shards in [1, 3, 8]:
+                endpoint = FakeEndpoint(total)
+                sequential = [o.id for o in openreview.tools.efficient_iterget(endpoint.get, invitation='Venue/-/Submission', limit=100)]
+                sharded = [o.id for o in openreview.tools.sharded_get(endpoint.get, shards=shards, invitation='Venue/-/Submission', limit=100)]
+                assert sharded == sequential == endpoint.ids
+
+    def test_shards_do_not_overfetch(self):
+        endpoint = FakeEndpoint(10000)
+        docs = openreview.tools.sharded_get(endpoint.get, shards=4, limit=1000)
+        assert len(docs) == 10000
+        ## count + 3 boundaries + at most 2 extra pages per shard
+        assert endpoint.calls <= 1 + 3 + 10 + 2 * 4
+
+    def test_other_sorts_are_rejected(self):
+        endpoint = FakeEndpoint(10)
+        with pytest.raises(openreview.OpenReviewException, match='only with the id order'):
+            openreview.tools.sharded_get(endpoint.get, shards=4, sort='number:asc')
+        assert endpoint.calls == 0
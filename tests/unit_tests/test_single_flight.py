@@ -0,0 +1,97 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openreview
+
+
+class Handler(BaseHTTPRequestHandler):
+    calls = []
+
+    def do_GET(self):
+        Handler.calls.append(self.path)
+        time.sleep(0.2)
+        body = json.dumps({ 'groups': [{ 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1'] }] }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        Handler.calls.append('POST ' + self.path)
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSingleFlight:
+
+    def setup_method(self):
+        Handler.calls = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = openreview.api.OpenReviewClient(baseurl=f'http://127.0.0.1:{self.server.server_address[1]}')
+        self.client.session.enabled = True
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_identical_gets_are_coalesced(self):
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            groups = list(executor.map(lambda i: self.client.get_group('Venue/Reviewers'), range(20)))
+
+        assert len(Handler.calls) == 1
+        assert self.client.session.coalesced == 19
+        assert all(g.members == ['~Reviewer_One1'] for g in groups)
+        ## every caller gets its own objects
+        groups[0].members.append('~Reviewer_Two1')
+        assert groups[1].members == ['~Reviewer_One1']
+
+    def test_waiters_get_their_own_response(self):
+        url = self.client.baseurl + '/groups'
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(lambda i: self.client.session.get(url, params={ 'id': 'Venue/Reviewers' }, headers=self.client.headers), range(5)))
+
+        assert len(Handler.calls) == 1
+        assert len(set(id(r) for r in responses)) == 5
+        assert len(set(id(r.headers) for r in responses)) == 5
+        responses[0].headers['Content-Type'] = 'text/plain'
+        responses[0].status_code = 500
+        assert all(r.status_code == 200 and r.headers['Content-Type'] == 'application/json' for r in responses[1:])
+        assert all(r.json() == responses[0].json() for r in responses)
+
+    def test_disabled_by_default(self):
+        assert openreview.api.OpenReviewClient(baseurl=self.client.baseurl).session.enabled is False
+
+    def test_different_gets_are_not_coalesced(self):
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(lambda i: self.client.get_group(f'Venue/Submission{i}/Reviewers'), range(5)))
+
+        assert len(Handler.calls) == 5
+
+    def test_get_after_write_does_not_join_earlier_call(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(self.client.get_group, 'Venue/Reviewers')
+            time.sleep(0.05)
+            self.client.session.post(self.client.baseurl + '/groups/edits', json={}, headers=self.client.headers)
+            second = executor.submit(self.client.get_group, 'Venue/Reviewers')
+            first.result()
+            second.result()
+
+        assert len([c for c in Handler.calls if not c.startswith('POST')]) == 2
+
+    def test_disabled(self):
+        self.client.session.enabled = False
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda i: self.client.get_group('Venue/Reviewers'), range(3)))
+
+        assert len(Handler.calls) == 3
@@ -0,0 +1,81 @@
+import openreview
+from openreview.api import Edge, Tag
+
+
+class FakeClient:
+
+    def __init__(self, edges=None, tags=None):
+        self.edges = { e['id']: e for e in edges or [] }
+        self.tags = { t['id']: t for t in tags or [] }
+        self.posted = []
+
+    def get_all_edges(self, invitation, raw=False, head=None):
+        return [dict(e) for e in self.edges.values() if e['invitation'] == invitation and (head is None or e['head'] == head)]
+
+    def get_all_tags(self, invitation, raw=False):
+        return [dict(t) for t in self.tags.values() if t['invitation'] == invitation]
+
+    def apply(self, store, items):
+        self.posted.extend(items)
+        for item in items:
+            if item.ddate:
+                store.pop(item.id)
+            else:
+                item.id = item.id or 'new-{}'.format(len(self.posted))
+                store[item.id] = item.to_json()
+        return items
+
+    def post_edges(self, edges):
+        return self.apply(self.edges, edges)
+
+    def post_tags(self, tags):
+        return self.apply(self.tags, tags)
+
+
+def edge(head, tail, weight, id=None, readers=None):
+    return Edge(id=id, invitation='Venue/-/Score', head=head, tail=tail, weight=weight, readers=readers or ['Venue'], writers=['Venue'], signatures=['Venue'])
+
+
+class TestSyncEdges:
+
+    def test_sync_edges(self):
+        client = FakeClient(edges=[e.to_json() for e in [edge('p1', '~A1', 0.5, 'e1'), edge('p1', '~B1', 0.2, 'e2'), edge('p2', '~A1', 0.1, 'e3'), edge('p2', '~A1', 0.1, 'e4')]])
+
+        changes = openreview.tools.sync_edges(client, 'Venue/-/Score', [edge('p1', '~A1', 0.5), edge('p1', '~B1', 0.3), edge('p3', '~A1', 0.9)])
+        assert changes == { 'added': 1, 'updated': 1, 'deleted': 2, 'unchanged': 1 }
+        assert sorted((e['head'], e['tail'], e['weight']) for e in client.edges.values()) == [('p1', '~A1', 0.5), ('p1', '~B1', 0.3), ('p3', '~A1', 0.9)]
+        assert client.edges['e2']['weight'] == 0.3
+
+        client.posted = []
+        changes = openreview.tools.sync_edges(client, 'Venue/-/Score', [edge('p1', '~A1', 0.5), edge('p1', '~B1', 0.3), edge('p3', '~A1', 0.9)])
+        assert changes['unchanged'] == 3 and client.posted == []
+
+        ## readers are compared too, and only the edges of the head are synced
+        changes = openreview.tools.sync_edges(client, 'Venue/-/Score', [edge('p1', '~A1', 0.5, readers=['Venue', '~A1'])], head='p1')
+        assert changes == { 'added': 0, 'updated': 1, 'deleted': 1, 'unchanged': 0 }
+        assert sorted((e['head'], e['tail']) for e in client.edges.values()) == [('p1', '~A1'), ('p3', '~A1')]
+
+    def test_duplicated_desired_edges(self):
+        client = FakeClient(edges=[edge('p1', '~A1', 0.5, 'e1').to_json()])
+
+        ## the last desired edge of a key wins and each key is posted once
+        changes = openreview.tools.sync_edges(client, 'Venue/-/Score', [edge('p1', '~A1', 0.1), edge('p2', '~A1', 0.2), edge('p1', '~A1', 0.7), edge('p2', '~A1', 0.4)])
+        assert changes == { 'added': 1, 'updated': 1, 'deleted': 0, 'unchanged': 0 }
+        assert len(client.posted) == 2
+        assert sorted((e['head'], e['tail'], e['weight']) for e in client.edges.values()) == [('p1', '~A1', 0.7), ('p2', '~A1', 0.4)]
+        assert client.edges['e1']['weight'] == 0.7
+
+    def test_keep_missing_and_current_edges(self):
+        client = FakeClient()
+        current = [edge('Venue/Reviewers', '~A1', 3, 'e1')]
+        changes = openreview.tools.sync_edges(client, 'Venue/-/Score', [edge('Venue/Reviewers', '~B1', 2)], delete_missing=False, current_edges=current)
+        assert changes == { 'added': 1, 'updated': 0, 'deleted': 0, 'unchanged': 0 }
+
+    def test_sync_tags(self):
+        def tag(profile, weight, id=None):
+            return Tag(id=id, invitation='Venue/Reviewers/-/Review_Count', profile=profile, weight=weight, readers=['Venue', profile], writers=['Venue'], nonreaders=[])
+
+        client = FakeClient(tags=[tag('~A1', 1, 't1').to_json(), tag('~B1', 2, 't2').to_json()])
+        changes = openreview.tools.sync_tags(client, 'Venue/Reviewers/-/Review_Count', [tag('~A1', 1), tag('~B1', 3), tag('~C1', 0)], key=('profile',))
+        assert changes == { 'added': 1, 'updated': 1, 'deleted': 0, 'unchanged': 1 }
+        assert len(client.posted) == 2